@@ -16,12 +16,26 @@ load_dotenv()
 
 # Import the framework
 import framework_hexagonal as fh
+from framework_hexagonal.adapters.outbound.composite_text import (
+    CompositeTextAIAdapter,
+    TextAIBackend,
+)
+from framework_hexagonal.adapters.outbound.instrumented_text import InstrumentedTextAIAdapter
 from framework_hexagonal.adapters.outbound.openai_text import OpenAITextAdapter
+from framework_hexagonal.adapters.outbound.text_ai_cache import CachedTextAIAdapter
 from framework_hexagonal.adapters.outbound.openai_image import OpenAIImageAdapter
 from framework_hexagonal.adapters.outbound.tavily_search import TavilySearchAdapter
-from framework_hexagonal.adapters.outbound.httpx_fetcher import HttpxWebFetcherAdapter
+from framework_hexagonal.adapters.outbound.httpx_fetcher import (
+    HTML_CONTENT_TYPES,
+    HttpxWebFetcherAdapter,
+)
 from framework_hexagonal.adapters.outbound.playwright_screenshot import PlaywrightScreenshotterAdapter
+from framework_hexagonal.adapters.outbound.screenshot_cache import CachedScreenshotterAdapter
 from framework_hexagonal.adapters.outbound.sqlalchemy_db import SQLAlchemyDBAdapter
+from framework_hexagonal.adapters.outbound.local_artifact_store import LocalArtifactStoreAdapter
+from framework_hexagonal.utils.conversation import ConversationWindow
+from framework_hexagonal.utils.metrics import add_metrics_route
+from framework_hexagonal.utils.rate_limit import RateLimiter
 from framework_hexagonal.utils.streaming import get_streaming_html, get_streaming_js
 
 # Create FastAPI app
@@ -37,14 +51,17 @@ templates = Jinja2Templates(directory="application/templates")
 # Create necessary directories
 os.makedirs("application/templates", exist_ok=True)
 os.makedirs("application/static", exist_ok=True)
-os.makedirs("application/static/screenshots", exist_ok=True)
 os.makedirs("application/static/images", exist_ok=True)
 
 # Serve static files
 app.mount("/static", StaticFiles(directory="application/static"), name="static")
 
-# Chat history to store messages
-chat_history = []
+# Serve Prometheus metrics
+add_metrics_route(app)
+
+# Chat history; each request sends the most recent turns that fit the
+# token budget, with older turns summarized in the background
+conversation = ConversationWindow(max_tokens=int(os.environ.get("CHAT_CONTEXT_TOKENS", 8000)))
 search_results = []
 fetch_results = []
 image_results = []
@@ -54,14 +71,52 @@ screenshot_results = []
 @app.on_event("startup")
 async def startup_event():
     """Register adapters on startup."""
-    # Register OpenAI text adapter
+    # Adapters registered with coalesce share one execution among identical
+    # concurrent calls; streams are only shared when named, and byte streams
+    # (WebFetcher.iter_chunks, fetch_many) never are
+    
+    # Register OpenAI text adapter behind a response cache; repeated
+    # analyses are replayed, sampled chat bypasses the cache. Requests queue
+    # for the account's rate limits (chat ahead of analysis). Each backend
+    # records time to first token, chunk gaps and throughput, served at /metrics
+    text_backends = [
+        TextAIBackend(
+            "openai",
+            InstrumentedTextAIAdapter(
+                OpenAITextAdapter(
+                    api_key=os.environ.get("OPENAI_API_KEY"),
+                    default_model="gpt-4o",
+                    rate_limiter=RateLimiter(
+                        requests_per_minute=float(os.environ.get("OPENAI_RPM", 500)),
+                        tokens_per_minute=float(os.environ.get("OPENAI_TPM", 30000)),
+                    ),
+                ),
+            ),
+        ),
+    ]
+    # An optional OpenAI-compatible server (e.g. a local model) takes hedged
+    # requests when OpenAI is slow and the traffic when it is down
+    if os.environ.get("LOCAL_LLM_BASE_URL"):
+        text_backends.append(
+            TextAIBackend(
+                "local",
+                InstrumentedTextAIAdapter(
+                    OpenAITextAdapter(
+                        api_key=os.environ.get("LOCAL_LLM_API_KEY", "local"),
+                        base_url=os.environ["LOCAL_LLM_BASE_URL"],
+                        default_model=os.environ.get("LOCAL_LLM_MODEL", "llama3"),
+                    ),
+                ),
+                model=os.environ.get("LOCAL_LLM_MODEL", "llama3"),
+            )
+        )
     fh.container.register(
         fh.TextAI,
-        OpenAITextAdapter(
-            api_key=os.environ.get("OPENAI_API_KEY"),
-            default_model="gpt-4o",
-        ),
+        CachedTextAIAdapter(CompositeTextAIAdapter(text_backends)),
+        coalesce=("chat", "analyze"),
     )
+    # Turns that fall out of the chat window are summarized with the same TextAI
+    conversation.summarizer = fh.container.get(fh.TextAI)
     
     # Register OpenAI image adapter
     fh.container.register(
@@ -69,6 +124,10 @@ async def startup_event():
         OpenAIImageAdapter(
             api_key=os.environ.get("OPENAI_API_KEY"),
             default_model="dall-e-3",
+            rate_limiter=RateLimiter(
+                requests_per_minute=float(os.environ.get("OPENAI_IMAGES_PER_MINUTE", 5)),
+                concurrency=2,
+            ),
         ),
     )
     
@@ -78,19 +137,28 @@ async def startup_event():
         TavilySearchAdapter(
             api_key=os.environ.get("TAVILY_API_KEY"),
         ),
+        coalesce=True,
     )
     
     # Register HTTPX web fetcher adapter
     fh.container.register(
         fh.WebFetcher,
-        HttpxWebFetcherAdapter(),
+        HttpxWebFetcherAdapter(
+            executor="process",
+            max_bytes=10 * 1024 * 1024,
+            allowed_content_types=HTML_CONTENT_TYPES,
+        ),
+        coalesce=("fetch",),
     )
     
-    # Register Playwright screenshotter adapter
+    # Register Playwright screenshotter adapter behind a screenshot cache;
+    # the browser is launched and supervised from startup
     fh.container.register(
         fh.Screenshotter,
-        PlaywrightScreenshotterAdapter(),
+        CachedScreenshotterAdapter(PlaywrightScreenshotterAdapter()),
+        coalesce=True,
     )
+    await fh.container.get(fh.Screenshotter).start()
     
     # Register SQLAlchemy DB adapter
     fh.container.register(
@@ -99,6 +167,27 @@ async def startup_event():
             connection_url=os.environ.get("DATABASE_URL", "sqlite:///./test.db"),
         ),
     )
+    
+    # Register local artifact store for screenshots served under /static/screenshots;
+    # screenshots are kept for a day and the store is capped at 512 MB
+    fh.container.register(
+        fh.ArtifactStore,
+        LocalArtifactStoreAdapter(
+            "application/static/screenshots",
+            base_url="/static/screenshots",
+            max_age=24 * 3600,
+            max_bytes=512 * 1024 * 1024,
+        ),
+    )
+    await fh.container.get(fh.ArtifactStore).start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled adapter resources on shutdown."""
+    await fh.container.get(fh.WebFetcher).aclose()
+    await fh.container.get(fh.Screenshotter).close()
+    await fh.container.get(fh.ArtifactStore).close()
+    await conversation.close()
 
 # Dependency to get adapters
 def get_text_ai():
@@ -125,6 +214,10 @@ def get_db_gateway():
     """Get DBGateway adapter from container."""
     return fh.container.get(fh.DBGateway)
 
+def get_artifact_store():
+    """Get ArtifactStore adapter from container."""
+    return fh.container.get(fh.ArtifactStore)
+
 # Main page route
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request, error: str = None):
@@ -133,7 +226,7 @@ async def home(request: Request, error: str = None):
         "index.html",
         {
             "request": request,
-            "chat_history": chat_history,
+            "chat_history": conversation.history,
             "search_results": search_results,
             "fetch_results": fetch_results,
             "image_results": image_results,
@@ -153,17 +246,17 @@ async def chat(
 ):
     """Handle chat requests."""
     # Add user message to history
-    chat_history.append({"role": "user", "content": message})
+    conversation.add("user", message)
     
     # Generate AI response
-    messages = [{"role": m["role"], "content": m["content"]} for m in chat_history]
+    messages = conversation.build()
     
     full_response = ""
     async for chunk in text_ai.chat(messages=messages):
         full_response += chunk
     
     # Add AI response to history
-    chat_history.append({"role": "assistant", "content": full_response})
+    conversation.add("assistant", full_response)
     
     # Redirect back to main page
     return RedirectResponse(url="/", status_code=303)
@@ -176,10 +269,10 @@ async def chat_stream(
 ):
     """Stream chat responses."""
     # Add user message to history
-    chat_history.append({"role": "user", "content": message})
+    conversation.add("user", message)
     
     # Generate AI response
-    messages = [{"role": m["role"], "content": m["content"]} for m in chat_history]
+    messages = conversation.build()
     
     async def generate():
         full_response = ""
@@ -188,7 +281,7 @@ async def chat_stream(
             yield chunk
         
         # Add the complete response to history after generation
-        chat_history.append({"role": "assistant", "content": full_response})
+        conversation.add("assistant", full_response)
     
     return fh.stream_response(generate())
 
@@ -204,8 +297,8 @@ async def analyze(
     result = await text_ai.analyze(text=text, prompt=prompt)
     
     # Add to chat history
-    chat_history.append({"role": "user", "content": f"Analyze: {text}\nPrompt: {prompt}"})
-    chat_history.append({"role": "assistant", "content": result})
+    conversation.add("user", f"Analyze: {text}\nPrompt: {prompt}")
+    conversation.add("assistant", result)
     
     # Redirect back to main page
     return RedirectResponse(url="/", status_code=303)
@@ -263,17 +356,12 @@ async def fetch(
     web_fetcher: fh.WebFetcher = Depends(get_web_fetcher),
 ):
     """Fetch web content."""
-    # Don't pass the selector to fetch if it's None/empty
     if selector:
-        content = await web_fetcher.fetch(url=url, selector=selector)
+        content_str = await web_fetcher.get_text(url=url, selector=selector)
     else:
-        content = await web_fetcher.fetch(url=url)
-    
-    # Convert to string if content is a tuple
-    if isinstance(content, tuple):
-        content_str = str(content)
-    else:
-        content_str = content
+        # Only the raw HTML is displayed, so skip parsing entirely
+        page = await web_fetcher.fetch(url=url, parse=False)
+        content_str = page.html
     
     # Store fetch result
     fetch_results.clear()
@@ -292,57 +380,29 @@ async def screenshot(
     request: Request,
     url: str = Form(...),
     screenshotter: fh.Screenshotter = Depends(get_screenshotter),
+    artifact_store: fh.ArtifactStore = Depends(get_artifact_store),
 ):
     """Take a screenshot of a webpage."""
-    # Generate a unique filename
-    filename = f"screenshot_{len(screenshot_results)}.png"
-    filepath = f"application/static/screenshots/{filename}"
-    
     try:
-        # Take screenshot with limited height to prevent errors
-        # Use full_page=False for potentially very long pages
-        # The viewport height is already set to 800 by default
+        # Full page capture; tall pages are captured in tiles and stitched
         screenshot_bytes = await screenshotter.capture(
             url=url, 
             full_page=True,
-            # Add error handling for very tall pages
             timeout=30.0
         )
         
-        # Save screenshot
-        with open(filepath, "wb") as f:
-            f.write(screenshot_bytes)
+        # Save screenshot (named by content hash, written off the event loop)
+        artifact = await artifact_store.put(screenshot_bytes, extension="png")
         
         # Add to screenshot results
         screenshot_results.append({
             "url": url,
-            "filename": filename,
-            "path": f"/static/screenshots/{filename}"
+            "filename": artifact.key,
+            "path": artifact.url
         })
         
     except Exception as e:
-        # If full page screenshot fails, try with full_page=False
-        try:
-            screenshot_bytes = await screenshotter.capture(
-                url=url, 
-                full_page=False,
-                timeout=30.0
-            )
-            
-            # Save screenshot
-            with open(filepath, "wb") as f:
-                f.write(screenshot_bytes)
-            
-            # Add to screenshot results with note about viewport-only
-            screenshot_results.append({
-                "url": url,
-                "filename": filename,
-                "path": f"/static/screenshots/{filename}",
-                "note": "Viewport only (page too large for full screenshot)"
-            })
-        except Exception as e2:
-            # Both attempts failed
-            return RedirectResponse(url=f"/?error=Screenshot+failed:+{str(e2)}", status_code=303)
+        return RedirectResponse(url=f"/?error=Screenshot+failed:+{str(e)}", status_code=303)
     
     # Redirect back to main page
     return RedirectResponse(url="/", status_code=303)
@@ -351,7 +411,7 @@ async def screenshot(
 @app.post("/clear")
 async def clear_history():
     """Clear all history."""
-    chat_history.clear()
+    conversation.clear()
     search_results.clear()
     fetch_results.clear()
     image_results.clear()
@@ -360,6 +420,12 @@ async def clear_history():
     # Redirect back to main page
     return RedirectResponse(url="/", status_code=303)
 
+# Text AI backend health route
+@app.get("/text-ai/backends")
+async def text_ai_backends(text_ai: fh.TextAI = Depends(get_text_ai)):
+    """Health and latency of each Text AI backend."""
+    return {name: stats.as_dict() for name, stats in text_ai.backend_stats.items()}
+
 # Run the application
 if __name__ == "__main__":
     uvicorn.run("application.main:app", host="127.0.0.1", port=8000, reload=True) 
\ No newline at end of file
@@ -8,12 +8,15 @@ the Ports and Adapters / Hexagonal Architecture pattern.
 from .core.container import container
 from .core.ports import (
     TextAI,
+    Embeddings,
     ImageAI,
     WebSearch,
     SearchResult,
     WebFetcher,
     FetchedPage,
     Screenshotter,
+    ImageProcessor,
+    ArtifactStore,
     DBGateway,
 )
 from .core.domain import (
@@ -35,12 +38,15 @@ __all__ = [
     
     # Ports
     "TextAI",
+    "Embeddings",
     "ImageAI",
     "WebSearch",
     "SearchResult",
     "WebFetcher",
     "FetchedPage",
     "Screenshotter",
+    "ImageProcessor",
+    "ArtifactStore",
     "DBGateway",
     
     # Domain
@@ -0,0 +1,505 @@
+"""Composite TextAI that load-balances, hedges and fails over across backends."""
+import asyncio
+import math
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from ...core.ports.text_ai import TextAI
+from ...utils.circuit_breaker import CircuitBreaker
+
+T = TypeVar('T')
+
+# Calls measured separately: chat by time to first chunk, analyze by total time
+METHODS = ("chat", "analyze")
+
+# 4xx statuses worth retrying elsewhere: request timeout, conflict, rate limit
+RETRYABLE_CLIENT_STATUSES = (408, 409, 429)
+
+
+def is_client_error(error: BaseException) -> bool:
+    """
+    Whether an error is the request's fault rather than the backend's.
+
+    Works with OpenAI SDK errors and ``httpx.HTTPStatusError`` alike: any
+    4xx other than a timeout, conflict or rate limit (e.g. an invalid
+    parameter or an exceeded context length) would fail on every backend.
+
+    Args:
+        error: Exception raised by a backend
+
+    Returns:
+        True for non-retryable 4xx responses
+    """
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    return (
+        isinstance(status, int)
+        and 400 <= status < 500
+        and status not in RETRYABLE_CLIENT_STATUSES
+    )
+
+
+@dataclass
+class TextAIBackend:
+    """One backend of a CompositeTextAIAdapter."""
+
+    name: str
+    text_ai: TextAI
+    # Replaces the caller's model for this backend (e.g. a local model name)
+    model: Optional[str] = None
+
+
+@dataclass
+class BackendStats:
+    """Health and latency of one backend."""
+
+    name: str
+    state: str
+    in_flight: int
+    requests: int
+    failures: int
+    hedges: int
+    hedge_wins: int
+    cancelled: int
+    chat_p50: Optional[float]
+    chat_p95: Optional[float]
+    analyze_p50: Optional[float]
+    analyze_p95: Optional[float]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the stats as a dict."""
+        return asdict(self)
+
+
+class _LatencyWindow:
+    """Recent latencies of one call type, with an EWMA for routing."""
+
+    def __init__(self, size: int, alpha: float = 0.2):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.alpha = alpha
+        self.ewma: Optional[float] = None
+
+    def add(self, latency: float) -> None:
+        self.samples.append(latency)
+        self._update(latency)
+
+    def censor(self, lower_bound: float) -> None:
+        """
+        Account for a cancelled call known to take at least ``lower_bound``.
+
+        The bound is not a sample, so it stays out of the quantiles and
+        can only raise the routing estimate.
+        """
+        estimate = max(lower_bound, self.quantile(0.95) or 0.0)
+        if self.ewma is None or estimate > self.ewma:
+            self._update(estimate)
+
+    def _update(self, latency: float) -> None:
+        if self.ewma is None:
+            self.ewma = latency
+        else:
+            self.ewma = self.alpha * latency + (1 - self.alpha) * self.ewma
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class _Backend:
+    def __init__(self, config: TextAIBackend, breaker: CircuitBreaker, window: int):
+        self.config = config
+        self.breaker = breaker
+        self.latency = {method: _LatencyWindow(window) for method in METHODS}
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.cancelled = 0
+
+    @property
+    def name(self) -> str:
+        return self.config.name
+
+    def stats(self) -> BackendStats:
+        chat, analyze = self.latency["chat"], self.latency["analyze"]
+        return BackendStats(
+            name=self.name,
+            state=self.breaker.state,
+            in_flight=self.in_flight,
+            requests=self.requests,
+            failures=self.failures,
+            hedges=self.hedges,
+            hedge_wins=self.hedge_wins,
+            cancelled=self.cancelled,
+            chat_p50=chat.quantile(0.5),
+            chat_p95=chat.quantile(0.95),
+            analyze_p50=analyze.quantile(0.5),
+            analyze_p95=analyze.quantile(0.95),
+        )
+
+
+@dataclass
+class _Attempt:
+    backend: _Backend
+    task: "asyncio.Task[Any]"
+    started: float
+    hedge: bool
+
+
+class _StreamStart:
+    """A chat stream that has produced its first chunk (or ended without one)."""
+
+    def __init__(self, stream: AsyncGenerator[str, None], first: Optional[str], ended: bool):
+        self.stream = stream
+        self.first = first
+        self.ended = ended
+
+
+class CompositeTextAIAdapter:
+    """
+    TextAI spread over several backends with hedging and failover.
+
+    Each call goes to the available backend with the lowest expected
+    latency (recent average times one plus its calls in flight; backends
+    without samples are tried first). If it has not answered within its
+    ``hedge_quantile`` latency (p95 by default), the same call is sent to
+    the next backend and the first answer wins; the other call is
+    cancelled. ``chat`` races on the first chunk and then streams from the
+    winner only. A failed call fails over to the next backend, and each
+    backend has a circuit breaker that takes it out of rotation after
+    ``failure_threshold`` consecutive failures. Client errors (see
+    ``is_client_error``) are raised at once without failover, and do not
+    count against the backend. Errors after a stream has started are
+    raised, since chunks were already delivered.
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[Union[TextAI, TextAIBackend]],
+        hedge: bool = True,
+        hedge_quantile: float = 0.95,
+        initial_hedge_delay: float = 2.0,
+        min_hedge_delay: float = 0.05,
+        max_hedge_delay: float = 30.0,
+        min_samples: int = 20,
+        max_hedges: int = 1,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        latency_window: int = 200,
+        client_error: Callable[[BaseException], bool] = is_client_error,
+    ):
+        """
+        Initialize the composite adapter.
+
+        Args:
+            backends: TextAI adapters, optionally as TextAIBackend to set a
+                name and model; plain adapters are named after their
+                ``default_model``
+            hedge: Send a duplicate call when the first is slow
+            hedge_quantile: Latency quantile of a backend after which a hedge is sent
+            initial_hedge_delay: Hedge delay until a backend has ``min_samples`` latencies
+            min_hedge_delay: Lower bound of the hedge delay in seconds
+            max_hedge_delay: Upper bound of the hedge delay in seconds
+            min_samples: Latencies needed before the quantile is trusted
+            max_hedges: Maximum duplicate calls per request
+            failure_threshold: Consecutive failures that open a backend's circuit
+            reset_timeout: Seconds before an open circuit allows a trial call
+            latency_window: Recent latencies kept per backend and method
+            client_error: Predicate for errors caused by the request itself,
+                raised without failover
+
+        Raises:
+            ValueError: If no backends are given or names repeat
+        """
+        if not backends:
+            raise ValueError("At least one backend is required")
+        configs = []
+        for index, backend in enumerate(backends):
+            if not isinstance(backend, TextAIBackend):
+                name = getattr(backend, "default_model", None) or f"backend-{index}"
+                backend = TextAIBackend(name=name, text_ai=backend)
+            configs.append(backend)
+        names = [config.name for config in configs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Backend names must be unique: {names}")
+
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.min_samples = min_samples
+        self.max_hedges = max_hedges
+        self.client_error = client_error
+        self._backends = [
+            _Backend(config, CircuitBreaker(failure_threshold, reset_timeout), latency_window)
+            for config in configs
+        ]
+
+    @property
+    def default_model(self) -> Optional[str]:
+        """Model of the first backend, used e.g. in cache keys."""
+        first = self._backends[0].config
+        return first.model or getattr(first.text_ai, "default_model", None)
+
+    @property
+    def backend_stats(self) -> Dict[str, BackendStats]:
+        """Health and latency per backend, by name."""
+        return {backend.name: backend.stats() for backend in self._backends}
+
+    def hedge_delay(self, backend: _Backend, method: str) -> float:
+        """Seconds to wait for ``backend`` before sending a hedged call."""
+        window = backend.latency[method]
+        if len(window.samples) < self.min_samples:
+            return self.initial_hedge_delay
+        delay = window.quantile(self.hedge_quantile)
+        if delay is None:
+            return self.initial_hedge_delay
+        return min(max(delay, self.min_hedge_delay), self.max_hedge_delay)
+
+    def _ranked(self, method: str) -> List[_Backend]:
+        def score(backend: _Backend) -> float:
+            ewma = backend.latency[method].ewma
+            return 0.0 if ewma is None else ewma * (1 + backend.in_flight)
+
+        # sorted() is stable, so ties keep the configured order
+        return sorted((b for b in self._backends if b.breaker.available()), key=score)
+
+    @staticmethod
+    def _release(backend: _Backend) -> None:
+        backend.in_flight -= 1
+
+    def _failed(self, backend: _Backend) -> None:
+        backend.failures += 1
+        backend.breaker.record_failure()
+
+    async def _race(
+        self,
+        method: str,
+        call: Callable[[_Backend], Awaitable[T]],
+        discard: Optional[Callable[[T], Awaitable[None]]] = None,
+    ) -> Tuple[_Backend, T]:
+        """
+        Run ``call`` on the best backend, hedging and failing over.
+
+        Returns:
+            The winning backend, still counted in flight, and its result
+
+        Raises:
+            RuntimeError: If every backend's circuit is open
+            Exception: A client error as soon as it is raised, or the last
+                backend error if every attempt failed
+        """
+        loop = asyncio.get_running_loop()
+        candidates = self._ranked(method)
+        attempts: List[_Attempt] = []
+        last_error: Optional[BaseException] = None
+        hedges = 0
+
+        def launch(hedge: bool) -> bool:
+            while candidates:
+                backend = candidates.pop(0)
+                if not backend.breaker.allow():
+                    continue
+                backend.in_flight += 1
+                backend.requests += 1
+                if hedge:
+                    backend.hedges += 1
+                task = asyncio.ensure_future(call(backend))
+                attempts.append(_Attempt(backend, task, loop.time(), hedge))
+                return True
+            return False
+
+        if not launch(hedge=False):
+            raise RuntimeError("No TextAI backend available: every circuit is open")
+
+        winner: Optional[_Attempt] = None
+        try:
+            while attempts:
+                timeout = None
+                if self.hedge and hedges < self.max_hedges and candidates:
+                    latest = attempts[-1]
+                    hedge_at = latest.started + self.hedge_delay(latest.backend, method)
+                    timeout = max(0.0, hedge_at - loop.time())
+                done, _ = await asyncio.wait(
+                    [attempt.task for attempt in attempts],
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    if launch(hedge=True):
+                        hedges += 1
+                    continue
+                for attempt in [a for a in attempts if a.task in done]:
+                    error = attempt.task.exception()
+                    if error is None:
+                        winner = attempt
+                        break
+                    attempts.remove(attempt)
+                    self._release(attempt.backend)
+                    if self.client_error(error):
+                        # Every backend would reject the request
+                        attempt.backend.breaker.release()
+                        raise error
+                    self._failed(attempt.backend)
+                    last_error = error
+                if winner is not None:
+                    break
+                if not attempts:
+                    # Fail over
+                    launch(hedge=False)
+        finally:
+            winner_latency = None if winner is None else loop.time() - winner.started
+            losers = [a for a in attempts if a is not winner]
+            await self._cancel(method, losers, discard, winner_latency)
+
+        if winner is None or winner_latency is None:
+            if last_error is None:
+                raise RuntimeError("No TextAI backend available: every circuit is open")
+            raise last_error
+        backend = winner.backend
+        backend.breaker.record_success()
+        backend.latency[method].add(winner_latency)
+        if winner.hedge:
+            backend.hedge_wins += 1
+        return backend, winner.task.result()
+
+    async def _cancel(
+        self,
+        method: str,
+        losers: List[_Attempt],
+        discard: Optional[Callable[[Any], Awaitable[None]]],
+        winner_latency: Optional[float],
+    ) -> None:
+        now = asyncio.get_running_loop().time()
+        for attempt in losers:
+            attempt.task.cancel()
+        for attempt in losers:
+            backend = attempt.backend
+            self._release(backend)
+            try:
+                result = await attempt.task
+            except asyncio.CancelledError:
+                backend.cancelled += 1
+                backend.breaker.release()
+                if winner_latency is not None:
+                    # A loser is taken to be no faster than the winner, so a
+                    # backend that always loses does not look unmeasured and
+                    # get routed to first
+                    backend.latency[method].censor(max(now - attempt.started, winner_latency))
+            except Exception as e:
+                if self.client_error(e):
+                    backend.breaker.release()
+                else:
+                    self._failed(backend)
+            else:
+                # Finished in the same tick as the winner
+                backend.breaker.record_success()
+                if discard is not None:
+                    await discard(result)
+
+    async def chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Generate streaming chat responses from the fastest backend.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            model: Optional model identifier (a backend's own model takes precedence)
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            Text chunks as they are generated
+        """
+        async def start(backend: _Backend) -> _StreamStart:
+            # The port declares chat as a coroutine; adapters are async generators
+            stream = cast(
+                AsyncGenerator[str, None],
+                backend.config.text_ai.chat(
+                    messages=messages,
+                    model=backend.config.model or model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs,
+                ),
+            )
+            try:
+                first = await stream.__anext__()
+            except StopAsyncIteration:
+                return _StreamStart(stream, None, ended=True)
+            except BaseException:
+                await stream.aclose()
+                raise
+            return _StreamStart(stream, first, ended=False)
+
+        async def discard(started: _StreamStart) -> None:
+            await started.stream.aclose()
+
+        backend, started = await self._race("chat", start, discard)
+        try:
+            if started.ended or started.first is None:
+                return
+            yield started.first
+            try:
+                async for chunk in started.stream:
+                    yield chunk
+            except Exception:
+                self._failed(backend)
+                raise
+        finally:
+            self._release(backend)
+            await started.stream.aclose()
+
+    async def analyze(
+        self,
+        text: str,
+        prompt: str,
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Analyze text on the fastest backend.
+
+        Args:
+            text: The text to analyze
+            prompt: Instructions for the analysis
+            model: Optional model identifier (a backend's own model takes precedence)
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Complete analysis result
+        """
+        async def run(backend: _Backend) -> str:
+            return await backend.config.text_ai.analyze(
+                text=text, prompt=prompt, model=backend.config.model or model, **kwargs
+            )
+
+        backend, result = await self._race("analyze", run)
+        self._release(backend)
+        return result
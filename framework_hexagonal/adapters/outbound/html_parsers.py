@@ -0,0 +1,243 @@
+"""Pluggable HTML parser backends for text extraction and CSS selection."""
+from typing import Callable, Dict, List, Optional, Protocol, Tuple, Union
+
+# Elements whose contents never count as page text (matches BeautifulSoup's get_text)
+NON_TEXT_TAGS = ("script", "style", "template")
+
+
+class HTMLParserBackend(Protocol):
+    """Interface for an HTML parser used by the web fetcher for text extraction."""
+
+    name: str
+
+    def get_text(self, html: str) -> str:
+        """
+        Extract all visible text from a document.
+
+        Each text node is stripped and the non-empty pieces are concatenated,
+        mirroring ``BeautifulSoup.get_text(strip=True)``.
+
+        Args:
+            html: Raw HTML document
+
+        Returns:
+            Concatenated document text
+        """
+        ...
+
+    def select_text(self, html: str, selector: str) -> List[str]:
+        """
+        Extract the text of every element matching a CSS selector.
+
+        Args:
+            html: Raw HTML document
+            selector: CSS selector
+
+        Returns:
+            Text of each matching element, in document order
+        """
+        ...
+
+    def select_attr(self, html: str, selector: str, attr: str) -> List[str]:
+        """
+        Extract an attribute from every element matching a CSS selector.
+
+        Args:
+            html: Raw HTML document
+            selector: CSS selector
+            attr: Attribute name
+
+        Returns:
+            Attribute values of matching elements that carry it, in document order
+        """
+        ...
+
+
+class BeautifulSoupBackend:
+    """BeautifulSoup backend; always available and the reference implementation."""
+
+    name = "bs4"
+
+    def __init__(self, parser: str = "html.parser"):
+        """
+        Initialize the BeautifulSoup backend.
+
+        Args:
+            parser: BeautifulSoup tree builder to use
+        """
+        from bs4 import BeautifulSoup
+
+        self._soup_class = BeautifulSoup
+        self.parser = parser
+
+    def __reduce__(self):  # type: ignore[no-untyped-def]
+        # Pickle by configuration so the backend can be sent to worker processes
+        return (self.__class__, (self.parser,))
+
+    def get_text(self, html: str) -> str:
+        """Extract all visible text from a document."""
+        return str(self._soup_class(html, self.parser).get_text(strip=True))
+
+    def select_text(self, html: str, selector: str) -> List[str]:
+        """Extract the text of every element matching a CSS selector."""
+        soup = self._soup_class(html, self.parser)
+        return [element.get_text(strip=True) for element in soup.select(selector)]
+
+    def select_attr(self, html: str, selector: str, attr: str) -> List[str]:
+        """Extract an attribute from every element matching a CSS selector."""
+        soup = self._soup_class(html, self.parser)
+        values = (element.get(attr) for element in soup.select(selector))
+        return [str(value) for value in values if value is not None]
+
+
+class LxmlBackend:
+    """lxml backend (requires ``lxml`` and ``cssselect``)."""
+
+    name = "lxml"
+
+    def __init__(self) -> None:
+        """Initialize the lxml backend."""
+        import lxml.html
+        from lxml.cssselect import CSSSelector
+
+        self._html = lxml.html
+        self._selector_class = CSSSelector
+        self._parser = lxml.html.HTMLParser(encoding="utf-8")
+        self._selectors: Dict[str, Callable] = {}
+
+    def __reduce__(self):  # type: ignore[no-untyped-def]
+        return (self.__class__, ())
+
+    def _parse(self, html: str):  # type: ignore[no-untyped-def]
+        # Feed bytes so documents carrying an XML encoding declaration still parse
+        root = self._html.document_fromstring(html.encode("utf-8"), parser=self._parser)
+        for element in list(root.iter(*NON_TEXT_TAGS)):
+            element.drop_tree()
+        return root
+
+    @staticmethod
+    def _element_text(element) -> str:  # type: ignore[no-untyped-def]
+        return "".join(piece.strip() for piece in element.itertext())
+
+    def get_text(self, html: str) -> str:
+        """Extract all visible text from a document."""
+        if not html.strip():
+            return ""
+        return self._element_text(self._parse(html))
+
+    def _select(self, html: str, selector: str) -> list:
+        if not html.strip():
+            return []
+        compiled = self._selectors.get(selector)
+        if compiled is None:
+            compiled = self._selectors[selector] = self._selector_class(selector)
+        return list(compiled(self._parse(html)))
+
+    def select_text(self, html: str, selector: str) -> List[str]:
+        """Extract the text of every element matching a CSS selector."""
+        return [self._element_text(element) for element in self._select(html, selector)]
+
+    def select_attr(self, html: str, selector: str, attr: str) -> List[str]:
+        """Extract an attribute from every element matching a CSS selector."""
+        values = (element.get(attr) for element in self._select(html, selector))
+        return [value for value in values if value is not None]
+
+
+class SelectolaxBackend:
+    """selectolax (lexbor engine) backend; the fastest option when installed."""
+
+    name = "selectolax"
+
+    def __init__(self) -> None:
+        """Initialize the selectolax backend."""
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser_class = LexborHTMLParser
+
+    def __reduce__(self):  # type: ignore[no-untyped-def]
+        return (self.__class__, ())
+
+    def _parse(self, html: str):  # type: ignore[no-untyped-def]
+        tree = self._parser_class(html)
+        tree.strip_tags(list(NON_TEXT_TAGS))
+        return tree
+
+    def get_text(self, html: str) -> str:
+        """Extract all visible text from a document."""
+        root = self._parse(html).root
+        if root is None:
+            return ""
+        return str(root.text(deep=True, separator="", strip=True))
+
+    def select_text(self, html: str, selector: str) -> List[str]:
+        """Extract the text of every element matching a CSS selector."""
+        return [
+            node.text(deep=True, separator="", strip=True)
+            for node in self._parse(html).css(selector)
+        ]
+
+    def select_attr(self, html: str, selector: str, attr: str) -> List[str]:
+        """Extract an attribute from every element matching a CSS selector."""
+        values = (node.attributes.get(attr) for node in self._parse(html).css(selector))
+        return [value for value in values if value is not None]
+
+
+PARSER_BACKENDS: Dict[str, Callable[[], HTMLParserBackend]] = {
+    "selectolax": SelectolaxBackend,
+    "lxml": LxmlBackend,
+    "bs4": BeautifulSoupBackend,
+}
+
+# Preference order used by "auto": fastest first, BeautifulSoup as the fallback
+AUTO_ORDER = ("selectolax", "lxml", "bs4")
+
+
+def get_parser_backend(name: Optional[str] = "auto") -> HTMLParserBackend:
+    """
+    Create a parser backend by name.
+
+    Args:
+        name: Backend name ('selectolax', 'lxml', 'bs4') or 'auto' to pick
+            the fastest installed backend, falling back to BeautifulSoup
+
+    Returns:
+        Parser backend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If an explicitly requested backend is not installed
+    """
+    if name is None or name == "auto":
+        for candidate in AUTO_ORDER:
+            try:
+                return PARSER_BACKENDS[candidate]()
+            except ImportError:
+                continue
+        name = "bs4"
+
+    if name not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown parser backend '{name}'. Choose from: auto, {', '.join(PARSER_BACKENDS)}"
+        )
+    return PARSER_BACKENDS[name]()
+
+
+def link_extractor(
+    backend: Union[str, HTMLParserBackend] = "auto",
+) -> Callable[[str], Tuple[Optional[str], List[str]]]:
+    """
+    Create a crawler link extractor backed by a parser backend.
+
+    Args:
+        backend: Backend name (see ``get_parser_backend``) or instance
+
+    Returns:
+        Function returning the title and ``a[href]`` values of a document
+    """
+    parser = get_parser_backend(backend) if isinstance(backend, str) else backend
+
+    def extract(html: str) -> Tuple[Optional[str], List[str]]:
+        titles = parser.select_text(html, "title")
+        return (titles[0] if titles else None), parser.select_attr(html, "a[href]", "href")
+
+    return extract
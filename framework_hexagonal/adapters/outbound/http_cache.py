@@ -0,0 +1,416 @@
+"""RFC 7234 style response cache with conditional revalidation for the web fetcher."""
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Protocol, Union
+
+from ...core.ports.web_fetcher import FetchedPage
+from ...utils.cache import LRUCache
+from ...utils.files import write_atomic
+
+# Heuristic freshness (RFC 7234 4.2.2) is capped so pages without explicit
+# lifetimes are still revalidated at least daily.
+MAX_HEURISTIC_LIFETIME = 24 * 60 * 60.0
+
+# A BeautifulSoup tree takes roughly 40 times the memory of its HTML
+# (measured with lxml and html.parser on typical markup)
+PARSED_PAGE_SIZE_FACTOR = 40
+
+
+def _get_header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """
+    Parse a Cache-Control header into a directive mapping.
+
+    Args:
+        value: Raw header value
+
+    Returns:
+        Lower-cased directive names mapped to their value (or None)
+    """
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body plus the metadata needed to reuse or revalidate it."""
+
+    url: str
+    status_code: int
+    html: str
+    headers: Dict[str, str]
+    stored_at: float
+    vary: Dict[str, Optional[str]] = field(default_factory=dict)
+    # Parsed page kept by in-memory backends so hits also skip re-parsing
+    page: Optional[FetchedPage] = field(default=None, compare=False, repr=False)
+
+    def _header(self, name: str) -> Optional[str]:
+        return _get_header(self.headers, name)
+
+    @property
+    def etag(self) -> Optional[str]:
+        """ETag validator, if any."""
+        return self._header("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        """Last-Modified validator, if any."""
+        return self._header("last-modified")
+
+    def freshness_lifetime(self) -> float:
+        """
+        Compute how long the response is fresh, in seconds.
+
+        Returns:
+            max-age, else Expires minus Date, else 10% of the Last-Modified
+            age (capped), else 0
+        """
+        directives = parse_cache_control(self._header("cache-control"))
+        if "no-cache" in directives:
+            return 0.0
+        if directives.get("max-age") is not None:
+            try:
+                return max(0.0, float(directives["max-age"]))  # type: ignore[arg-type]
+            except ValueError:
+                return 0.0
+
+        date = _parse_http_date(self._header("date")) or self.stored_at
+        expires = self._header("expires")
+        if expires is not None:
+            expires_at = _parse_http_date(expires)
+            return max(0.0, expires_at - date) if expires_at is not None else 0.0
+
+        last_modified = _parse_http_date(self.last_modified)
+        if last_modified is not None:
+            return min(max(0.0, (date - last_modified) * 0.1), MAX_HEURISTIC_LIFETIME)
+        return 0.0
+
+    def current_age(self, now: Optional[float] = None) -> float:
+        """Age of the response in seconds, including any upstream Age header."""
+        try:
+            initial_age = float(self._header("age") or 0)
+        except ValueError:
+            initial_age = 0.0
+        return max(0.0, (now or time.time()) - self.stored_at) + initial_age
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Whether the response can be served without contacting the origin."""
+        return self.current_age(now) < self.freshness_lifetime()
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that ask the origin to revalidate this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the entry (without the parsed page)."""
+        return {
+            "url": self.url,
+            "status_code": self.status_code,
+            "html": self.html,
+            "headers": self.headers,
+            "stored_at": self.stored_at,
+            "vary": self.vary,
+        }
+
+
+@dataclass
+class HTTPCacheStats:
+    """Counters for verifying cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stored: int = 0
+    bytes_saved: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the counters as a dict."""
+        return asdict(self)
+
+
+class HTTPCacheBackend(Protocol):
+    """Storage for cached responses."""
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the entry for a key, or None."""
+        ...
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry."""
+        ...
+
+
+def _entry_size(entry: CachedResponse) -> int:
+    # A kept page may be parsed at any time, so its tree is counted up front
+    if entry.page is None:
+        return len(entry.html)
+    return len(entry.html) * (1 + PARSED_PAGE_SIZE_FACTOR)
+
+
+class MemoryHTTPCacheBackend:
+    """
+    In-memory LRU backend; also keeps parsed pages so hits skip re-parsing.
+
+    The size bound counts each kept page's parse tree as well as its body.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = 256 * 1024 * 1024):
+        """
+        Initialize the memory backend.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum estimated memory of cached bodies and parsed pages
+        """
+        self._cache: LRUCache[str, CachedResponse] = LRUCache(
+            max_items=max_entries,
+            max_bytes=max_bytes,
+            size_of=_entry_size,
+        )
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the entry for a key, or None."""
+        return self._cache.get(key)
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry."""
+        self._cache.set(key, entry)
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry."""
+        self._cache.pop(key)
+
+
+class FileHTTPCacheBackend:
+    """On-disk backend storing one JSON file per URL; survives restarts."""
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Initialize the file backend.
+
+        Args:
+            directory: Directory holding cache files (created if missing)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _read(self, key: str) -> Optional[CachedResponse]:
+        try:
+            data = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        try:
+            return CachedResponse(**data)
+        except TypeError:
+            # Written with a different schema
+            return None
+
+    def _write(self, key: str, entry: CachedResponse) -> None:
+        write_atomic(self._path(key), json.dumps(entry.to_dict()).encode("utf-8"))
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the entry for a key, or None."""
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry."""
+        await asyncio.to_thread(self._write, key, entry)
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry."""
+        await asyncio.to_thread(self._path(key).unlink, True)
+
+
+class HTTPCache:
+    """
+    Private HTTP cache policy in front of a storage backend.
+
+    Fresh responses are served without a request; stale ones carrying an
+    ETag or Last-Modified validator are revalidated conditionally so a 304
+    reuses the stored body. Responses marked ``no-store`` (or ``Vary: *``)
+    are never stored.
+    """
+
+    def __init__(self, backend: Optional[HTTPCacheBackend] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend (defaults to an in-memory LRU)
+        """
+        self.backend = backend or MemoryHTTPCacheBackend()
+        self.stats = HTTPCacheStats()
+
+    @staticmethod
+    def _vary_names(headers: Mapping[str, str]) -> list:
+        vary = _get_header(headers, "vary") or ""
+        return [name.strip().lower() for name in vary.split(",") if name.strip()]
+
+    @staticmethod
+    def _request_values(
+        request_headers: Mapping[str, str], names: list
+    ) -> Dict[str, Optional[str]]:
+        lowered = {k.lower(): v for k, v in request_headers.items()}
+        return {name: lowered.get(name) for name in names}
+
+    async def lookup(
+        self, url: str, request_headers: Mapping[str, str]
+    ) -> Optional[CachedResponse]:
+        """
+        Find a stored response usable for a request.
+
+        Args:
+            url: Requested URL
+            request_headers: Headers of the outgoing request
+
+        Returns:
+            Matching entry (fresh or stale), or None
+        """
+        directives = parse_cache_control(_get_header(request_headers, "cache-control"))
+        if "no-store" in directives:
+            return None
+
+        entry = await self.backend.get(url)
+        if entry is None:
+            return None
+        if entry.vary != self._request_values(request_headers, list(entry.vary)):
+            return None
+        return entry
+
+    @staticmethod
+    def is_fresh(entry: CachedResponse, request_headers: Mapping[str, str]) -> bool:
+        """
+        Whether an entry may be served without revalidation.
+
+        Args:
+            entry: Entry returned by ``lookup``
+            request_headers: Headers of the outgoing request
+
+        Returns:
+            True if fresh and the request does not demand revalidation
+        """
+        directives = parse_cache_control(_get_header(request_headers, "cache-control"))
+        return "no-cache" not in directives and entry.is_fresh()
+
+    async def store(
+        self,
+        url: str,
+        request_headers: Mapping[str, str],
+        page: FetchedPage,
+    ) -> Optional[CachedResponse]:
+        """
+        Store a freshly downloaded page if the response allows it.
+
+        Args:
+            url: Requested URL (the cache key)
+            request_headers: Headers of the outgoing request
+            page: Downloaded page
+
+        Returns:
+            Stored entry, or None if the response is not cacheable
+        """
+        directives = parse_cache_control(_get_header(page.headers, "cache-control"))
+        vary_names = self._vary_names(page.headers)
+        if page.status_code != 200 or "no-store" in directives or "*" in vary_names:
+            return None
+
+        entry = CachedResponse(
+            url=page.url,
+            status_code=page.status_code,
+            html=page.html,
+            headers=dict(page.headers),
+            stored_at=time.time(),
+            vary=self._request_values(request_headers, vary_names),
+            page=page,
+        )
+        await self.backend.set(url, entry)
+        self.stats.stored += 1
+        return entry
+
+    async def revalidated(
+        self,
+        url: str,
+        entry: CachedResponse,
+        response_headers: Mapping[str, str],
+    ) -> CachedResponse:
+        """
+        Refresh a stored entry after the origin answered 304 Not Modified.
+
+        Args:
+            url: Requested URL (the cache key)
+            entry: Stale entry that was revalidated
+            response_headers: Headers of the 304 response
+
+        Returns:
+            Updated entry
+        """
+        entry.headers.update(
+            {k: v for k, v in response_headers.items() if k.lower() != "content-length"}
+        )
+        entry.stored_at = time.time()
+        await self.backend.set(url, entry)
+        self.stats.revalidated += 1
+        self.stats.bytes_saved += len(entry.html)
+        return entry
+
+    def page_from_entry(self, entry: CachedResponse, parser: Optional[str]) -> FetchedPage:
+        """
+        Build (or reuse) the page for a cached entry.
+
+        Pages are shared between callers while their entry stays in memory,
+        so treat ``soup`` from a cached page as read-only.
+
+        Args:
+            entry: Cached entry
+            parser: Parser the caller wants, or None to skip parsing
+
+        Returns:
+            FetchedPage for the entry
+        """
+        page = entry.page
+        if page is None or (parser is not None and page.parser is None):
+            page = FetchedPage(
+                url=entry.url,
+                status_code=entry.status_code,
+                html=entry.html,
+                headers=dict(entry.headers),
+                parser=parser,
+            )
+            entry.page = page
+        return page
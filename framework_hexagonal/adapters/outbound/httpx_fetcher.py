@@ -1,12 +1,56 @@
 """HTTPX adapter for WebFetcher port."""
-from typing import Dict, Optional, Any
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from collections import defaultdict
+from typing import (
+    AsyncGenerator, Callable, Dict, Iterable, Optional, Any, Sequence, TypeVar, Union,
+)
+import asyncio
+import codecs
 import httpx
 from bs4 import BeautifulSoup
-from ...core.ports.web_fetcher import WebFetcher, FetchedPage
+from ...core.ports.web_fetcher import (
+    WebFetcher,
+    FetchedPage,
+    PageContent,
+    ResponseTooLargeError,
+    UnsupportedContentTypeError,
+)
+from .html_parsers import HTMLParserBackend, get_parser_backend
+from .http_cache import HTTPCache
+from .main_content import extract_main_content
+
+R = TypeVar('R')
+
+# Content types accepted by fetch() when restricting downloads to web pages
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+
+def _extract_text(backend: HTMLParserBackend, html: str, selector: Optional[str]) -> str:
+    """Extract text with a parser backend; module-level so process pools can pickle it."""
+    if selector:
+        return " ".join(backend.select_text(html, selector))
+    return backend.get_text(html)
 
 
 class HttpxWebFetcherAdapter:
-    """HTTPX implementation of the WebFetcher port."""
+    """
+    HTTPX implementation of the WebFetcher port.
+
+    The adapter owns a single long-lived ``httpx.AsyncClient`` so that
+    connections (and TLS sessions) are reused across fetches. Call
+    ``aclose()`` or use the adapter as an async context manager to release
+    the pool.
+
+    HTML parsing and text extraction can be moved off the event loop with
+    ``executor="thread"`` or ``executor="process"``. Work sent to a process
+    pool only returns plain picklable values (strings), never parse trees.
+    Threads still contend for the GIL, so prefer processes when large pages
+    are parsed with a pure-Python backend such as BeautifulSoup.
+
+    Bodies are always streamed: ``max_bytes`` aborts oversized downloads as
+    soon as the cap is crossed and ``allowed_content_types`` rejects other
+    media types before any of the body is read.
+    """
 
     def __init__(
         self,
@@ -14,6 +58,17 @@ class HttpxWebFetcherAdapter:
         default_timeout: float = 30.0,
         follow_redirects: bool = True,
         parser: str = "html.parser",
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        text_backend: Union[str, HTMLParserBackend] = "auto",
+        executor: Union[str, Executor, None] = None,
+        max_workers: Optional[int] = None,
+        cache: Optional[HTTPCache] = None,
+        max_bytes: Optional[int] = None,
+        allowed_content_types: Optional[Sequence[str]] = None,
     ):
         """
         Initialize the HTTPX web fetcher adapter.
@@ -23,6 +78,21 @@ class HttpxWebFetcherAdapter:
             default_timeout: Default timeout for requests in seconds
             follow_redirects: Whether to follow HTTP redirects
             parser: BeautifulSoup parser to use
+            max_connections: Maximum number of concurrent connections in the pool
+            max_keepalive_connections: Maximum number of idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept before closing
+            http2: Whether to enable HTTP/2 (requires the ``h2`` package)
+            transport: Optional custom transport (e.g. ``httpx.MockTransport`` in tests)
+            text_backend: Parser backend for ``get_text`` ('auto', 'selectolax',
+                'lxml', 'bs4') or a backend instance
+            executor: Where to run parsing and text extraction: None (inline on the
+                event loop), 'thread', 'process' or an existing Executor
+            max_workers: Worker count when the adapter creates its own executor
+            cache: Optional HTTP cache; fresh hits skip the request and stale
+                entries are revalidated with If-None-Match/If-Modified-Since
+            max_bytes: Maximum decoded body size accepted by ``fetch`` (None for no cap)
+            allowed_content_types: Media types accepted by ``fetch`` (e.g.
+                ``HTML_CONTENT_TYPES``; ``type/*`` wildcards allowed). None accepts any
         """
         self.default_headers = default_headers or {
             "User-Agent": "framework-hexagonal/0.1.0 (+https://github.com/framework-hexagonal)"
@@ -30,71 +100,404 @@ class HttpxWebFetcherAdapter:
         self.default_timeout = default_timeout
         self.follow_redirects = follow_redirects
         self.parser = parser
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.transport = transport
+        self.text_backend = (
+            get_parser_backend(text_backend) if isinstance(text_backend, str) else text_backend
+        )
+        if executor not in (None, "thread", "process") and not isinstance(executor, Executor):
+            raise ValueError("executor must be None, 'thread', 'process' or an Executor instance")
+        self.executor = executor
+        self.max_workers = max_workers
+        self.cache = cache
+        self.max_bytes = max_bytes
+        self.allowed_content_types = (
+            tuple(t.lower() for t in allowed_content_types) if allowed_content_types else None
+        )
+        self._executor: Optional[Executor] = executor if isinstance(executor, Executor) else None
+        self._owns_executor = self._executor is None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _ensure_executor(self) -> Optional[Executor]:
+        """
+        Ensure the parsing executor is created.
+
+        Returns:
+            Executor for parsing work, or None when parsing runs inline
+        """
+        if self._executor is None and self.executor == "thread":
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="html-parse"
+            )
+        elif self._executor is None and self.executor == "process":
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        return self._executor
+
+    async def _run_parser(self, func: Callable[..., R], *args: Any) -> R:
+        """
+        Run CPU-bound parsing work on the configured executor.
+
+        Args:
+            func: Picklable callable doing the work
+            *args: Picklable arguments for the callable
+
+        Returns:
+            Result of the callable
+        """
+        executor = self._ensure_executor()
+        if executor is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """
+        Ensure the shared HTTP client is created.
+
+        Returns:
+            Pooled httpx.AsyncClient instance
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                follow_redirects=self.follow_redirects,
+                timeout=httpx.Timeout(self.default_timeout),
+                limits=self.limits,
+                http2=self.http2,
+                transport=self.transport,
+            )
+
+        return self._client
 
     async def fetch(
         self,
         url: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: float = 30.0,
+        parse: bool = True,
         **kwargs: Any,
     ) -> FetchedPage:
         """
         Fetch a web page and return its parsed content.
 
+        Parsing is deferred until ``FetchedPage.soup`` is first accessed.
+
         Args:
             url: The URL to fetch
             headers: Optional request headers
             timeout: Request timeout in seconds
+            parse: Whether the page may be parsed; False skips parsing entirely
             **kwargs: Additional request parameters
 
         Returns:
-            FetchedPage containing html content and parsed BeautifulSoup
+            FetchedPage containing html content and lazily parsed BeautifulSoup
         """
         request_headers = {**self.default_headers}
         if headers:
             request_headers.update(headers)
-            
-        request_timeout = httpx.Timeout(timeout)
-        
-        async with httpx.AsyncClient(
-            follow_redirects=self.follow_redirects,
-            timeout=request_timeout,
-        ) as client:
-            response = await client.get(url, headers=request_headers, **kwargs)
+        parser = self.parser if parse else None
+
+        entry = None
+        if self.cache is not None:
+            entry = await self.cache.lookup(url, request_headers)
+            if entry is not None and self.cache.is_fresh(entry, request_headers):
+                self.cache.stats.hits += 1
+                self.cache.stats.bytes_saved += len(entry.html)
+                return self.cache.page_from_entry(entry, parser)
+            if entry is not None:
+                request_headers.update(entry.conditional_headers())
+
+        client = self._ensure_client()
+        async with client.stream(
+            "GET",
+            url,
+            headers=request_headers,
+            timeout=httpx.Timeout(timeout),
+            **kwargs,
+        ) as response:
+            if self.cache is not None and entry is not None and response.status_code == 304:
+                entry = await self.cache.revalidated(url, entry, response.headers)
+                return self.cache.page_from_entry(entry, parser)
+
             response.raise_for_status()
-            
-            html = response.text
-            soup = BeautifulSoup(html, self.parser)
-            
-            return FetchedPage(
-                url=str(response.url),
-                status_code=response.status_code,
-                html=html,
-                soup=soup,
-                headers=dict(response.headers),
+            self._check_content_type(response)
+            html = await self._read_text(response)
+
+        page = FetchedPage(
+            url=str(response.url),
+            status_code=response.status_code,
+            html=html,
+            headers=dict(response.headers),
+            parser=parser,
+        )
+        if self.cache is not None:
+            self.cache.stats.misses += 1
+            await self.cache.store(url, request_headers, page)
+        return page
+
+    def _check_content_type(self, response: httpx.Response) -> None:
+        """
+        Reject a response whose media type is not allowed.
+
+        Args:
+            response: Response whose headers have been received
+
+        Raises:
+            UnsupportedContentTypeError: If the media type is not in the allowlist
+        """
+        if self.allowed_content_types is None:
+            return
+
+        content_type = response.headers.get("content-type")
+        if content_type is None:
+            return
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        for allowed in self.allowed_content_types:
+            if media_type == allowed or (
+                allowed.endswith("/*") and media_type.startswith(allowed[:-1])
+            ):
+                return
+        raise UnsupportedContentTypeError(
+            f"Content type '{media_type}' of {response.url} is not allowed"
+        )
+
+    @staticmethod
+    def _check_size(response: httpx.Response, received: int, max_bytes: Optional[int]) -> None:
+        if max_bytes is not None and received > max_bytes:
+            raise ResponseTooLargeError(
+                f"Response from {response.url} exceeds the {max_bytes} byte limit"
             )
 
+    async def _read_text(self, response: httpx.Response) -> str:
+        """
+        Read and decode a streamed body incrementally, enforcing ``max_bytes``.
+
+        Args:
+            response: Streaming response
+
+        Returns:
+            Decoded body text
+
+        Raises:
+            ResponseTooLargeError: If the body exceeds ``max_bytes``
+        """
+        content_length = response.headers.get("content-length")
+        if content_length is not None and content_length.isdigit():
+            self._check_size(response, int(content_length), self.max_bytes)
+
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        parts = []
+        received = 0
+        async for chunk in response.aiter_bytes():
+            received += len(chunk)
+            self._check_size(response, received, self.max_bytes)
+            parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts)
+
+    async def iter_chunks(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30.0,
+        chunk_size: int = 64 * 1024,
+        max_bytes: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Download a resource and yield its body in chunks as they arrive.
+
+        Args:
+            url: The URL to download
+            headers: Optional request headers
+            timeout: Request timeout in seconds
+            chunk_size: Preferred chunk size in bytes
+            max_bytes: Optional cap on the total body size
+            **kwargs: Additional request parameters
+
+        Yields:
+            Raw (content-decoded) body chunks
+
+        Raises:
+            ResponseTooLargeError: If the body exceeds ``max_bytes``
+        """
+        request_headers = {**self.default_headers}
+        if headers:
+            request_headers.update(headers)
+
+        client = self._ensure_client()
+        async with client.stream(
+            "GET",
+            url,
+            headers=request_headers,
+            timeout=httpx.Timeout(timeout),
+            **kwargs,
+        ) as response:
+            response.raise_for_status()
+            received = 0
+            async for chunk in response.aiter_bytes(chunk_size):
+                received += len(chunk)
+                self._check_size(response, received, max_bytes)
+                yield chunk
+
+    async def fetch_many(
+        self,
+        urls: Iterable[str],
+        concurrency: int = 10,
+        per_host: int = 2,
+        timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> AsyncGenerator[FetchedPage, None]:
+        """
+        Fetch many pages concurrently, yielding them in completion order.
+
+        A failed URL does not abort the batch; it is yielded as a page whose
+        ``error`` holds the exception. Requests still pending when the caller
+        stops iterating are cancelled.
+
+        Args:
+            urls: URLs to fetch
+            concurrency: Maximum number of requests in flight overall
+            per_host: Maximum number of requests in flight per host
+            timeout: Total time allowed for each request in seconds
+            **kwargs: Additional parameters passed to ``fetch``
+
+        Yields:
+            FetchedPage for every URL as soon as it completes
+        """
+        global_limit = asyncio.Semaphore(concurrency)
+        host_limits: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(per_host)
+        )
+
+        async def fetch_one(url: str) -> FetchedPage:
+            try:
+                # Wait for the host slot first so a slow host cannot hog global slots
+                async with host_limits[httpx.URL(url).host]:
+                    async with global_limit:
+                        return await asyncio.wait_for(
+                            self.fetch(url, timeout=timeout, **kwargs), timeout
+                        )
+            except Exception as e:
+                status_code = 0
+                headers: Dict[str, str] = {}
+                if isinstance(e, httpx.HTTPStatusError):
+                    status_code = e.response.status_code
+                    headers = dict(e.response.headers)
+                return FetchedPage(
+                    url=url,
+                    status_code=status_code,
+                    html="",
+                    headers=headers,
+                    parser=None,
+                    error=e,
+                )
+
+        tasks = [asyncio.create_task(fetch_one(url)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def get_text(
         self,
         url: str,
         selector: Optional[str] = None,
+        main_content: bool = False,
         **kwargs: Any,
     ) -> str:
         """
         Extract text from a web page, optionally filtering by CSS selector.
 
+        Text extraction uses the configured parser backend rather than the
+        page's BeautifulSoup tree.
+
         Args:
             url: The URL to fetch
             selector: Optional CSS selector to filter content
+            main_content: Return only the main content, without navigation,
+                footers, banners and other boilerplate (ignored with a selector)
             **kwargs: Additional request parameters
 
         Returns:
             Extracted text content
         """
-        page = await self.fetch(url, **kwargs)
-        
-        if selector:
-            elements = page.soup.select(selector)
-            return " ".join(element.get_text(strip=True) for element in elements)
-        else:
-            return page.soup.get_text(strip=True) 
\ No newline at end of file
+        if main_content and not selector:
+            return (await self.extract_content(url, **kwargs)).text
+
+        page = await self.fetch(url, parse=False, **kwargs)
+        return await self._run_parser(_extract_text, self.text_backend, page.html, selector)
+
+    async def extract_content(
+        self,
+        url: str,
+        **kwargs: Any,
+    ) -> PageContent:
+        """
+        Extract a page's main content and structure (title, headings, CTAs, links).
+
+        Extraction runs on the configured executor.
+
+        Args:
+            url: The URL to fetch
+            **kwargs: Additional request parameters
+
+        Returns:
+            PageContent with boilerplate removed
+        """
+        page = await self.fetch(url, parse=False, **kwargs)
+        return await self._run_parser(extract_main_content, page.html, page.url)
+
+    async def parse(self, page: FetchedPage) -> Optional[BeautifulSoup]:
+        """
+        Build a page's BeautifulSoup tree off the event loop.
+
+        The tree is cached on the page, so later ``page.soup`` access is free.
+        Soup trees cannot cross process boundaries cheaply, so this always runs
+        in a thread: the configured thread pool, or the loop's default executor
+        when the adapter is configured for processes.
+
+        Args:
+            page: Page returned by ``fetch``
+
+        Returns:
+            Parsed document, or None if the page was fetched with ``parse=False``
+        """
+        if page.is_parsed or page.parser is None:
+            return page.soup
+
+        executor = self._ensure_executor()
+        if executor is None:
+            return page.soup
+        if isinstance(executor, ProcessPoolExecutor):
+            executor = None
+        return await asyncio.get_running_loop().run_in_executor(executor, lambda: page.soup)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and any executor owned by the adapter."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self) -> "HttpxWebFetcherAdapter":
+        """Open the connection pool."""
+        self._ensure_client()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Close the connection pool."""
+        await self.aclose()
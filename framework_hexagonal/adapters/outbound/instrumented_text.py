@@ -0,0 +1,195 @@
+"""Latency and throughput instrumentation wrapped around any TextAI."""
+import asyncio
+import math
+import time
+from typing import Any, AsyncGenerator, Dict, List, Optional, cast
+
+from ...core.ports.text_ai import TextAI
+from ...utils.metrics import LATENCY_BUCKETS, MetricsRegistry, default_registry
+from ...utils.rate_limit import CHARS_PER_TOKEN
+
+# Gaps between stream chunks are usually tens of milliseconds
+GAP_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+TOKENS_PER_SECOND_BUCKETS = (1, 5, 10, 20, 30, 40, 60, 80, 100, 150, 200, 300, 500)
+
+
+class InstrumentedTextAIAdapter:
+    """
+    TextAI decorator that records latency and throughput per model.
+
+    For ``chat`` streams it separates where time goes: time to first
+    chunk and the gaps between chunks are spent waiting on the provider
+    and the network, while consumer time is spent by the caller (our own
+    streaming path) between receiving a chunk and asking for the next.
+    Output tokens are estimated from the text length. Other attributes
+    are forwarded to the wrapped adapter.
+    """
+
+    def __init__(
+        self, text_ai: TextAI, registry: Optional[MetricsRegistry] = None, prefix: str = "textai"
+    ):
+        """
+        Initialize the instrumentation.
+
+        Args:
+            text_ai: TextAI to measure
+            registry: Registry the metrics are recorded in (defaults to
+                the shared default registry)
+            prefix: Prefix of the metric names
+        """
+        self.text_ai = text_ai
+        self.registry = registry or default_registry
+        self.requests = self.registry.counter(
+            f"{prefix}_requests_total", "TextAI calls by outcome", ("method", "model", "status")
+        )
+        self.in_flight = self.registry.gauge(
+            f"{prefix}_in_flight", "TextAI calls in progress", ("method", "model")
+        )
+        self.duration = self.registry.histogram(
+            f"{prefix}_duration_seconds",
+            "Total duration of TextAI calls",
+            ("method", "model"),
+            LATENCY_BUCKETS,
+        )
+        self.time_to_first_token = self.registry.histogram(
+            f"{prefix}_time_to_first_token_seconds",
+            "Time from a chat call to its first chunk",
+            ("model",),
+            LATENCY_BUCKETS,
+        )
+        self.chunk_gap = self.registry.histogram(
+            f"{prefix}_chunk_gap_seconds",
+            "Time waiting on the provider between chat chunks",
+            ("model",),
+            GAP_BUCKETS,
+        )
+        self.consumer_time = self.registry.histogram(
+            f"{prefix}_consumer_seconds",
+            "Time the caller spends on a chat chunk before requesting the next",
+            ("model",),
+            GAP_BUCKETS,
+        )
+        self.output_tokens = self.registry.counter(
+            f"{prefix}_output_tokens_total", "Estimated generated tokens", ("method", "model")
+        )
+        self.tokens_per_second = self.registry.histogram(
+            f"{prefix}_tokens_per_second",
+            "Estimated generation speed of chat streams after the first chunk",
+            ("model",),
+            TOKENS_PER_SECOND_BUCKETS,
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "text_ai":
+            raise AttributeError(name)
+        return getattr(self.text_ai, name)
+
+    def _model(self, model: Optional[str]) -> str:
+        return model or getattr(self.text_ai, "default_model", None) or "unknown"
+
+    @staticmethod
+    def _tokens(characters: int) -> int:
+        return math.ceil(characters / CHARS_PER_TOKEN)
+
+    async def chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Generate streaming chat responses, recording stream timings.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            model: Optional model identifier
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            Text chunks as they are generated
+        """
+        label = self._model(model)
+        # The port declares chat as a coroutine; adapters are async generators
+        stream = cast(
+            AsyncGenerator[str, None],
+            self.text_ai.chat(
+                messages=messages,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            ),
+        )
+        started = time.perf_counter()
+        first_at: Optional[float] = None
+        last_at = started
+        characters = 0
+        status = "error"
+        self.in_flight.inc(method="chat", model=label)
+        try:
+            async for chunk in stream:
+                received = time.perf_counter()
+                if first_at is None:
+                    first_at = received
+                    self.time_to_first_token.observe(received - started, model=label)
+                else:
+                    self.chunk_gap.observe(received - last_at, model=label)
+                characters += len(chunk)
+                yield chunk
+                last_at = time.perf_counter()
+                self.consumer_time.observe(last_at - received, model=label)
+            status = "ok"
+        except (asyncio.CancelledError, GeneratorExit):
+            status = "cancelled"
+            raise
+        finally:
+            finished = time.perf_counter()
+            self.in_flight.dec(method="chat", model=label)
+            self.requests.inc(method="chat", model=label, status=status)
+            self.duration.observe(finished - started, method="chat", model=label)
+            tokens = self._tokens(characters)
+            self.output_tokens.inc(tokens, method="chat", model=label)
+            if status == "ok" and first_at is not None and tokens > 1 and last_at > first_at:
+                # The first chunk's token is not part of the generation window
+                self.tokens_per_second.observe((tokens - 1) / (last_at - first_at), model=label)
+            await stream.aclose()
+
+    async def analyze(
+        self,
+        text: str,
+        prompt: str,
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Analyze text based on a prompt, recording its duration.
+
+        Args:
+            text: The text to analyze
+            prompt: Instructions for the analysis
+            model: Optional model identifier
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Complete analysis result
+        """
+        label = self._model(model)
+        started = time.perf_counter()
+        status = "error"
+        self.in_flight.inc(method="analyze", model=label)
+        try:
+            result = await self.text_ai.analyze(text=text, prompt=prompt, model=model, **kwargs)
+            status = "ok"
+            self.output_tokens.inc(self._tokens(len(result)), method="analyze", model=label)
+            return result
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            self.in_flight.dec(method="analyze", model=label)
+            self.requests.inc(method="analyze", model=label, status=status)
+            self.duration.observe(time.perf_counter() - started, method="analyze", model=label)
@@ -0,0 +1,233 @@
+"""Local filesystem adapter for ArtifactStore port."""
+import asyncio
+import hashlib
+import mimetypes
+import os
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+
+from ...core.ports.artifact_store import GarbageCollection, StoredArtifact
+from ...utils.files import write_atomic
+
+# Temporary files left by interrupted writes are removed after this many seconds
+STALE_TEMP_AGE = 3600.0
+
+
+class LocalArtifactStoreAdapter:
+    """
+    Local filesystem implementation of the ArtifactStore port.
+
+    Artifacts are named by the SHA-256 of their content, so identical
+    screenshots are stored once. Hashing and file I/O run in worker threads
+    and writes land via atomic rename. Storing existing content refreshes
+    its modification time, which garbage collection uses for retention:
+    artifacts older than ``max_age`` go first, then the least recently
+    stored until the total fits ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        base_url: Optional[str] = None,
+        max_age: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        gc_interval: Optional[float] = 3600.0,
+    ):
+        """
+        Initialize the local artifact store adapter.
+
+        Args:
+            directory: Root directory of the store (created if missing)
+            base_url: URL the directory is served under, e.g. '/static'
+            max_age: Seconds an artifact is kept after it was last stored (None to keep forever)
+            max_bytes: Total size kept after garbage collection (None for unbounded)
+            gc_interval: Seconds between background collections once started (None to disable)
+        """
+        self.directory = Path(directory)
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.gc_interval = gc_interval
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._root = self.directory.resolve()
+        self._gc_task: Optional["asyncio.Task[None]"] = None
+
+    def _path(self, key: str) -> Path:
+        path = (self._root / key).resolve()
+        if self._root not in path.parents:
+            raise ValueError(f"Artifact key '{key}' is outside the store")
+        return path
+
+    def url(self, key: str) -> Optional[str]:
+        """
+        Public URL of an artifact.
+
+        Args:
+            key: Artifact key
+
+        Returns:
+            URL under ``base_url``, or None if the store is not served
+        """
+        return f"{self.base_url}/{key}" if self.base_url else None
+
+    def _put(
+        self, data: bytes, namespace: str, extension: str, content_type: Optional[str]
+    ) -> StoredArtifact:
+        digest = hashlib.sha256(data).hexdigest()
+        name = f"{digest}.{extension.lstrip('.')}" if extension else digest
+        key = f"{namespace.strip('/')}/{name}" if namespace.strip("/") else name
+        path = self._path(key)
+        try:
+            os.utime(path)
+            created = False
+        except FileNotFoundError:
+            write_atomic(path, data)
+            created = True
+        if content_type is None:
+            content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        return StoredArtifact(
+            key=key,
+            digest=digest,
+            size=len(data),
+            content_type=content_type,
+            url=self.url(key),
+            created=created,
+        )
+
+    async def put(
+        self,
+        data: bytes,
+        namespace: str = "",
+        extension: str = "",
+        content_type: Optional[str] = None,
+        **kwargs: Any,
+    ) -> StoredArtifact:
+        """
+        Store content under a key derived from its hash.
+
+        Storing the same content twice returns the existing artifact.
+
+        Args:
+            data: Content to store
+            namespace: Subdirectory grouping related artifacts, e.g. 'screenshots'
+            extension: File extension without the dot, e.g. 'png'
+            content_type: MIME type (guessed from the extension if omitted)
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            The stored artifact
+        """
+        return await asyncio.to_thread(self._put, data, namespace, extension, content_type)
+
+    async def get(self, key: str, **kwargs: Any) -> bytes:
+        """
+        Read an artifact's content.
+
+        Args:
+            key: Artifact key returned by ``put``
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            The content
+
+        Raises:
+            KeyError: If no artifact has that key
+        """
+        try:
+            return await asyncio.to_thread(self._path(key).read_bytes)
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    async def delete(self, key: str, **kwargs: Any) -> bool:
+        """
+        Delete an artifact.
+
+        Args:
+            key: Artifact key returned by ``put``
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            True if an artifact was deleted
+        """
+        path = self._path(key)
+
+        def unlink() -> bool:
+            try:
+                path.unlink()
+                return True
+            except FileNotFoundError:
+                return False
+
+        return await asyncio.to_thread(unlink)
+
+    def _collect(self) -> GarbageCollection:
+        now = time.time()
+        result = GarbageCollection()
+        files: List[Tuple[float, int, Path]] = []
+        for path in self.directory.rglob("*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if not path.is_file():
+                continue
+            if path.name.endswith(".tmp"):
+                if now - stat.st_mtime > STALE_TEMP_AGE:
+                    path.unlink(missing_ok=True)
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        kept = 0
+        for mtime, size, path in files:
+            expired = self.max_age is not None and now - mtime > self.max_age
+            oversized = self.max_bytes is not None and total > self.max_bytes
+            if not (expired or oversized):
+                kept += 1
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            result.removed += 1
+            result.freed_bytes += size
+
+        result.remaining = kept
+        result.remaining_bytes = total
+        return result
+
+    async def collect_garbage(self, **kwargs: Any) -> GarbageCollection:
+        """
+        Remove artifacts older than ``max_age``, then the oldest beyond ``max_bytes``.
+
+        Args:
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            What was removed and what remains
+        """
+        return await asyncio.to_thread(self._collect)
+
+    async def _collect_periodically(self, interval: float) -> None:
+        while True:
+            try:
+                await self.collect_garbage()
+            except OSError:
+                pass  # retried on the next interval
+            await asyncio.sleep(interval)
+
+    async def start(self) -> None:
+        """Start background garbage collection if retention limits are set."""
+        has_limits = self.max_age is not None or self.max_bytes is not None
+        if self._gc_task is None and self.gc_interval and has_limits:
+            self._gc_task = asyncio.create_task(self._collect_periodically(self.gc_interval))
+
+    async def close(self) -> None:
+        """Stop background garbage collection."""
+        if self._gc_task is not None:
+            self._gc_task.cancel()
+            try:
+                await self._gc_task
+            except asyncio.CancelledError:
+                pass
+            self._gc_task = None
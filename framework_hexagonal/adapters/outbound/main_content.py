@@ -0,0 +1,197 @@
+"""Readability-style main-content extraction for compact LLM input."""
+import importlib.util
+import re
+from typing import Dict, List, Optional, Set
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Tag
+
+from ...core.ports.web_fetcher import PageContent
+
+DEFAULT_TREE_BUILDER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Elements that never hold main content
+DROP_TAGS = (
+    "script", "style", "noscript", "template", "svg", "canvas", "iframe", "form",
+    "nav", "header", "footer", "aside", "dialog",
+)
+DROP_ROLES = {"navigation", "banner", "contentinfo", "complementary", "dialog", "alertdialog"}
+
+# class/id words marking boilerplate (readability's "unlikely candidates"). Only
+# whole words between '-', '_' or spaces match, so "hero-banner" matches "banner"
+# but "menubar-less" or "shareholders" do not
+BOILERPLATE_PATTERN = re.compile(
+    r"(?:^|[-_\s])(?:cookie|consent|gdpr|banner|popup|modal|newsletter|subscribe|share|"
+    r"social|comment|sidebar|footer|navbar|menu|breadcrumb|advert|promo|related|skip-link|"
+    r"chat-widget)s?(?=$|[-_\s])",
+    re.IGNORECASE,
+)
+# class/id fragments that keep a candidate despite a boilerplate word
+# (readability's "ok maybe"); "hero" keeps landing-page hero sections
+CONTENT_PATTERN = re.compile(r"article|body|content|main|hero", re.IGNORECASE)
+CTA_TEXT_PATTERN = re.compile(
+    r"\b(sign ?up|get started|start|try|demo|buy|order|book|contact|subscribe|download|"
+    r"request|join|register|get (a )?quote|free trial|talk to)\b",
+    re.IGNORECASE,
+)
+CTA_CLASS_PATTERN = re.compile(r"\b(btn|button|cta)\b", re.IGNORECASE)
+BLOCK_TAGS = ("p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "blockquote", "pre", "td", "dd")
+WHITESPACE = re.compile(r"\s+")
+
+
+def _clean(text: str) -> str:
+    return WHITESPACE.sub(" ", text).strip()
+
+
+def _holds_h1(element: Tag) -> bool:
+    """Whether the element is or contains an h1; the page's headline is never boilerplate."""
+    return element.name == "h1" or element.find("h1") is not None
+
+
+def _is_boilerplate(element: Tag) -> bool:
+    if element.attrs is None:
+        return False
+    if element.get("aria-hidden") == "true":
+        return True
+    if element.get("role") in DROP_ROLES:
+        return not _holds_h1(element)
+    marker = " ".join(element.get("class") or []) + " " + str(element.get("id") or "")
+    # Never drop the page's main wrappers, even if a class like "menu-open" matches
+    if element.name in ("body", "main", "article") or not BOILERPLATE_PATTERN.search(marker):
+        return False
+    return not CONTENT_PATTERN.search(marker) and not _holds_h1(element)
+
+
+def _link_density(element: Tag, text_length: int) -> float:
+    if not text_length:
+        return 1.0
+    link_length = sum(len(_clean(a.get_text())) for a in element.find_all("a"))
+    return min(1.0, link_length / text_length)
+
+
+def _find_main(body: Tag) -> Tag:
+    """Pick the element most likely to hold the main content."""
+    candidates = (body.find("main"), body.find(None, {"role": "main"}), body.find("article"))
+    for candidate in candidates:
+        if isinstance(candidate, Tag) and len(_clean(candidate.get_text(" "))) > 200:
+            return candidate
+
+    # Readability-style scoring: paragraphs vote for their parent and grandparent
+    scores: Dict[int, float] = {}
+    elements: Dict[int, Tag] = {}
+    for paragraph in body.find_all(("p", "pre", "td", "blockquote")):
+        text = _clean(paragraph.get_text(" "))
+        if len(text) < 25:
+            continue
+        score = 1 + text.count(",") + min(len(text) // 100, 3)
+        grandparent = getattr(paragraph.parent, "parent", None)
+        for ancestor, weight in ((paragraph.parent, 1.0), (grandparent, 0.5)):
+            if isinstance(ancestor, Tag):
+                scores[id(ancestor)] = scores.get(id(ancestor), 0.0) + score * weight
+                elements[id(ancestor)] = ancestor
+
+    if not scores:
+        return body
+
+    def adjusted(key: int) -> float:
+        element = elements[key]
+        return scores[key] * (1 - _link_density(element, len(_clean(element.get_text(" ")))))
+
+    return elements[max(scores, key=adjusted)]
+
+
+def _main_text(main: Tag) -> str:
+    blocks: List[str] = []
+    for block in main.find_all(BLOCK_TAGS):
+        # Nested blocks (li > p) are emitted once, by the innermost element
+        if block.find(BLOCK_TAGS):
+            continue
+        text = _clean(block.get_text(" "))
+        if not text or (len(text) < 80 and _link_density(block, len(text)) > 0.5):
+            continue
+        blocks.append(text)
+    return "\n".join(blocks) if blocks else _clean(main.get_text(" "))
+
+
+def extract_main_content(
+    html: str,
+    url: str = "",
+    max_links: int = 200,
+    tree_builder: Optional[str] = None,
+) -> PageContent:
+    """
+    Extract the main content and key structure of a page.
+
+    Navigation, headers, footers, cookie banners, forms, scripts and other
+    boilerplate are removed before choosing the main content block, so the
+    text is much shorter than a full-document ``get_text``. Headings, CTAs
+    and links are collected from the page. The result only holds plain
+    values, so it can be returned from a worker process.
+
+    Args:
+        html: Raw HTML document
+        url: Page URL used to resolve relative links
+        max_links: Maximum number of links to return
+        tree_builder: BeautifulSoup tree builder (defaults to lxml when installed)
+
+    Returns:
+        PageContent with the main text and metadata
+    """
+    soup = BeautifulSoup(html, tree_builder or DEFAULT_TREE_BUILDER)
+
+    title = ""
+    og_title = soup.find("meta", attrs={"property": "og:title"})
+    if isinstance(og_title, Tag) and og_title.get("content"):
+        title = _clean(str(og_title["content"]))
+    elif soup.title is not None:
+        title = _clean(soup.title.get_text())
+
+    description = None
+    meta_description = soup.find("meta", attrs={"name": "description"})
+    if isinstance(meta_description, Tag) and meta_description.get("content"):
+        description = _clean(str(meta_description["content"]))
+
+    # CTAs and links are collected before boilerplate removal: they often live in headers
+    ctas: List[Dict[str, str]] = []
+    links: List[Dict[str, str]] = []
+    seen_ctas: Set[str] = set()
+    seen_links: Set[str] = set()
+    for element in soup.find_all(("a", "button")):
+        text = _clean(element.get_text(" ")) or _clean(str(element.get("aria-label") or ""))
+        href = element.get("href")
+        href = urljoin(url, str(href)) if href else ""
+        marker = " ".join(element.get("class") or [])
+        if text and (CTA_TEXT_PATTERN.search(text) or CTA_CLASS_PATTERN.search(marker)):
+            if text.lower() not in seen_ctas:
+                seen_ctas.add(text.lower())
+                ctas.append({"text": text, "href": href})
+        if element.name == "a" and href.startswith("http") and href not in seen_links:
+            if len(links) < max_links:
+                seen_links.add(href)
+                links.append({"text": text, "href": href})
+
+    for element in soup.find_all(DROP_TAGS):
+        # A <header> often wraps the hero section and its h1
+        if not element.decomposed and not (element.name == "header" and _holds_h1(element)):
+            element.decompose()
+    for element in soup.find_all(_is_boilerplate):
+        if not element.decomposed:
+            element.decompose()
+
+    body = soup.body or soup
+    headings = [
+        {"level": element.name, "text": _clean(element.get_text(" "))}
+        for element in body.find_all(("h1", "h2", "h3"))
+        if _clean(element.get_text(" "))
+    ]
+    text = _main_text(_find_main(body))
+
+    return PageContent(
+        url=url,
+        title=title,
+        text=text,
+        description=description,
+        headings=headings,
+        ctas=ctas,
+        links=links,
+    )
@@ -0,0 +1,105 @@
+"""OpenAI adapter for Embeddings port."""
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+
+class OpenAIEmbeddingsAdapter:
+    """
+    OpenAI implementation of the Embeddings port.
+
+    Duplicate texts in a call are embedded once, and large calls are split
+    into batches of ``batch_size`` inputs sent up to ``max_concurrency`` at
+    a time.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        default_model: str = "text-embedding-3-small",
+        dimensions: Optional[int] = None,
+        batch_size: int = 256,
+        max_concurrency: int = 4,
+        timeout: float = 60.0,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """
+        Initialize the OpenAI embeddings adapter.
+
+        Args:
+            api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
+            base_url: Optional base URL for the API
+            default_model: Default model to use
+            dimensions: Vector size for models that support shortening (None for the model default)
+            batch_size: Maximum inputs per API request
+            max_concurrency: Maximum batch requests in flight
+            timeout: Timeout for API calls in seconds
+            http_client: Optional httpx client for the OpenAI SDK
+        """
+        self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        self.default_model = default_model
+        self.dimensions = dimensions
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+
+        if not self.api_key:
+            raise ValueError(
+                "OpenAI API key is required. "
+                "Provide as parameter or set OPENAI_API_KEY environment variable."
+            )
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.client = AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=base_url,
+            timeout=timeout,
+            http_client=http_client,
+        )
+
+    async def embed(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[List[float]]:
+        """
+        Embed a batch of texts.
+
+        Args:
+            texts: Texts to embed
+            model: Optional model identifier
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            One vector per text, in input order
+        """
+        model_name = model or self.default_model
+        params: Dict[str, Any] = dict(kwargs)
+        if self.dimensions is not None:
+            params.setdefault("dimensions", self.dimensions)
+
+        # The API rejects empty strings, and duplicates need embedding only once
+        unique = list(dict.fromkeys(text or " " for text in texts))
+        batches = [unique[i:i + self.batch_size] for i in range(0, len(unique), self.batch_size)]
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with slots:
+                response = await self.client.embeddings.create(
+                    model=model_name, input=batch, **params
+                )
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        vectors = {
+            text: vector
+            for batch, batch_vectors in zip(batches, results)
+            for text, vector in zip(batch, batch_vectors)
+        }
+        return [vectors[text or " "] for text in texts]
@@ -1,8 +1,11 @@
 """OpenAI adapter for ImageAI port."""
 from typing import List, Optional, Any, Union
 import os
+import httpx
 from openai import AsyncOpenAI
 from ...core.ports.image_ai import ImageAI
+from ...utils.rate_limit import PRIORITY_INTERACTIVE, RateLimiter
+from .openai_text import is_transient_error
 
 
 class OpenAIImageAdapter:
@@ -15,6 +18,9 @@ class OpenAIImageAdapter:
         default_model: str = "dall-e-3",
         default_size: str = "1024x1024",
         timeout: float = 120.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 2,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize the OpenAI image adapter.
@@ -25,11 +31,18 @@ class OpenAIImageAdapter:
             default_model: Default model to use
             default_size: Default image size
             timeout: Timeout for API calls in seconds
+            rate_limiter: Optional client-side limiter (image budgets are separate
+                from text ones, so give it its own limiter); when set, requests
+                queue for it and retries go through it instead of the SDK
+            max_retries: Retries for rate limits and transient errors
+            http_client: Optional httpx client for the OpenAI SDK
         """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.default_model = default_model
         self.default_size = default_size
         self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
         
         if not self.api_key:
             raise ValueError(
@@ -40,6 +53,8 @@ class OpenAIImageAdapter:
             api_key=self.api_key,
             base_url=base_url,
             timeout=timeout,
+            max_retries=0 if rate_limiter else max_retries,
+            http_client=http_client,
         )
 
     async def generate_image(
@@ -58,22 +73,33 @@ class OpenAIImageAdapter:
             size: Image dimensions (e.g., "1024x1024")
             quality: Image quality level
             n: Number of images to generate
-            **kwargs: Additional provider-specific parameters
+            **kwargs: Additional provider-specific parameters; ``priority``
+                sets the rate-limiter queue priority
 
         Returns:
             URL(s) to the generated image(s)
         """
         model = kwargs.pop("model", self.default_model)
+        priority = kwargs.pop("priority", PRIORITY_INTERACTIVE)
         
         # Create the image(s)
-        response = await self.client.images.generate(
-            model=model,
-            prompt=prompt,
-            size=size,
-            quality=quality,
-            n=n,
-            **kwargs,
-        )
+        def generate() -> Any:
+            return self.client.images.generate(
+                model=model,
+                prompt=prompt,
+                size=size,
+                quality=quality,
+                n=n,
+                **kwargs,
+            )
+        
+        if self.rate_limiter is None:
+            response = await generate()
+        else:
+            permit, response = await self.rate_limiter.admit(
+                generate, priority=priority, retries=self.max_retries, retryable=is_transient_error
+            )
+            permit.release()
         
         # Extract the URLs
         urls = [item.url for item in response.data if item.url]
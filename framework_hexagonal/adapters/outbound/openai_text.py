@@ -3,8 +3,14 @@ from typing import AsyncGenerator, Dict, List, Optional, Any
 import os
 import json
 import httpx
-from openai import AsyncOpenAI
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError
 from ...core.ports.text_ai import TextAI
+from ...utils.rate_limit import PRIORITY_BATCH, PRIORITY_INTERACTIVE, RateLimiter, estimate_tokens
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Errors the SDK would retry; retried here when a rate limiter owns retries."""
+    return isinstance(error, (APIConnectionError, InternalServerError))
 
 
 class OpenAITextAdapter:
@@ -16,6 +22,9 @@ class OpenAITextAdapter:
         base_url: Optional[str] = None,
         default_model: str = "gpt-4o",
         timeout: float = 60.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 2,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize the OpenAI text adapter.
@@ -25,10 +34,16 @@ class OpenAITextAdapter:
             base_url: Optional base URL for the API
             default_model: Default model to use
             timeout: Timeout for API calls in seconds
+            rate_limiter: Optional client-side limiter; when set, requests queue
+                for it and retries go through it instead of the SDK
+            max_retries: Retries for rate limits and transient errors
+            http_client: Optional httpx client for the OpenAI SDK
         """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.default_model = default_model
         self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
         
         if not self.api_key:
             raise ValueError(
@@ -39,6 +54,8 @@ class OpenAITextAdapter:
             api_key=self.api_key,
             base_url=base_url,
             timeout=timeout,
+            max_retries=0 if rate_limiter else max_retries,
+            http_client=http_client,
         )
 
     async def chat(
@@ -57,12 +74,14 @@ class OpenAITextAdapter:
             model: Optional model identifier
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens to generate
-            **kwargs: Additional provider-specific parameters
+            **kwargs: Additional provider-specific parameters; ``priority``
+                sets the rate-limiter queue priority (interactive by default)
 
         Yields:
             Text chunks as they are generated
         """
         model_name = model or self.default_model
+        priority = kwargs.pop("priority", PRIORITY_INTERACTIVE)
         
         # Prepare request parameters
         params = {
@@ -77,11 +96,31 @@ class OpenAITextAdapter:
             params["max_tokens"] = max_tokens
         
         # Make streaming API call
-        stream = await self.client.chat.completions.create(**params)
+        if self.rate_limiter is None:
+            stream = await self.client.chat.completions.create(**params)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+            return
         
-        async for chunk in stream:
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        # The permit is held until the stream ends; time to first chunk is its latency
+        permit, stream = await self.rate_limiter.admit(
+            lambda: self.client.chat.completions.create(**params),
+            tokens=estimate_tokens(messages, max_tokens),
+            priority=priority,
+            retries=self.max_retries,
+            retryable=is_transient_error,
+        )
+        try:
+            async for chunk in stream:
+                permit.first_response()
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            permit.release(e)
+            raise
+        finally:
+            permit.release()
 
     async def analyze(
         self,
@@ -97,12 +136,14 @@ class OpenAITextAdapter:
             text: The text to analyze
             prompt: Instructions for the analysis
             model: Optional model identifier
-            **kwargs: Additional provider-specific parameters
+            **kwargs: Additional provider-specific parameters; ``priority``
+                sets the rate-limiter queue priority (batch by default)
 
         Returns:
             Complete analysis result
         """
         model_name = model or self.default_model
+        priority = kwargs.pop("priority", PRIORITY_BATCH)
         
         messages = [
             {"role": "system", "content": prompt},
@@ -110,11 +151,26 @@ class OpenAITextAdapter:
         ]
         
         # Make non-streaming API call
-        response = await self.client.chat.completions.create(
-            model=model_name,
-            messages=messages,
-            stream=False,
-            **kwargs,
-        )
+        def create() -> Any:
+            return self.client.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                stream=False,
+                **kwargs,
+            )
+        
+        if self.rate_limiter is None:
+            response = await create()
+        else:
+            permit, response = await self.rate_limiter.admit(
+                create,
+                tokens=estimate_tokens(messages, kwargs.get("max_tokens")),
+                priority=priority,
+                retries=self.max_retries,
+                retryable=is_transient_error,
+            )
+            async with permit:
+                if response.usage is not None:
+                    permit.record_usage(response.usage.total_tokens)
         
         return response.choices[0].message.content or "" 
\ No newline at end of file
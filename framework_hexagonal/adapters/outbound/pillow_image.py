@@ -0,0 +1,170 @@
+"""Pillow adapter for ImageProcessor port."""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from PIL import Image
+
+from ...core.ports.image_processor import ImageFormat, ImageVariant, ProcessedImage
+
+PILLOW_FORMATS = {"jpeg": "JPEG", "webp": "WEBP", "png": "PNG"}
+
+
+def _encode(image: "Image.Image", variant: ImageVariant) -> Tuple[bytes, int, int]:
+    if variant.format not in PILLOW_FORMATS:
+        raise ValueError(
+            f"Unsupported image format '{variant.format}'. Choose from: {', '.join(PILLOW_FORMATS)}"
+        )
+    if variant.max_dimension and max(image.size) > variant.max_dimension:
+        image = image.copy()
+        image.thumbnail((variant.max_dimension, variant.max_dimension), Image.Resampling.LANCZOS)
+
+    if variant.format == "jpeg" and image.mode != "RGB":
+        # JPEG has no alpha channel: flatten onto white like a browser would
+        background = Image.new("RGB", image.size, "white")
+        if image.mode in ("RGBA", "LA", "P"):
+            rgba = image.convert("RGBA")
+            background.paste(rgba, mask=rgba.getchannel("A"))
+        else:
+            background.paste(image.convert("RGB"))
+        image = background
+
+    options: Dict[str, Any] = {"optimize": True}
+    if variant.format in ("jpeg", "webp"):
+        options["quality"] = variant.quality
+    if variant.format == "jpeg":
+        options["progressive"] = True
+
+    output = BytesIO()
+    image.save(output, format=PILLOW_FORMATS[variant.format], **options)
+    return output.getvalue(), image.width, image.height
+
+
+def process_variants(
+    image: bytes, variants: List[Tuple[str, ImageVariant]]
+) -> List[Tuple[str, bytes, int, int]]:
+    """
+    Decode an image once and encode every variant.
+
+    Module-level and returning plain tuples so it can run in a worker process.
+
+    Args:
+        image: Encoded source image
+        variants: (name, settings) pairs
+
+    Returns:
+        (name, data, width, height) per variant
+    """
+    with Image.open(BytesIO(image)) as source:
+        source.load()
+        return [(name, *_encode(source, variant)) for name, variant in variants]
+
+
+class PillowImageProcessorAdapter:
+    """
+    Pillow implementation of the ImageProcessor port.
+
+    Decoding, resizing and encoding are CPU-bound and hold the GIL for much
+    of their run, so by default they run in a process pool; pass
+    ``executor="thread"`` or an Executor instance to change that.
+    """
+
+    def __init__(
+        self,
+        executor: Union[str, Executor, None] = "process",
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize the Pillow image processor adapter.
+
+        Args:
+            executor: Where to run image work: 'process' (default), 'thread',
+                None (inline on the event loop) or an Executor instance
+            max_workers: Worker count when the adapter creates its own executor
+        """
+        if executor not in (None, "thread", "process") and not isinstance(executor, Executor):
+            raise ValueError("executor must be None, 'thread', 'process' or an Executor instance")
+        self.executor = executor
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = executor if isinstance(executor, Executor) else None
+        self._owns_executor = self._executor is None
+
+    def _ensure_executor(self) -> Optional[Executor]:
+        """
+        Ensure the image executor is created.
+
+        Returns:
+            Executor for image work, or None when it runs inline
+        """
+        if self._executor is None and self.executor == "thread":
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="image-process"
+            )
+        elif self._executor is None and self.executor == "process":
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        return self._executor
+
+    async def process(
+        self,
+        image: bytes,
+        format: ImageFormat = "jpeg",
+        quality: int = 80,
+        max_dimension: Optional[int] = None,
+        **kwargs: Any,
+    ) -> ProcessedImage:
+        """
+        Re-encode an image, downscaling it if needed.
+
+        Args:
+            image: Encoded source image
+            format: Output format (jpeg, webp or png)
+            quality: Encoder quality for lossy formats (1-100)
+            max_dimension: Longest side in pixels; larger images are downscaled
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Processed image
+        """
+        variant = ImageVariant(format=format, quality=quality, max_dimension=max_dimension)
+        results = await self.process_variants(image, {"": variant})
+        return results[""]
+
+    async def process_variants(
+        self,
+        image: bytes,
+        variants: Dict[str, ImageVariant],
+        **kwargs: Any,
+    ) -> Dict[str, ProcessedImage]:
+        """
+        Produce several encodings of an image from a single decode.
+
+        Args:
+            image: Encoded source image
+            variants: Output settings keyed by variant name
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Processed images keyed by variant name
+        """
+        items = list(variants.items())
+        executor = self._ensure_executor()
+        if executor is None:
+            results = process_variants(image, items)
+        else:
+            results = await asyncio.get_running_loop().run_in_executor(
+                executor, process_variants, image, items
+            )
+        return {
+            name: ProcessedImage(
+                data=data, format=variants[name].format, width=width, height=height
+            )
+            for name, data, width, height in results
+        }
+
+    async def aclose(self) -> None:
+        """Shut down any executor owned by the adapter."""
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,65 @@
+"""Health state and memory measurement for the Playwright browser."""
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # type: ignore[assignment]
+
+# Process-name fragments of each browser engine's processes
+BROWSER_PROCESS_NAMES: Dict[str, Tuple[str, ...]] = {
+    "chromium": ("chrome", "chromium", "headless_shell"),
+    "firefox": ("firefox",),
+    "webkit": ("webkit", "minibrowser"),
+}
+
+
+@dataclass
+class BrowserHealth:
+    """Supervisor state of the screenshotter's browser."""
+
+    started: bool = False
+    checks: int = 0
+    restarts: int = 0
+    last_restart_reason: Optional[str] = None
+    last_error: Optional[str] = None
+    browser_memory_mb: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the state as a dict."""
+        return asdict(self)
+
+
+def browser_memory_mb(browser_type: str = "chromium") -> float:
+    """
+    Measure the resident memory of this process's browser subprocesses.
+
+    Playwright does not expose browser PIDs, so the browser is found among
+    the descendants of the current process by process name. RSS counts
+    shared pages once per process, so the figure overstates real usage; it
+    is meant for thresholds, not accounting. Blocking; run it in a thread.
+
+    Args:
+        browser_type: Browser engine ('chromium', 'firefox' or 'webkit')
+
+    Returns:
+        Summed RSS in megabytes
+
+    Raises:
+        ImportError: If psutil is not installed
+    """
+    if psutil is None:
+        raise ImportError(
+            "Browser memory checks require psutil. "
+            "Install it with: pip install 'framework_hexagonal[playwright]'"
+        )
+    names = BROWSER_PROCESS_NAMES.get(browser_type, BROWSER_PROCESS_NAMES["chromium"])
+    total = 0
+    for process in psutil.Process().children(recursive=True):
+        try:
+            if any(name in process.name().lower() for name in names):
+                total += process.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total / (1024 * 1024)
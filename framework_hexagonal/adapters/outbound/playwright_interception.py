@@ -0,0 +1,264 @@
+"""Request interception profiles and page settling for Playwright captures."""
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, FrozenSet, List, Literal, Tuple, Union
+from urllib.parse import urlsplit
+
+from playwright.async_api import Page, Request, Route
+
+# Hosts whose traffic never affects how a page renders: ads, analytics,
+# tag managers, session recorders and chat widgets
+TRACKER_DOMAINS: Tuple[str, ...] = (
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com",
+    "google-analytics.com", "googletagmanager.com", "googletagservices.com",
+    "adservice.google.com", "facebook.net", "connect.facebook.net", "analytics.twitter.com",
+    "ads-twitter.com", "bat.bing.com", "clarity.ms", "hotjar.com", "hotjar.io",
+    "fullstory.com", "mouseflow.com", "segment.io", "segment.com", "mixpanel.com",
+    "amplitude.com", "heapanalytics.com", "newrelic.com", "nr-data.net", "sentry.io",
+    "intercom.io", "intercomcdn.com", "drift.com", "driftt.com", "crisp.chat",
+    "tawk.to", "zdassets.com", "zopim.com", "livechatinc.com", "hs-analytics.net",
+    "hs-scripts.com", "hubspot.com", "linkedin.com/px", "snap.licdn.com", "taboola.com",
+    "outbrain.com", "criteo.com", "adnxs.com", "quantserve.com", "scorecardresearch.com",
+)
+
+FONTS_READY_SCRIPT = "() => document.fonts ? document.fonts.ready.then(() => true) : true"
+
+# Navigation milestones page.goto can wait for
+LoadState = Literal["commit", "domcontentloaded", "load", "networkidle"]
+
+# Connections that stay open for the life of the page and never finish
+STREAMING_RESOURCE_TYPES = frozenset({"eventsource", "websocket"})
+
+
+@dataclass(frozen=True)
+class InterceptionProfile:
+    """
+    How a capture treats network traffic and decides the page has settled.
+
+    Attributes:
+        name: Profile name
+        blocked_resource_types: Playwright resource types to abort
+        blocked_domains: Hosts (and their subdomains) whose requests are aborted
+        wait_until: Navigation milestone to wait for before settling
+        quiet_ms: Network must stay idle this long for the page to count as settled
+        settle_timeout: Upper bound in seconds on settling after navigation
+        wait_for_fonts: Also wait for ``document.fonts.ready``
+        max_request_age: Seconds after which an unfinished request (e.g. a
+            long poll) no longer keeps the page from settling
+    """
+
+    name: str
+    blocked_resource_types: FrozenSet[str] = frozenset()
+    blocked_domains: Tuple[str, ...] = ()
+    wait_until: LoadState = "load"
+    quiet_ms: int = 500
+    settle_timeout: float = 10.0
+    wait_for_fonts: bool = True
+    max_request_age: float = 5.0
+
+    @property
+    def intercepts(self) -> bool:
+        """Whether the profile needs a route handler at all."""
+        return bool(self.blocked_resource_types or self.blocked_domains)
+
+    def blocks(self, url: str, resource_type: str) -> bool:
+        """
+        Decide whether a request is aborted.
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type (image, font, script, ...)
+
+        Returns:
+            True if the request should be aborted
+        """
+        if resource_type in self.blocked_resource_types:
+            return True
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        for domain in self.blocked_domains:
+            domain_host, _, path = domain.partition("/")
+            if host == domain_host or host.endswith("." + domain_host):
+                if not path or parts.path.lstrip("/").startswith(path):
+                    return True
+        return False
+
+
+PROFILES: Dict[str, InterceptionProfile] = {
+    # Layout-relevant resources only; settles shortly after DOMContentLoaded
+    "fast": InterceptionProfile(
+        name="fast",
+        blocked_resource_types=frozenset(
+            {"font", "media", "websocket", "eventsource", "manifest", "texttrack"}
+        ),
+        blocked_domains=TRACKER_DOMAINS,
+        wait_until="domcontentloaded",
+        quiet_ms=250,
+        settle_timeout=3.0,
+        wait_for_fonts=False,
+    ),
+    # Everything loads, as a visitor would see the page
+    "faithful": InterceptionProfile(name="faithful"),
+}
+
+
+def get_profile(profile: Union[str, InterceptionProfile]) -> InterceptionProfile:
+    """
+    Resolve a profile by name.
+
+    Args:
+        profile: Profile name ('fast', 'faithful') or a profile instance
+
+    Returns:
+        Interception profile
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    if isinstance(profile, InterceptionProfile):
+        return profile
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown interception profile '{profile}'. Choose from: {', '.join(PROFILES)}"
+        )
+    return PROFILES[profile]
+
+
+@dataclass
+class CaptureReport:
+    """Network and timing figures for one capture."""
+
+    url: str
+    profile: str
+    requests: int = 0
+    blocked: int = 0
+    failed: int = 0
+    bytes_transferred: int = 0
+    navigation_time: float = 0.0
+    settle_time: float = 0.0
+    total_time: float = 0.0
+    settled_by: str = ""
+    blocked_by_type: Dict[str, int] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the report as a dict."""
+        return asdict(self)
+
+
+class NetworkMonitor:
+    """
+    Applies a profile to a page and tracks its traffic for one capture.
+
+    Pooled pages are reused, so ``detach`` must be called to remove the
+    route handler and listeners once the capture finishes.
+    """
+
+    def __init__(self, page: Page, profile: InterceptionProfile, report: CaptureReport):
+        self.page = page
+        self.profile = profile
+        self.report = report
+        self.last_activity = time.perf_counter()
+        # Unfinished requests and when they started
+        self._pending: Dict[Request, float] = {}
+        self._size_tasks: List["asyncio.Task[None]"] = []
+
+    @property
+    def in_flight(self) -> int:
+        """Requests started and not yet finished, streaming connections excluded."""
+        return len(self._pending)
+
+    async def attach(self) -> None:
+        """Install the route handler (if the profile blocks anything) and listeners."""
+        self.page.on("request", self._on_request)
+        self.page.on("requestfinished", self._on_finished)
+        self.page.on("requestfailed", self._on_failed)
+        if self.profile.intercepts:
+            await self.page.route("**/*", self._route)
+
+    async def detach(self) -> None:
+        """Remove everything installed by ``attach``."""
+        self.page.remove_listener("request", self._on_request)
+        self.page.remove_listener("requestfinished", self._on_finished)
+        self.page.remove_listener("requestfailed", self._on_failed)
+        if self.profile.intercepts:
+            try:
+                await self.page.unroute("**/*", self._route)
+            except Exception:
+                pass
+        await asyncio.gather(*self._size_tasks, return_exceptions=True)
+        self._size_tasks.clear()
+
+    async def _route(self, route: Route) -> None:
+        request = route.request
+        if self.profile.blocks(request.url, request.resource_type):
+            self.report.blocked += 1
+            counts = self.report.blocked_by_type
+            counts[request.resource_type] = counts.get(request.resource_type, 0) + 1
+            await route.abort("blockedbyclient")
+        else:
+            await route.continue_()
+
+    def _on_request(self, request: Request) -> None:
+        self.report.requests += 1
+        self.last_activity = time.perf_counter()
+        if request.resource_type not in STREAMING_RESOURCE_TYPES:
+            self._pending[request] = self.last_activity
+
+    def _on_done(self, request: Request) -> None:
+        self._pending.pop(request, None)
+        self.last_activity = time.perf_counter()
+
+    def _on_finished(self, request: Request) -> None:
+        self._on_done(request)
+        # Content-Length is missing for chunked and most compressed responses
+        self._size_tasks.append(asyncio.ensure_future(self._count_bytes(request)))
+
+    async def _count_bytes(self, request: Request) -> None:
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return
+        self.report.bytes_transferred += sizes["responseBodySize"] + sizes["responseHeadersSize"]
+
+    def _on_failed(self, request: Request) -> None:
+        # Requests aborted by the route handler surface here too; count real failures only
+        failure = request.failure or ""
+        if "blockedbyclient" not in failure.lower().replace("_", ""):
+            self.report.failed += 1
+        self._on_done(request)
+
+    async def settle(self) -> str:
+        """
+        Wait until the page has settled.
+
+        Settled means no request has been in flight for ``quiet_ms``. Unlike
+        ``networkidle``, EventSource and WebSocket connections are ignored,
+        requests open longer than ``max_request_age`` (long polls) stop
+        counting as in flight, and the wait never exceeds ``settle_timeout``.
+
+        Returns:
+            How the wait ended: 'network-quiet' or 'timeout'
+        """
+        quiet = self.profile.quiet_ms / 1000
+        deadline = time.perf_counter() + self.profile.settle_timeout
+        if self.profile.wait_for_fonts:
+            try:
+                await asyncio.wait_for(
+                    self.page.evaluate(FONTS_READY_SCRIPT), self.profile.settle_timeout
+                )
+            except Exception:
+                pass
+
+        while True:
+            now = time.perf_counter()
+            # A long-lived request counts as activity up to the moment it ages out
+            busy_until = max(
+                [self.last_activity]
+                + [started + self.profile.max_request_age for started in self._pending.values()]
+            )
+            if now - busy_until >= quiet:
+                return "network-quiet"
+            if now >= deadline:
+                return "timeout"
+            await asyncio.sleep(min(0.05, max(0.0, deadline - now)))
@@ -0,0 +1,311 @@
+"""Bounded, warm-reusable pool of Playwright browser contexts and pages."""
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, Set
+from urllib.parse import urlsplit
+
+from playwright.async_api import Browser, BrowserContext, Frame, Page, ViewportSize
+
+
+def _origin(url: str) -> Optional[str]:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+@dataclass
+class PoolStats:
+    """Pool metrics."""
+
+    size: int = 0
+    in_use: int = 0
+    idle: int = 0
+    created: int = 0
+    recycled: int = 0
+    acquired: int = 0
+    waiting: int = 0
+    timeouts: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        """Mean time callers waited for a context, in seconds."""
+        return self.total_wait_time / self.acquired if self.acquired else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the metrics as a dict."""
+        data = asdict(self)
+        data["average_wait_time"] = self.average_wait_time
+        return data
+
+
+class PooledContext:
+    """A browser context with one page, tracked by the pool."""
+
+    def __init__(self, browser: Browser, context: BrowserContext, page: Page):
+        self.browser = browser
+        self.context = context
+        self.page = page
+        self.uses = 0
+        self.crashed = False
+        self.retired = False
+        # Origins of every document loaded since the last reset, iframes included
+        self.origins: Set[str] = set()
+        page.on("crash", self._mark_crashed)
+        page.on("framenavigated", self._track_origin)
+        context.on("close", self._mark_crashed)
+
+    def _mark_crashed(self, *args: Any) -> None:
+        self.crashed = True
+
+    def _track_origin(self, frame: Frame) -> None:
+        origin = _origin(frame.url)
+        if origin is not None:
+            self.origins.add(origin)
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the context can be handed out again."""
+        return (
+            not self.crashed
+            and not self.retired
+            and self.browser.is_connected()
+            and not self.page.is_closed()
+        )
+
+
+class BrowserContextPool:
+    """
+    Pool of browser contexts, each with a single reusable page.
+
+    At most ``max_size`` contexts exist at once; further callers queue until
+    one is released or ``acquire_timeout`` passes. Released contexts are
+    parked on ``about:blank`` with their cookies and permissions cleared,
+    and every origin the lease loaded (iframes included) has all of its
+    storage wiped through the DevTools protocol: local and session
+    storage, IndexedDB, Cache Storage and service workers. That needs
+    Chromium; on other browsers a context that loaded any page is
+    recycled instead. A context is also closed and replaced after
+    ``max_uses`` leases, when its page or browser crashes, or when
+    resetting it fails.
+    """
+
+    def __init__(
+        self,
+        browser_factory: Callable[[], Awaitable[Browser]],
+        max_size: int = 4,
+        max_uses: int = 50,
+        acquire_timeout: float = 30.0,
+        context_options: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            browser_factory: Coroutine function returning a connected browser
+            max_size: Maximum number of contexts alive at once
+            max_uses: Leases after which a context is recycled
+            acquire_timeout: Seconds a caller waits for a free context
+            context_options: Extra options for ``browser.new_context``
+        """
+        self.browser_factory = browser_factory
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.acquire_timeout = acquire_timeout
+        self.context_options = context_options or {}
+        self._idle: Deque[PooledContext] = deque()
+        self._leased: Set[PooledContext] = set()
+        self._slots = asyncio.Semaphore(max_size)
+        self._stats = PoolStats()
+        self._in_use = 0
+        self._size = 0
+
+    @property
+    def stats(self) -> PoolStats:
+        """Current pool metrics."""
+        self._stats.size = self._size
+        self._stats.in_use = self._in_use
+        self._stats.idle = len(self._idle)
+        return self._stats
+
+    async def _create(self) -> PooledContext:
+        browser = await self.browser_factory()
+        context = await browser.new_context(**self.context_options)
+        try:
+            page = await context.new_page()
+        except Exception:
+            await context.close()
+            raise
+        self._size += 1
+        self._stats.created += 1
+        return PooledContext(browser, context, page)
+
+    async def _discard(self, item: PooledContext) -> None:
+        self._size -= 1
+        self._stats.recycled += 1
+        try:
+            await item.context.close()
+        except Exception:
+            pass
+
+    async def _reset(self, item: PooledContext) -> bool:
+        """Clear state left by the previous lease; False if the context must be recycled."""
+        try:
+            # Leave the page first so its scripts cannot write storage back
+            await item.page.goto("about:blank")
+            if item.origins:
+                # Chromium only; other browsers raise and the context is recycled
+                session = await item.context.new_cdp_session(item.page)
+                try:
+                    for origin in item.origins:
+                        await session.send(
+                            "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+                        )
+                finally:
+                    await session.detach()
+                item.origins.clear()
+            await item.context.clear_cookies()
+            await item.context.clear_permissions()
+        except Exception:
+            return False
+        return True
+
+    async def acquire(self, viewport: Optional[Dict[str, int]] = None) -> PooledContext:
+        """
+        Lease a context, waiting for a free slot if the pool is exhausted.
+
+        Args:
+            viewport: Optional viewport size to apply to the page
+
+        Returns:
+            Pooled context; pass it back to ``release``
+
+        Raises:
+            TimeoutError: If no context became free within ``acquire_timeout``
+        """
+        start = time.perf_counter()
+        self._stats.waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self._stats.timeouts += 1
+            raise TimeoutError(
+                f"No browser context became free within {self.acquire_timeout} seconds"
+            ) from None
+        finally:
+            self._stats.waiting -= 1
+
+        try:
+            item = None
+            while self._idle:
+                candidate = self._idle.popleft()
+                if candidate.healthy:
+                    item = candidate
+                    break
+                await self._discard(candidate)
+            if item is None:
+                item = await self._create()
+            if viewport:
+                await item.page.set_viewport_size(
+                    ViewportSize(width=viewport["width"], height=viewport["height"])
+                )
+        except BaseException:
+            self._slots.release()
+            raise
+
+        waited = time.perf_counter() - start
+        self._stats.acquired += 1
+        self._stats.total_wait_time += waited
+        self._stats.max_wait_time = max(self._stats.max_wait_time, waited)
+        item.uses += 1
+        self._in_use += 1
+        self._leased.add(item)
+        return item
+
+    async def release(self, item: PooledContext, discard: bool = False) -> None:
+        """
+        Return a leased context to the pool.
+
+        Args:
+            item: Context returned by ``acquire``
+            discard: Close the context instead of reusing it
+        """
+        self._in_use -= 1
+        self._leased.discard(item)
+        try:
+            if discard or not item.healthy or item.uses >= self.max_uses:
+                await self._discard(item)
+            elif await self._reset(item):
+                self._idle.append(item)
+            else:
+                await self._discard(item)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def page(self, viewport: Optional[Dict[str, int]] = None) -> AsyncIterator[Page]:
+        """
+        Lease a page for the duration of an ``async with`` block.
+
+        Args:
+            viewport: Optional viewport size to apply to the page
+
+        Yields:
+            Playwright page from a pooled context
+        """
+        item = await self.acquire(viewport)
+        try:
+            yield item.page
+        finally:
+            await self.release(item)
+
+    async def warm(self, count: int) -> int:
+        """
+        Pre-create idle contexts so the first captures skip context setup.
+
+        Args:
+            count: Number of idle contexts wanted (capped by ``max_size``)
+
+        Returns:
+            Number of contexts created
+        """
+        created = 0
+        while len(self._idle) < count and self._size < self.max_size:
+            self._idle.append(await self._create())
+            created += 1
+        return created
+
+    async def retire(self, browser: Browser) -> int:
+        """
+        Stop using contexts of a browser that is being replaced.
+
+        Idle contexts are closed now; leased ones are closed when released.
+
+        Args:
+            browser: Browser whose contexts should be dropped
+
+        Returns:
+            Number of contexts of that browser still leased
+        """
+        for item in list(self._idle):
+            if item.browser is browser:
+                self._idle.remove(item)
+                await self._discard(item)
+        leased = [item for item in self._leased if item.browser is browser]
+        for item in leased:
+            item.retired = True
+        return len(leased)
+
+    def leased_count(self, browser: Optional[Browser] = None) -> int:
+        """Number of leased contexts, optionally only those of one browser."""
+        return sum(1 for item in self._leased if browser is None or item.browser is browser)
+
+    async def close(self) -> None:
+        """Close every idle context; leased contexts are closed when released."""
+        while self._idle:
+            await self._discard(self._idle.popleft())
@@ -1,10 +1,76 @@
 """Playwright adapter for Screenshotter port."""
-from typing import Optional, Any, Literal, Dict, Union
+from typing import Optional, Any, AsyncIterator, Callable, Literal, Dict, List, Tuple, Union
+from contextlib import asynccontextmanager
 from pathlib import Path
 import os
 import asyncio
-from playwright.async_api import async_playwright, Browser, Page, Playwright
-from ...core.ports.screenshotter import Screenshotter
+import time
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    FloatRect,
+    Page,
+    Playwright,
+    ViewportSize,
+)
+from ...core.ports.screenshotter import VIEWPORT_PRESETS, Screenshotter
+from ...utils.files import save_file
+from .playwright_health import BrowserHealth, browser_memory_mb, psutil
+from .playwright_interception import (
+    CaptureReport,
+    InterceptionProfile,
+    LoadState,
+    NetworkMonitor,
+    get_profile,
+)
+from .playwright_pool import BrowserContextPool, PoolStats
+from .screenshot_tiles import (
+    MAX_SINGLE_SHOT_HEIGHT,
+    PAGE_HEIGHT_SCRIPT,
+    PILLOW_AVAILABLE,
+    stitch_tiles,
+    tile_clips,
+)
+
+# Capture options consumed by the adapter rather than passed to page.screenshot
+CAPTURE_OPTIONS = ("wait_after_load", "profile", "on_report", "tile_height", "max_height")
+
+# Resolves once the browser has laid out and painted after a viewport change
+RELAYOUT_SCRIPT = "() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))"
+
+# Keeps fixed and sticky elements (headers, cookie bars, chat buttons) from
+# repeating in every tile: fixed ones are hidden and sticky ones are put back
+# into the normal flow, where the first tiles capture them once
+UNPIN_SCRIPT = """() => {
+    window.__unpinned = [];
+    for (const el of document.querySelectorAll("body *")) {
+        const position = getComputedStyle(el).position;
+        if (position !== "fixed" && position !== "sticky") continue;
+        window.__unpinned.push([el, el.style.visibility, el.style.position]);
+        if (position === "fixed") el.style.visibility = "hidden";
+        else el.style.position = "static";
+    }
+}"""
+
+RESTORE_PINNED_SCRIPT = """() => {
+    for (const [el, visibility, position] of window.__unpinned || []) {
+        el.style.visibility = visibility;
+        el.style.position = position;
+    }
+    delete window.__unpinned;
+}"""
+
+
+def _resolve_viewport(viewport: Union[str, Dict[str, Any]]) -> Tuple[str, Dict[str, int]]:
+    """Return the result key and size for a capture_multi viewport spec."""
+    if isinstance(viewport, str):
+        if viewport not in VIEWPORT_PRESETS:
+            raise ValueError(
+                f"Unknown viewport '{viewport}'. Choose from: {', '.join(VIEWPORT_PRESETS)}"
+            )
+        return viewport, VIEWPORT_PRESETS[viewport]
+    size = {"width": int(viewport["width"]), "height": int(viewport["height"])}
+    return str(viewport.get("name") or f"{size['width']}x{size['height']}"), size
 
 
 class PlaywrightScreenshotterAdapter:
@@ -14,21 +80,110 @@ class PlaywrightScreenshotterAdapter:
         self,
         browser_type: str = "chromium",
         headless: bool = True,
-        default_viewport_size: Dict[str, int] = None,
+        default_viewport_size: Optional[Dict[str, int]] = None,
+        pool_size: int = 4,
+        max_context_uses: int = 50,
+        acquire_timeout: float = 30.0,
+        profile: Union[str, InterceptionProfile] = "faithful",
+        on_report: Optional[Callable[[CaptureReport], Any]] = None,
+        tile_height: int = 4096,
+        max_page_height: int = 20000,
+        warm_contexts: int = 1,
+        health_check_interval: Optional[float] = 30.0,
+        max_browser_memory_mb: Optional[float] = None,
     ):
         """
         Initialize the Playwright screenshotter adapter.
 
+        Captures run on pages leased from a bounded pool of browser contexts,
+        so at most ``pool_size`` pages are open at once and contexts are
+        reused (with cookies and storage reset) instead of being created for
+        every call.
+
+        The interception ``profile`` decides which requests are blocked and
+        how the adapter waits for the page to settle: "fast" blocks trackers,
+        fonts and media and settles shortly after DOMContentLoaded, while
+        "faithful" blocks nothing. Both replace ``networkidle`` with a
+        bounded network-quiet wait unless ``wait_until`` is passed explicitly.
+
+        Full-page captures of pages taller than the browser can render in
+        one shot (``MAX_SINGLE_SHOT_HEIGHT``) are taken as scroll-and-clip
+        tiles of at most ``tile_height`` pixels and stitched (with Pillow),
+        so very tall pages succeed on the first navigation; anything past
+        ``max_page_height`` is cut off. Fixed elements are shown in the
+        first tile only and sticky ones at their place in the page, rather
+        than repeating in every tile. Without Pillow a single shot is
+        clipped to the browser's safe capture height instead.
+
+        ``start()`` launches the browser, pre-creates ``warm_contexts``
+        contexts and starts a supervisor that checks the browser every
+        ``health_check_interval`` seconds, relaunching it when it has died,
+        stopped responding or (with psutil) grown past
+        ``max_browser_memory_mb``. Without ``start()`` the browser is
+        launched lazily by the first capture, unsupervised.
+
         Args:
             browser_type: Browser to use ('chromium', 'firefox', or 'webkit')
             headless: Whether to run the browser in headless mode
             default_viewport_size: Default viewport size
+            pool_size: Maximum number of concurrent browser contexts
+            max_context_uses: Captures after which a context is recycled
+            acquire_timeout: Seconds a capture waits for a free context
+            profile: Default interception profile name or instance
+            on_report: Callback receiving a CaptureReport after every capture
+            tile_height: Maximum height of one full-page tile in CSS pixels
+                (for pages too tall for a single shot)
+            max_page_height: Full-page captures stop at this height
+            warm_contexts: Contexts created ahead of traffic by ``start()``
+            health_check_interval: Seconds between health checks (None disables them)
+            max_browser_memory_mb: Browser RSS that forces a restart (requires psutil)
         """
+        if max_browser_memory_mb is not None and psutil is None:
+            raise ImportError(
+                "max_browser_memory_mb requires psutil. "
+                "Install it with: pip install 'framework_hexagonal[playwright]'"
+            )
         self.browser_type = browser_type
         self.headless = headless
         self.default_viewport_size = default_viewport_size or {"width": 1280, "height": 800}
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
+        self._launch_lock = asyncio.Lock()
+        self.pool = BrowserContextPool(
+            self._ensure_browser,
+            max_size=pool_size,
+            max_uses=max_context_uses,
+            acquire_timeout=acquire_timeout,
+        )
+        self.profile = get_profile(profile)
+        self.on_report = on_report
+        self.tile_height = tile_height
+        self.max_page_height = max_page_height
+        self.warm_contexts = warm_contexts
+        self.health_check_interval = health_check_interval
+        self.max_browser_memory_mb = max_browser_memory_mb
+        self.health = BrowserHealth()
+        self._supervisor: Optional["asyncio.Task[None]"] = None
+        self._restart_lock = asyncio.Lock()
+
+    async def _launch_browser(self) -> Browser:
+        """
+        Launch a new browser instance.
+
+        Returns:
+            Playwright browser instance
+        """
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        browser_types = {
+            "chromium": self._playwright.chromium,
+            "firefox": self._playwright.firefox,
+            "webkit": self._playwright.webkit,
+        }
+
+        launcher = browser_types.get(self.browser_type, self._playwright.chromium)
+        return await launcher.launch(headless=self.headless)
 
     async def _ensure_browser(self) -> Browser:
         """
@@ -37,21 +192,216 @@ class PlaywrightScreenshotterAdapter:
         Returns:
             Playwright browser instance
         """
-        if self._browser is None or not self._browser.is_connected():
-            if self._playwright is None:
-                self._playwright = await async_playwright().start()
-            
-            browser_types = {
-                "chromium": self._playwright.chromium,
-                "firefox": self._playwright.firefox,
-                "webkit": self._playwright.webkit,
-            }
-            
-            launcher = browser_types.get(self.browser_type, self._playwright.chromium)
-            self._browser = await launcher.launch(headless=self.headless)
-            
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                self._browser = await self._launch_browser()
+
         return self._browser
 
+    async def start(self) -> None:
+        """
+        Launch the browser, warm the context pool and start health supervision.
+
+        Call from application startup so the first capture does not pay
+        for launching the browser.
+        """
+        await self._ensure_browser()
+        await self.pool.warm(self.warm_contexts)
+        if self.health_check_interval and self._supervisor is None:
+            self._supervisor = asyncio.create_task(self._supervise())
+        self.health.started = True
+
+    async def _supervise(self) -> None:
+        """Run health checks until cancelled."""
+        while True:
+            await asyncio.sleep(self.health_check_interval)  # type: ignore[arg-type]
+            try:
+                await self.check_health()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.health.last_error = repr(e)
+
+    async def check_health(self, probe_timeout: float = 10.0) -> None:
+        """
+        Check the browser once and restart it if needed.
+
+        The browser is restarted when it has disconnected, cannot open a
+        context within ``probe_timeout`` seconds, or uses more memory than
+        ``max_browser_memory_mb``.
+
+        Args:
+            probe_timeout: Seconds allowed for the liveness probe
+        """
+        self.health.checks += 1
+        browser = self._browser
+        if browser is None or not browser.is_connected():
+            await self.restart("disconnected")
+            return
+
+        try:
+            context = await asyncio.wait_for(browser.new_context(), probe_timeout)
+            await context.close()
+        except Exception as e:
+            self.health.last_error = repr(e)
+            await self.restart("unresponsive")
+            return
+
+        if self.max_browser_memory_mb is not None:
+            memory = await asyncio.to_thread(browser_memory_mb, self.browser_type)
+            self.health.browser_memory_mb = memory
+            if memory > self.max_browser_memory_mb:
+                await self.restart("memory")
+
+    async def restart(self, reason: str = "manual", drain_timeout: float = 30.0) -> None:
+        """
+        Replace the browser with a fresh one.
+
+        New captures use the new browser straight away; captures still
+        running on the old one get up to ``drain_timeout`` seconds to
+        finish before it is closed.
+
+        Args:
+            reason: Why the browser is restarted (recorded in ``health``)
+            drain_timeout: Seconds to wait for in-flight captures on the old browser
+        """
+        async with self._restart_lock:
+            old = self._browser
+            new = await self._launch_browser()
+            async with self._launch_lock:
+                self._browser = new
+            self.health.restarts += 1
+            self.health.last_restart_reason = reason
+
+            if old is not None:
+                await self.pool.retire(old)
+                deadline = time.monotonic() + drain_timeout
+                while self.pool.leased_count(old) and time.monotonic() < deadline:
+                    await asyncio.sleep(0.1)
+                try:
+                    await old.close()
+                except Exception:
+                    pass
+            await self.pool.warm(self.warm_contexts)
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        """Browser context pool metrics (in use, idle, wait times)."""
+        return self.pool.stats
+
+    @asynccontextmanager
+    async def _open_page(
+        self,
+        url: str,
+        viewport: Dict[str, int],
+        wait_until: Optional[LoadState],
+        timeout: float,
+        options: Dict[str, Any],
+    ) -> AsyncIterator[NetworkMonitor]:
+        """
+        Lease a pooled page, apply the interception profile and load the URL.
+
+        Args:
+            url: The URL to load
+            viewport: Viewport size
+            wait_until: Explicit load state, or None to use the profile's settle strategy
+            timeout: Navigation timeout in seconds
+            options: Capture kwargs ('profile', 'on_report', 'wait_after_load')
+
+        Yields:
+            Monitor of the loaded page (the page itself is ``monitor.page``)
+        """
+        profile = get_profile(options.get("profile") or self.profile)
+        on_report = options.get("on_report") or self.on_report
+        report = CaptureReport(url=url, profile=profile.name)
+        start = time.perf_counter()
+        try:
+            async with self.pool.page(viewport=viewport) as page:
+                monitor = NetworkMonitor(page, profile, report)
+                await monitor.attach()
+                try:
+                    # Navigate to the URL
+                    await page.goto(
+                        url, wait_until=wait_until or profile.wait_until, timeout=timeout * 1000
+                    )
+                    report.navigation_time = time.perf_counter() - start
+                    if wait_until is None:
+                        report.settled_by = await monitor.settle()
+                    else:
+                        report.settled_by = wait_until
+                    report.settle_time = time.perf_counter() - start - report.navigation_time
+
+                    # Allow extra time for any animations or dynamic content
+                    if options.get("wait_after_load"):
+                        await asyncio.sleep(options["wait_after_load"])
+
+                    yield monitor
+                finally:
+                    await monitor.detach()
+        finally:
+            report.total_time = time.perf_counter() - start
+            if on_report is not None:
+                on_report(report)
+
+    async def _capture_tiles(
+        self,
+        page: Page,
+        width: int,
+        tile_height: int,
+        max_height: int,
+        screenshot_options: Dict[str, Any],
+        single_shot_height: int = 0,
+    ) -> List[bytes]:
+        """
+        Capture the loaded page as vertically stacked clips.
+
+        Each tile is scrolled into view first so lazy-loaded content renders,
+        and only one tile's pixels are held by the browser at a time. After
+        the first tile, fixed elements are hidden and sticky ones unpinned
+        so they do not repeat in every tile. A page whose height cannot be
+        measured is captured as a single full-page shot.
+
+        Args:
+            page: Loaded page
+            width: Tile width in CSS pixels
+            tile_height: Maximum tile height
+            max_height: Page height at which capturing stops
+            screenshot_options: Extra page.screenshot options (type, quality, ...)
+            single_shot_height: Pages up to this height are captured in one
+                clip regardless of ``tile_height``
+
+        Returns:
+            Encoded tiles from top to bottom
+        """
+        try:
+            page_height = int(await page.evaluate(PAGE_HEIGHT_SCRIPT))
+        except Exception:
+            return [await page.screenshot(full_page=True, **screenshot_options)]
+        height = max(1, min(page_height, max_height))
+        if height <= single_shot_height:
+            tile_height = height
+        clips = [
+            FloatRect(x=clip["x"], y=clip["y"], width=clip["width"], height=clip["height"])
+            for clip in tile_clips(height, width, tile_height)
+        ]
+        if len(clips) == 1:
+            return [await page.screenshot(full_page=True, clip=clips[0], **screenshot_options)]
+
+        tiles = []
+        try:
+            for index, clip in enumerate(clips):
+                await page.evaluate("y => window.scrollTo(0, y)", clip["y"])
+                await page.evaluate(RELAYOUT_SCRIPT)
+                tiles.append(
+                    await page.screenshot(full_page=True, clip=clip, **screenshot_options)
+                )
+                if index == 0:
+                    await page.evaluate(UNPIN_SCRIPT)
+        finally:
+            await page.evaluate(RESTORE_PINNED_SCRIPT)
+            await page.evaluate("() => window.scrollTo(0, 0)")
+        return tiles
+
     async def capture(
         self,
         url: str,
@@ -60,7 +410,7 @@ class PlaywrightScreenshotterAdapter:
         width: int = 1280,
         height: int = 800,
         format: Literal["png", "jpeg"] = "png",
-        wait_until: Literal["load", "domcontentloaded", "networkidle"] = "networkidle",
+        wait_until: Optional[Literal["load", "domcontentloaded", "networkidle"]] = None,
         timeout: float = 30.0,
         **kwargs: Any,
     ) -> bytes:
@@ -74,49 +424,96 @@ class PlaywrightScreenshotterAdapter:
             width: Browser viewport width
             height: Browser viewport height
             format: Image format (png or jpeg)
-            wait_until: Page load state to wait for
+            wait_until: Page load state to wait for (None settles per the profile)
             timeout: Maximum time to wait for page load in seconds
-            **kwargs: Additional provider-specific parameters
+            **kwargs: Additional provider-specific parameters ('profile',
+                'on_report', 'wait_after_load', 'tile_height', 'max_height',
+                or page.screenshot options)
 
         Returns:
             Binary image data
         """
-        browser = await self._ensure_browser()
-        
-        # Use context to set viewport size
-        context = await browser.new_context(
-            viewport={"width": width, "height": height}
-        )
-        
-        try:
-            page = await context.new_page()
-            
-            # Navigate to the URL
-            await page.goto(url, wait_until=wait_until, timeout=timeout * 1000)
-            
-            # Allow extra time for any animations or dynamic content
-            if kwargs.get("wait_after_load"):
-                await asyncio.sleep(kwargs["wait_after_load"])
-            
+        viewport = {"width": width, "height": height}
+        async with self._open_page(url, viewport, wait_until, timeout, kwargs) as monitor:
+            page = monitor.page
             # Take the screenshot
             screenshot_options = {
-                "full_page": full_page,
                 "type": format,
-                **{k: v for k, v in kwargs.items() if k not in ["wait_after_load"]},
+                **{k: v for k, v in kwargs.items() if k not in CAPTURE_OPTIONS},
             }
-            
-            screenshot_bytes = await page.screenshot(**screenshot_options)
+
+            if full_page and "clip" not in screenshot_options:
+                max_height = kwargs.get("max_height", self.max_page_height)
+                if PILLOW_AVAILABLE:
+                    tile_height = kwargs.get("tile_height", self.tile_height)
+                else:
+                    # Nothing to stitch with: one shot, clipped to a height the browser can render
+                    max_height = tile_height = min(max_height, MAX_SINGLE_SHOT_HEIGHT)
+                tiles = await self._capture_tiles(
+                    page,
+                    width,
+                    tile_height,
+                    max_height,
+                    screenshot_options,
+                    single_shot_height=MAX_SINGLE_SHOT_HEIGHT,
+                )
+                if len(tiles) == 1:
+                    screenshot_bytes = tiles[0]
+                else:
+                    screenshot_bytes = await asyncio.to_thread(stitch_tiles, tiles, format)
+                del tiles
+            else:
+                screenshot_bytes = await page.screenshot(full_page=full_page, **screenshot_options)
             
             # Save to file if output path is provided
             if output_path:
-                path = Path(output_path)
-                path.parent.mkdir(parents=True, exist_ok=True)
-                with open(path, "wb") as f:
-                    f.write(screenshot_bytes)
+                await save_file(output_path, screenshot_bytes)
             
             return screenshot_bytes
-        finally:
-            await context.close()
+
+    async def capture_tiles(
+        self,
+        url: str,
+        tile_height: Optional[int] = None,
+        max_height: Optional[int] = None,
+        width: int = 1280,
+        height: int = 800,
+        format: Literal["png", "jpeg"] = "png",
+        wait_until: Optional[Literal["load", "domcontentloaded", "networkidle"]] = None,
+        timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> List[bytes]:
+        """
+        Capture a full page as separate tiles instead of one stitched image.
+
+        Args:
+            url: The URL to screenshot
+            tile_height: Maximum tile height (defaults to the adapter's)
+            max_height: Page height at which capturing stops (defaults to the adapter's)
+            width: Browser viewport width
+            height: Browser viewport height
+            format: Image format (png or jpeg)
+            wait_until: Page load state to wait for (None settles per the profile)
+            timeout: Maximum time to wait for page load in seconds
+            **kwargs: Additional provider-specific parameters ('profile',
+                'on_report', 'wait_after_load', or page.screenshot options)
+
+        Returns:
+            Encoded tiles from top to bottom
+        """
+        viewport = {"width": width, "height": height}
+        async with self._open_page(url, viewport, wait_until, timeout, kwargs) as monitor:
+            screenshot_options = {
+                "type": format,
+                **{k: v for k, v in kwargs.items() if k not in CAPTURE_OPTIONS},
+            }
+            return await self._capture_tiles(
+                monitor.page,
+                width,
+                tile_height or self.tile_height,
+                max_height or self.max_page_height,
+                screenshot_options,
+            )
 
     async def capture_element(
         self,
@@ -134,26 +531,20 @@ class PlaywrightScreenshotterAdapter:
             selector: CSS selector for the element to capture
             output_path: Optional path to save the screenshot
             format: Image format (png or jpeg)
-            **kwargs: Additional provider-specific parameters
+            **kwargs: Additional provider-specific parameters ('viewport',
+                'wait_until', 'timeout', 'profile', 'on_report')
 
         Returns:
             Binary image data
         """
-        browser = await self._ensure_browser()
-        context = await browser.new_context(
-            viewport=kwargs.get("viewport", self.default_viewport_size)
-        )
-        
-        try:
-            page = await context.new_page()
-            
-            # Navigate to the URL
-            wait_until = kwargs.get("wait_until", "networkidle")
-            timeout = kwargs.get("timeout", 30.0) * 1000
-            await page.goto(url, wait_until=wait_until, timeout=timeout)
-            
+        viewport = kwargs.get("viewport", self.default_viewport_size)
+        timeout = kwargs.get("timeout", 30.0)
+        async with self._open_page(
+            url, viewport, kwargs.get("wait_until"), timeout, kwargs
+        ) as monitor:
+            page = monitor.page
             # Wait for the element to be visible
-            element = await page.wait_for_selector(selector, timeout=timeout)
+            element = await page.wait_for_selector(selector, timeout=timeout * 1000)
             if not element:
                 raise ValueError(f"Element with selector '{selector}' not found")
             
@@ -163,17 +554,87 @@ class PlaywrightScreenshotterAdapter:
             
             # Save to file if output path is provided
             if output_path:
-                path = Path(output_path)
-                path.parent.mkdir(parents=True, exist_ok=True)
-                with open(path, "wb") as f:
-                    f.write(screenshot_bytes)
+                await save_file(output_path, screenshot_bytes)
             
             return screenshot_bytes
-        finally:
-            await context.close()
+
+    async def capture_multi(
+        self,
+        url: str,
+        viewports: Optional[List[Union[str, Dict[str, Any]]]] = None,
+        selectors: Optional[List[str]] = None,
+        full_page: bool = True,
+        format: Literal["png", "jpeg"] = "png",
+        wait_until: Optional[Literal["load", "domcontentloaded", "networkidle"]] = None,
+        timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> Dict[str, bytes]:
+        """
+        Capture several viewports and elements of a page from a single load.
+
+        The page is loaded once at the first viewport; element shots are
+        taken there, then the viewport is resized and the page re-laid out
+        (and briefly re-settled, for responsive images) for each further
+        size. Only the viewport size changes, so mobile user agents and
+        touch emulation are not applied.
+
+        Args:
+            url: The URL to screenshot
+            viewports: Preset names ('desktop', 'tablet', 'mobile') or
+                ``{"width", "height"}`` dicts with an optional "name";
+                defaults to all presets
+            selectors: CSS selectors of elements to capture at the first viewport
+            full_page: Whether viewport shots cover the full page
+            format: Image format (png or jpeg)
+            wait_until: Page load state to wait for (None settles per the profile)
+            timeout: Maximum time to wait for page load in seconds
+            **kwargs: Additional provider-specific parameters ('profile',
+                'on_report', 'wait_after_load', or page.screenshot options)
+
+        Returns:
+            Images keyed by viewport name ("<width>x<height>" for unnamed
+            sizes) and by selector; selectors matching nothing are omitted
+
+        Raises:
+            ValueError: If a viewport preset name is unknown
+        """
+        resolved = [_resolve_viewport(viewport) for viewport in viewports or list(VIEWPORT_PRESETS)]
+        screenshot_options = {k: v for k, v in kwargs.items() if k not in CAPTURE_OPTIONS}
+        images: Dict[str, bytes] = {}
+
+        async with self._open_page(url, resolved[0][1], wait_until, timeout, kwargs) as monitor:
+            page = monitor.page
+            for index, (name, size) in enumerate(resolved):
+                if index:
+                    await page.set_viewport_size(
+                        ViewportSize(width=size["width"], height=size["height"])
+                    )
+                    await page.evaluate(RELAYOUT_SCRIPT)
+                    if wait_until is None:
+                        await monitor.settle()
+                images[name] = await page.screenshot(
+                    full_page=full_page, type=format, **screenshot_options
+                )
+
+                if index == 0:
+                    for selector in selectors or []:
+                        element = await page.query_selector(selector)
+                        if element is not None:
+                            images[selector] = await element.screenshot(type=format)
+
+        return images
 
     async def close(self) -> None:
-        """Close browser and playwright resources."""
+        """Stop supervision and close pooled contexts, the browser and playwright resources."""
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            try:
+                await self._supervisor
+            except asyncio.CancelledError:
+                pass
+            self._supervisor = None
+        self.health.started = False
+        await self.pool.close()
         if self._browser:
             await self._browser.close()
             self._browser = None
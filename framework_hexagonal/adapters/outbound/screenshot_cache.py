@@ -0,0 +1,424 @@
+"""Content-addressed screenshot cache wrapped around any Screenshotter."""
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Union
+
+from ...core.ports.screenshotter import Screenshotter
+from ...utils.cache import LRUCache
+from ...utils.files import save_file, write_atomic
+
+# Capture options that do not change the rendered image
+UNKEYED_OPTIONS = ("output_path", "on_report", "cache")
+
+
+def cache_key(method: str, url: str, options: Dict[str, Any]) -> str:
+    """
+    Derive the cache key for a capture.
+
+    Args:
+        method: Screenshotter method name
+        url: Captured URL
+        options: Capture options (output paths and callbacks are ignored)
+
+    Returns:
+        Hex SHA-256 of the method, URL and remaining options
+    """
+    keyed = {k: v for k, v in options.items() if k not in UNKEYED_OPTIONS}
+    payload = json.dumps([method, url, keyed], sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ScreenshotEntry:
+    """Images from one capture; single-image captures use the key ''."""
+
+    images: Dict[str, bytes]
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def size(self) -> int:
+        """Total image bytes."""
+        return sum(len(image) for image in self.images.values())
+
+    def age(self, now: Optional[float] = None) -> float:
+        """Seconds since the entry was captured."""
+        return (now or time.time()) - self.stored_at
+
+
+@dataclass
+class ScreenshotCacheStats:
+    """Counters for verifying cache effectiveness."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stale_served: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    stored: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the counters as a dict."""
+        return asdict(self)
+
+
+class DiskScreenshotStore:
+    """
+    On-disk tier: images stored once by content hash, plus a small index per key.
+
+    Index files are touched on every read, so pruning by modification time
+    evicts the least recently used captures first; images no longer
+    referenced by any index are then deleted. Methods are blocking and are
+    meant to run in a worker thread.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize the disk store.
+
+        Args:
+            directory: Directory holding the cache (created if missing)
+            max_bytes: Total image bytes kept before pruning
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._index_dir = self.directory / "index"
+        self._blob_dir = self.directory / "blobs"
+        self._index_dir.mkdir(parents=True, exist_ok=True)
+        self._blob_dir.mkdir(parents=True, exist_ok=True)
+        self._total_bytes: Optional[int] = None
+
+    def _blob_bytes(self) -> int:
+        if self._total_bytes is None:
+            self._total_bytes = sum(p.stat().st_size for p in self._blob_dir.iterdir())
+        return self._total_bytes
+
+    def read(self, key: str) -> Optional[ScreenshotEntry]:
+        """Return the entry for a key, or None."""
+        index_path = self._index_dir / f"{key}.json"
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+            images = {
+                name: (self._blob_dir / digest).read_bytes()
+                for name, digest in index["images"].items()
+            }
+            os.utime(index_path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return ScreenshotEntry(images=images, stored_at=index["stored_at"])
+
+    def write(self, key: str, entry: ScreenshotEntry) -> None:
+        """Store an entry, pruning old captures when over ``max_bytes``."""
+        total = self._blob_bytes()
+        digests = {}
+        for name, image in entry.images.items():
+            digest = hashlib.sha256(image).hexdigest()
+            blob_path = self._blob_dir / digest
+            if not blob_path.exists():
+                write_atomic(blob_path, image)
+                total += len(image)
+            digests[name] = digest
+        index = {"stored_at": entry.stored_at, "images": digests}
+        write_atomic(self._index_dir / f"{key}.json", json.dumps(index).encode("utf-8"))
+        self._total_bytes = total
+        if total > self.max_bytes:
+            self.prune()
+
+    def delete(self, key: str) -> None:
+        """Remove a key's index; its images go on the next prune."""
+        (self._index_dir / f"{key}.json").unlink(missing_ok=True)
+
+    def prune(self) -> None:
+        """Evict least recently used captures until the images fit ``max_bytes``."""
+        indexes = sorted(self._index_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        references: Dict[str, List[str]] = {}
+        for path in indexes:
+            try:
+                references[path.name] = list(
+                    json.loads(path.read_text(encoding="utf-8"))["images"].values()
+                )
+            except (OSError, ValueError, KeyError):
+                path.unlink(missing_ok=True)
+
+        sizes = {
+            p.name: p.stat().st_size
+            for p in self._blob_dir.iterdir()
+            if not p.name.endswith(".tmp")
+        }
+        refcounts = Counter(digest for digests in references.values() for digest in set(digests))
+        total = sum(size for digest, size in sizes.items() if refcounts[digest])
+        for path in indexes:
+            if total <= self.max_bytes:
+                break
+            if path.name not in references:
+                continue
+            path.unlink(missing_ok=True)
+            for digest in set(references.pop(path.name)):
+                refcounts[digest] -= 1
+                if not refcounts[digest]:
+                    total -= sizes.get(digest, 0)
+
+        for digest in sizes:
+            if not refcounts[digest]:
+                (self._blob_dir / digest).unlink(missing_ok=True)
+        self._total_bytes = total
+
+
+class CachedScreenshotterAdapter:
+    """
+    Screenshotter decorator that caches captures in memory and on disk.
+
+    Entries are keyed by method, URL and every option that affects the
+    image. Within ``ttl`` a cached capture is returned directly; up to
+    ``stale_ttl`` seconds after that the stale capture is returned at once
+    while a single background capture refreshes it. Concurrent misses for
+    the same key share one capture. Pass ``cache=False`` to force a fresh
+    capture, which then replaces the cached one.
+    """
+
+    def __init__(
+        self,
+        screenshotter: Screenshotter,
+        ttl: float = 15 * 60,
+        stale_ttl: float = 24 * 60 * 60,
+        max_memory_items: int = 256,
+        max_memory_bytes: int = 128 * 1024 * 1024,
+        directory: Optional[Union[str, Path]] = None,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            screenshotter: Screenshotter that performs the captures
+            ttl: Seconds a capture is served without refreshing
+            stale_ttl: Further seconds a capture may be served while refreshing
+            max_memory_items: Maximum captures in the memory tier
+            max_memory_bytes: Maximum image bytes in the memory tier
+            directory: Directory for the disk tier (None disables it)
+            max_disk_bytes: Maximum image bytes in the disk tier
+        """
+        self.screenshotter = screenshotter
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.stats = ScreenshotCacheStats()
+        self._memory: LRUCache[str, ScreenshotEntry] = LRUCache(
+            max_items=max_memory_items,
+            max_bytes=max_memory_bytes,
+            size_of=lambda entry: entry.size,
+        )
+        self._disk = DiskScreenshotStore(directory, max_disk_bytes) if directory else None
+        self._inflight: Dict[str, "asyncio.Task[ScreenshotEntry]"] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped adapter's extras (pool_stats, ...)
+        if name == "screenshotter":
+            raise AttributeError(name)
+        return getattr(self.screenshotter, name)
+
+    async def _lookup(self, key: str) -> Optional[ScreenshotEntry]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            self.stats.memory_hits += 1
+            return entry
+        if self._disk is not None:
+            entry = await asyncio.to_thread(self._disk.read, key)
+            if entry is not None:
+                self.stats.disk_hits += 1
+                self._memory.set(key, entry)
+                return entry
+        return None
+
+    async def _store(self, key: str, entry: ScreenshotEntry) -> None:
+        self._memory.set(key, entry)
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk.write, key, entry)
+        self.stats.stored += 1
+
+    def _render(
+        self, key: str, render: Callable[[], Awaitable[Dict[str, bytes]]]
+    ) -> "asyncio.Task[ScreenshotEntry]":
+        """Start (or join) the capture for a key."""
+        task = self._inflight.get(key)
+        if task is None:
+            async def run() -> ScreenshotEntry:
+                try:
+                    entry = ScreenshotEntry(images=await render())
+                    await self._store(key, entry)
+                    return entry
+                finally:
+                    self._inflight.pop(key, None)
+
+            task = self._inflight[key] = asyncio.ensure_future(run())
+        return task
+
+    def _on_refreshed(self, task: "asyncio.Task[ScreenshotEntry]") -> None:
+        if task.cancelled() or task.exception() is not None:
+            self.stats.refresh_errors += 1
+
+    async def _get(
+        self,
+        key: str,
+        render: Callable[[], Awaitable[Dict[str, bytes]]],
+        use_cache: bool,
+    ) -> Dict[str, bytes]:
+        entry = await self._lookup(key) if use_cache else None
+        if entry is not None:
+            age = entry.age()
+            if age < self.ttl:
+                return entry.images
+            if age < self.ttl + self.stale_ttl:
+                self.stats.stale_served += 1
+                if key not in self._inflight:
+                    self.stats.refreshes += 1
+                    self._render(key, render).add_done_callback(self._on_refreshed)
+                return entry.images
+
+        self.stats.misses += 1
+        # shield: a cancelled caller must not cancel a capture others may be waiting on
+        entry = await asyncio.shield(self._render(key, render))
+        return entry.images
+
+    @staticmethod
+    async def _save(output_path: Optional[Union[str, Path]], image: bytes) -> None:
+        if output_path:
+            await save_file(output_path, image)
+
+    async def capture(
+        self,
+        url: str,
+        output_path: Optional[Union[str, Path]] = None,
+        full_page: bool = True,
+        width: int = 1280,
+        height: int = 800,
+        format: Literal["png", "jpeg"] = "png",
+        wait_until: Optional[Literal["load", "domcontentloaded", "networkidle"]] = None,
+        timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> bytes:
+        """
+        Capture a screenshot of a web page, serving it from cache when possible.
+
+        Args:
+            url: The URL to screenshot
+            output_path: Optional path to save the screenshot
+            full_page: Whether to capture the full page or just the viewport
+            width: Browser viewport width
+            height: Browser viewport height
+            format: Image format (png or jpeg)
+            wait_until: Page load state to wait for
+            timeout: Maximum time to wait for page load in seconds
+            **kwargs: Additional provider-specific parameters; ``cache=False``
+                skips the lookup
+
+        Returns:
+            Binary image data
+        """
+        use_cache = kwargs.pop("cache", True)
+        options: Dict[str, Any] = dict(
+            full_page=full_page, width=width, height=height, format=format,
+            timeout=timeout, **kwargs,
+        )
+        if wait_until is not None:
+            options["wait_until"] = wait_until
+
+        async def render() -> Dict[str, bytes]:
+            return {"": await self.screenshotter.capture(url, **options)}
+
+        images = await self._get(cache_key("capture", url, options), render, use_cache)
+        await self._save(output_path, images[""])
+        return images[""]
+
+    async def capture_element(
+        self,
+        url: str,
+        selector: str,
+        output_path: Optional[Union[str, Path]] = None,
+        format: Literal["png", "jpeg"] = "png",
+        **kwargs: Any,
+    ) -> bytes:
+        """
+        Capture a screenshot of a specific element, serving it from cache when possible.
+
+        Args:
+            url: The URL to screenshot
+            selector: CSS selector for the element to capture
+            output_path: Optional path to save the screenshot
+            format: Image format (png or jpeg)
+            **kwargs: Additional provider-specific parameters; ``cache=False``
+                skips the lookup
+
+        Returns:
+            Binary image data
+        """
+        use_cache = kwargs.pop("cache", True)
+        options: Dict[str, Any] = dict(selector=selector, format=format, **kwargs)
+
+        async def render() -> Dict[str, bytes]:
+            return {"": await self.screenshotter.capture_element(url, **options)}
+
+        images = await self._get(cache_key("capture_element", url, options), render, use_cache)
+        await self._save(output_path, images[""])
+        return images[""]
+
+    async def capture_multi(
+        self,
+        url: str,
+        viewports: Optional[List[Union[str, Dict[str, Any]]]] = None,
+        selectors: Optional[List[str]] = None,
+        full_page: bool = True,
+        format: Literal["png", "jpeg"] = "png",
+        wait_until: Optional[Literal["load", "domcontentloaded", "networkidle"]] = None,
+        timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> Dict[str, bytes]:
+        """
+        Capture several viewports and elements, serving them from cache when possible.
+
+        Args:
+            url: The URL to screenshot
+            viewports: Preset names or ``{"width", "height"}`` dicts
+            selectors: CSS selectors of elements to capture
+            full_page: Whether viewport shots cover the full page
+            format: Image format (png or jpeg)
+            wait_until: Page load state to wait for
+            timeout: Maximum time to wait for page load in seconds
+            **kwargs: Additional provider-specific parameters; ``cache=False``
+                skips the lookup
+
+        Returns:
+            Images keyed by viewport name and selector
+        """
+        use_cache = kwargs.pop("cache", True)
+        options: Dict[str, Any] = dict(
+            viewports=viewports, selectors=selectors, full_page=full_page,
+            format=format, timeout=timeout, **kwargs,
+        )
+        if wait_until is not None:
+            options["wait_until"] = wait_until
+
+        async def render() -> Dict[str, bytes]:
+            return await self.screenshotter.capture_multi(url, **options)
+
+        images = await self._get(cache_key("capture_multi", url, options), render, use_cache)
+        return dict(images)
+
+    async def start(self) -> None:
+        """Start the wrapped screenshotter."""
+        start = getattr(self.screenshotter, "start", None)
+        if start is not None:
+            await start()
+
+    async def close(self) -> None:
+        """Cancel background refreshes and close the wrapped screenshotter."""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        close = getattr(self.screenshotter, "close", None)
+        if close is not None:
+            await close()
@@ -0,0 +1,459 @@
+"""Out-of-process Screenshotter: a farm of worker processes, each with its own browser."""
+import asyncio
+import itertools
+import multiprocessing
+import pickle
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Union
+
+from ...core.ports.screenshotter import Screenshotter
+from ...utils.files import save_file
+from .playwright_screenshot import PlaywrightScreenshotterAdapter
+
+# Options that cannot cross the process boundary or are handled by the parent
+LOCAL_OPTIONS = ("output_path", "on_report")
+
+# (name, offset, length) of each image inside a shared memory block
+Manifest = List[Tuple[str, int, int]]
+
+
+def _to_shared_memory(images: Dict[str, bytes]) -> Tuple[str, Manifest]:
+    """Copy images into a new shared memory block; the reader unlinks it."""
+    block = SharedMemory(create=True, size=max(1, sum(len(data) for data in images.values())))
+    buffer = block.buf
+    assert buffer is not None
+    manifest: Manifest = []
+    offset = 0
+    for name, data in images.items():
+        buffer[offset:offset + len(data)] = data
+        manifest.append((name, offset, len(data)))
+        offset += len(data)
+    name = block.name
+    block.close()
+    return name, manifest
+
+
+def _from_shared_memory(name: str, manifest: Manifest) -> Dict[str, bytes]:
+    """Read images out of a shared memory block and release it."""
+    block = SharedMemory(name=name)
+    buffer = block.buf
+    assert buffer is not None
+    try:
+        return {key: bytes(buffer[offset:offset + length]) for key, offset, length in manifest}
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _portable_error(error: BaseException) -> BaseException:
+    """Return the exception itself if it survives pickling, else a RuntimeError copy."""
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+async def _serve(
+    index: int,
+    factory: Callable[[], Screenshotter],
+    requests: Any,
+    responses: Any,
+    concurrency: int,
+) -> None:
+    screenshotter = factory()
+    start = getattr(screenshotter, "start", None)
+    if start is not None:
+        await start()
+
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(concurrency)
+    tasks = set()
+
+    async def handle(request_id: int, method: str, url: str, options: Dict[str, Any]) -> None:
+        try:
+            result = await getattr(screenshotter, method)(url, **options)
+            images = result if isinstance(result, dict) else {"": result}
+            name, manifest = _to_shared_memory(images)
+            responses.put((index, request_id, name, manifest, None))
+        except Exception as e:
+            responses.put((index, request_id, None, None, _portable_error(e)))
+        finally:
+            slots.release()
+
+    try:
+        while True:
+            message = await loop.run_in_executor(None, requests.get)
+            if message is None:
+                break
+            await slots.acquire()
+            task = asyncio.create_task(handle(*message))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    finally:
+        await asyncio.gather(*tasks, return_exceptions=True)
+        close = getattr(screenshotter, "close", None)
+        if close is not None:
+            await close()
+
+
+def _worker_main(
+    index: int,
+    factory: Callable[[], Screenshotter],
+    requests: Any,
+    responses: Any,
+    concurrency: int,
+) -> None:
+    """Entry point of a worker process."""
+    asyncio.run(_serve(index, factory, requests, responses, concurrency))
+
+
+@dataclass
+class WorkerStats:
+    """Load and throughput of one worker process."""
+
+    index: int
+    pid: Optional[int] = None
+    in_flight: int = 0
+    completed: int = 0
+    failed: int = 0
+    restarts: int = 0
+    average_latency: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the stats as a dict."""
+        return asdict(self)
+
+
+class ScreenshotFarmAdapter:
+    """
+    Screenshotter that runs captures in a farm of worker processes.
+
+    Each worker process owns a screenshotter (by default a
+    PlaywrightScreenshotterAdapter, so one browser per worker) and its own
+    event loop, keeping browser driver traffic off the caller's loop.
+    Requests go to the worker with the fewest captures in flight, ties
+    broken by lower average latency. Images come back through shared
+    memory blocks rather than being pickled through the result queue.
+    Worker liveness is checked continuously; a worker that dies is
+    restarted and its pending captures fail with RuntimeError. Captures
+    that get no answer within ``call_timeout`` fail with TimeoutError.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        screenshotter_factory: Callable[[], Screenshotter] = PlaywrightScreenshotterAdapter,
+        concurrency_per_worker: int = 4,
+        start_method: str = "spawn",
+        call_timeout: Optional[float] = 120.0,
+    ):
+        """
+        Initialize the screenshot farm.
+
+        Args:
+            workers: Number of worker processes
+            screenshotter_factory: Picklable callable building each worker's
+                screenshotter, e.g.
+                ``functools.partial(PlaywrightScreenshotterAdapter, pool_size=2)``
+            concurrency_per_worker: Captures a worker runs at once
+            start_method: multiprocessing start method for workers
+            call_timeout: Seconds to wait for a worker's answer (None to wait forever)
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.screenshotter_factory = screenshotter_factory
+        self.concurrency_per_worker = concurrency_per_worker
+        self.call_timeout = call_timeout
+        self._context: Any = multiprocessing.get_context(start_method)
+        self._processes: List[Any] = []
+        self._requests: List[Any] = []
+        self._responses: Any = None
+        self._stats = [WorkerStats(index=i) for i in range(workers)]
+        self._pending: Dict[int, Tuple[int, float, "asyncio.Future[Dict[str, bytes]]"]] = {}
+        self._ids = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reader: Optional[threading.Thread] = None
+        self._running = False
+        # Set while close waits for the workers, so their exits are not taken for crashes
+        self._closing = False
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def stats(self) -> List[WorkerStats]:
+        """Per-worker load and throughput."""
+        return self._stats
+
+    def _spawn(self, index: int) -> None:
+        process = self._context.Process(
+            target=_worker_main,
+            args=(
+                index,
+                self.screenshotter_factory,
+                self._requests[index],
+                self._responses,
+                self.concurrency_per_worker,
+            ),
+            name=f"screenshot-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        self._processes[index] = process
+        self._stats[index].pid = process.pid
+
+    async def start(self) -> None:
+        """Start the worker processes and the result reader."""
+        async with self._start_lock:
+            if self._running:
+                return
+            self._loop = asyncio.get_running_loop()
+            self._responses = self._context.Queue()
+            self._requests = [self._context.Queue() for _ in range(self.workers)]
+            self._processes = [None] * self.workers
+            for index in range(self.workers):
+                await asyncio.to_thread(self._spawn, index)
+            self._running = True
+            self._reader = threading.Thread(
+                target=self._read_responses, name="screenshot-farm-reader", daemon=True
+            )
+            self._reader.start()
+
+    def _read_responses(self) -> None:
+        """Reader thread: copy images out of shared memory, resolve futures, watch workers."""
+        loop = self._loop
+        assert loop is not None
+        reported: Set[int] = set()
+        while self._running:
+            # Checked on every iteration: a busy response queue must not hide a crash
+            for index, process in enumerate(list(self._processes)):
+                if process is None or id(process) in reported or process.is_alive():
+                    continue
+                reported.add(id(process))
+                loop.call_soon_threadsafe(self._restart_worker, index, process)
+            try:
+                index, request_id, name, manifest, error = self._responses.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                return
+
+            result: Any = error
+            if name is not None:
+                try:
+                    result = _from_shared_memory(name, manifest)
+                except Exception as e:
+                    result = e
+            loop.call_soon_threadsafe(self._resolve, index, request_id, result)
+
+    def _finish(self, index: int, started: float, ok: bool) -> None:
+        stats = self._stats[index]
+        stats.in_flight -= 1
+        if ok:
+            latency = time.perf_counter() - started
+            stats.completed += 1
+            stats.average_latency = (
+                latency if stats.completed == 1 else stats.average_latency * 0.8 + latency * 0.2
+            )
+        else:
+            stats.failed += 1
+
+    def _resolve(self, index: int, request_id: int, result: Any) -> None:
+        pending = self._pending.pop(request_id, None)
+        if pending is None:
+            return
+        _, started, future = pending
+        ok = not isinstance(result, BaseException)
+        self._finish(index, started, ok)
+        if not future.done():
+            if ok:
+                future.set_result(result)
+            else:
+                future.set_exception(result)
+
+    def _restart_worker(self, index: int, process: Any) -> None:
+        """Fail captures of a dead worker and start a replacement."""
+        if not self._running or self._closing or self._processes[index] is not process:
+            return
+        self._processes[index] = None
+        for request_id, (worker, started, future) in list(self._pending.items()):
+            if worker == index:
+                del self._pending[request_id]
+                self._finish(index, started, ok=False)
+                if not future.done():
+                    future.set_exception(RuntimeError(f"Screenshot worker {index} died"))
+        self._stats[index].restarts += 1
+        # Requests still queued for the dead worker are lost with it
+        self._requests[index] = self._context.Queue()
+        self._spawn(index)
+
+    def _pick_worker(self) -> int:
+        alive = [
+            index for index, process in enumerate(self._processes)
+            if process is not None and process.is_alive()
+        ]
+        if not alive:
+            raise RuntimeError("No screenshot worker is running")
+        return min(
+            alive,
+            key=lambda index: (self._stats[index].in_flight, self._stats[index].average_latency),
+        )
+
+    async def _call(self, method: str, url: str, options: Dict[str, Any]) -> Dict[str, bytes]:
+        if self._closing:
+            raise RuntimeError("Screenshot farm is closing")
+        if not self._running:
+            await self.start()
+        index = self._pick_worker()
+        request_id = next(self._ids)
+        future: "asyncio.Future[Dict[str, bytes]]" = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = (index, time.perf_counter(), future)
+        self._stats[index].in_flight += 1
+        remote = {k: v for k, v in options.items() if k not in LOCAL_OPTIONS}
+        self._requests[index].put((request_id, method, url, remote))
+        try:
+            return await asyncio.wait_for(future, self.call_timeout)
+        except asyncio.TimeoutError:
+            pending = self._pending.pop(request_id, None)
+            if pending is not None:
+                self._finish(index, pending[1], ok=False)
+            raise TimeoutError(
+                f"Screenshot worker {index} did not answer within {self.call_timeout} seconds"
+            )
+
+    @staticmethod
+    async def _save(output_path: Optional[Union[str, Path]], image: bytes) -> None:
+        if output_path:
+            await save_file(output_path, image)
+
+    async def capture(
+        self,
+        url: str,
+        output_path: Optional[Union[str, Path]] = None,
+        full_page: bool = True,
+        width: int = 1280,
+        height: int = 800,
+        format: Literal["png", "jpeg"] = "png",
+        wait_until: Optional[Literal["load", "domcontentloaded", "networkidle"]] = None,
+        timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> bytes:
+        """
+        Capture a screenshot of a web page in a worker process.
+
+        Args:
+            url: The URL to screenshot
+            output_path: Optional path to save the screenshot
+            full_page: Whether to capture the full page or just the viewport
+            width: Browser viewport width
+            height: Browser viewport height
+            format: Image format (png or jpeg)
+            wait_until: Page load state to wait for
+            timeout: Maximum time to wait for page load in seconds
+            **kwargs: Additional provider-specific parameters (must be picklable)
+
+        Returns:
+            Binary image data
+        """
+        options: Dict[str, Any] = dict(
+            full_page=full_page, width=width, height=height, format=format,
+            timeout=timeout, **kwargs,
+        )
+        if wait_until is not None:
+            options["wait_until"] = wait_until
+        image = (await self._call("capture", url, options))[""]
+        await self._save(output_path, image)
+        return image
+
+    async def capture_element(
+        self,
+        url: str,
+        selector: str,
+        output_path: Optional[Union[str, Path]] = None,
+        format: Literal["png", "jpeg"] = "png",
+        **kwargs: Any,
+    ) -> bytes:
+        """
+        Capture a screenshot of a specific element in a worker process.
+
+        Args:
+            url: The URL to screenshot
+            selector: CSS selector for the element to capture
+            output_path: Optional path to save the screenshot
+            format: Image format (png or jpeg)
+            **kwargs: Additional provider-specific parameters (must be picklable)
+
+        Returns:
+            Binary image data
+        """
+        options = dict(selector=selector, format=format, **kwargs)
+        image = (await self._call("capture_element", url, options))[""]
+        await self._save(output_path, image)
+        return image
+
+    async def capture_multi(
+        self,
+        url: str,
+        viewports: Optional[List[Union[str, Dict[str, Any]]]] = None,
+        selectors: Optional[List[str]] = None,
+        full_page: bool = True,
+        format: Literal["png", "jpeg"] = "png",
+        wait_until: Optional[Literal["load", "domcontentloaded", "networkidle"]] = None,
+        timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> Dict[str, bytes]:
+        """
+        Capture several viewports and elements of a page in a worker process.
+
+        Args:
+            url: The URL to screenshot
+            viewports: Preset names or ``{"width", "height"}`` dicts
+            selectors: CSS selectors of elements to capture
+            full_page: Whether viewport shots cover the full page
+            format: Image format (png or jpeg)
+            wait_until: Page load state to wait for
+            timeout: Maximum time to wait for page load in seconds
+            **kwargs: Additional provider-specific parameters (must be picklable)
+
+        Returns:
+            Images keyed by viewport name and selector
+        """
+        options: Dict[str, Any] = dict(
+            viewports=viewports, selectors=selectors, full_page=full_page,
+            format=format, timeout=timeout, **kwargs,
+        )
+        if wait_until is not None:
+            options["wait_until"] = wait_until
+        return await self._call("capture_multi", url, options)
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """
+        Stop the workers, letting in-flight captures finish.
+
+        Args:
+            timeout: Seconds to wait for each worker before terminating it
+        """
+        if not self._running:
+            return
+        self._closing = True
+        for requests in self._requests:
+            requests.put(None)
+        for process in self._processes:
+            if process is not None:
+                await asyncio.to_thread(process.join, timeout)
+                if process.is_alive():
+                    process.terminate()
+        self._running = False
+        self._closing = False
+        if self._reader is not None:
+            await asyncio.to_thread(self._reader.join, 1.0)
+            self._reader = None
+        for _, _, future in self._pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError("Screenshot farm closed"))
+        self._pending.clear()
@@ -0,0 +1,85 @@
+"""Tile layout and stitching for captures of very tall pages."""
+from io import BytesIO
+from typing import Dict, List, Sequence
+
+try:
+    from PIL import Image
+
+    PILLOW_AVAILABLE = True
+except ImportError:
+    PILLOW_AVAILABLE = False
+
+# Chromium fails (or returns blank images) for captures taller than its
+# maximum texture size, so single shots stay below this height
+MAX_SINGLE_SHOT_HEIGHT = 16384
+
+PAGE_HEIGHT_SCRIPT = """() => Math.max(
+    document.documentElement ? document.documentElement.scrollHeight : 0,
+    document.body ? document.body.scrollHeight : 0
+)"""
+
+
+def tile_clips(page_height: int, width: int, tile_height: int) -> List[Dict[str, int]]:
+    """
+    Split a page into horizontal clip rectangles.
+
+    Args:
+        page_height: Height to cover in CSS pixels (positive)
+        width: Clip width in CSS pixels
+        tile_height: Maximum height of each clip
+
+    Returns:
+        Clip rectangles (x, y, width, height) from top to bottom
+    """
+    if tile_height <= 0:
+        raise ValueError("tile_height must be positive")
+    return [
+        {"x": 0, "y": top, "width": width, "height": min(tile_height, page_height - top)}
+        for top in range(0, page_height, tile_height)
+    ]
+
+
+def stitch_tiles(tiles: Sequence[bytes], format: str = "png", quality: int = 85) -> bytes:
+    """
+    Stitch vertically stacked tiles into one image.
+
+    Tiles are decoded one at a time and pasted into the output canvas, so
+    peak memory is the canvas plus a single decoded tile.
+
+    Args:
+        tiles: Encoded tiles from top to bottom, all the same width
+        format: Output format ('png' or 'jpeg')
+        quality: JPEG quality
+
+    Returns:
+        Encoded stitched image
+
+    Raises:
+        ImportError: If Pillow is not installed
+    """
+    if not PILLOW_AVAILABLE:
+        raise ImportError(
+            "Stitching tiles requires Pillow. "
+            "Install it with: pip install 'framework_hexagonal[images]'"
+        )
+
+    sizes = []
+    for tile in tiles:
+        with Image.open(BytesIO(tile)) as image:
+            sizes.append(image.size)
+    width = max(size[0] for size in sizes)
+    canvas = Image.new("RGB", (width, sum(size[1] for size in sizes)), "white")
+
+    top = 0
+    for tile, (_, tile_height) in zip(tiles, sizes):
+        with Image.open(BytesIO(tile)) as image:
+            canvas.paste(image.convert("RGB"), (0, top))
+        top += tile_height
+
+    output = BytesIO()
+    if format == "jpeg":
+        canvas.save(output, format="JPEG", quality=quality, optimize=True)
+    else:
+        canvas.save(output, format="PNG")
+    canvas.close()
+    return output.getvalue()
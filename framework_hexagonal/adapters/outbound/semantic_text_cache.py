@@ -0,0 +1,121 @@
+"""Embedding-similarity response cache wrapped around any TextAI."""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ...core.ports.embeddings import Embeddings
+from ...core.ports.text_ai import TextAI
+from ...utils.files import save_file
+from ...utils.vector_index import VectorIndex
+from .text_ai_cache import CachedText, CachedTextAIAdapter, TextCacheStats, text_cache_key
+
+
+@dataclass
+class SemanticKey:
+    """Lookup state of one call: the exact-match group and the text compared by meaning."""
+
+    group: int
+    query: str
+    vector: Optional[List[float]] = field(default=None, repr=False)
+
+
+class SemanticCachedTextAIAdapter(CachedTextAIAdapter):
+    """
+    TextAI decorator that replays responses to requests with the same meaning.
+
+    Each call is split into an exact part and a compared part. For
+    ``analyze`` the prompt, model and options must match exactly and the
+    analyzed text is compared by embedding similarity; for ``chat`` the
+    earlier messages must match and the last user message is compared.
+    A cached response is served when the cosine similarity reaches
+    ``threshold``. Calls carrying non-text content (e.g. images) are not
+    cached. Bypass rules follow CachedTextAIAdapter. If embedding fails
+    the call goes to the wrapped TextAI uncached.
+    """
+
+    def __init__(
+        self,
+        text_ai: TextAI,
+        embeddings: Embeddings,
+        threshold: float = 0.95,
+        ttl: Optional[float] = 24 * 60 * 60,
+        max_entries: int = 50000,
+        path: Optional[Union[str, Path]] = None,
+        embedding_model: Optional[str] = None,
+        cache_sampled: bool = False,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            text_ai: TextAI that generates the responses
+            embeddings: Embeddings used to compare requests
+            threshold: Minimum cosine similarity for a cached response to be served
+            ttl: Seconds a response is served (None for no expiry)
+            max_entries: Maximum cached responses; least recently matched are evicted
+            path: ``.npz`` file the index is loaded from and saved to (None to keep it in memory)
+            embedding_model: Optional embedding model identifier
+            cache_sampled: Also cache calls with temperature above 0
+        """
+        self.text_ai = text_ai
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = Path(path) if path else None
+        self.embedding_model = embedding_model
+        self.cache_sampled = cache_sampled
+        self.stats = TextCacheStats()
+        self.last_similarity: Optional[float] = None
+        if self.path is not None and self.path.exists():
+            self.index = VectorIndex.load(self.path, max_entries=max_entries)
+        else:
+            self.index = VectorIndex(max_entries=max_entries)
+
+    def _key(
+        self,
+        method: str,
+        model: Optional[str],
+        messages: List[Dict[str, Any]],
+        options: Dict[str, Any],
+    ) -> Optional[SemanticKey]:
+        if not messages or not all(isinstance(message.get("content"), str) for message in messages):
+            return None
+        if messages[-1].get("role") != "user":
+            return None
+        model_name = model or getattr(self.text_ai, "default_model", None)
+        exact = text_cache_key(method, model_name, messages[:-1], options)
+        return SemanticKey(
+            group=int(exact[:15], 16),
+            query=" ".join(messages[-1]["content"].split()),
+        )
+
+    async def _lookup(self, key: SemanticKey) -> Optional[CachedText]:
+        try:
+            key.vector = (await self.embeddings.embed([key.query], model=self.embedding_model))[0]
+        except Exception:
+            key.vector = None
+        match = None
+        if key.vector is not None:
+            match = self.index.search(key.vector, key.group, self.threshold, max_age=self.ttl)
+        if match is None:
+            self.stats.misses += 1
+            return None
+        slot, self.last_similarity = match
+        self.stats.hits += 1
+        return CachedText(chunks=list(self.index.payload(slot)))
+
+    async def _store(self, key: SemanticKey, chunks: List[str]) -> None:
+        if key.vector is None:
+            return
+        self.index.add(key.vector, key.group, chunks)
+        self.stats.stored += 1
+
+    async def save(self) -> None:
+        """Write the index to ``path``, if one was given."""
+        if self.path is not None:
+            await save_file(self.path, self.index.dumps())
+
+    async def close(self) -> None:
+        """Persist the index."""
+        await self.save()
@@ -0,0 +1,392 @@
+"""Exact-match response cache wrapped around any TextAI."""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional, Protocol, Union, cast
+
+from ...core.ports.text_ai import TextAI
+from ...utils.cache import LRUCache
+
+# Call options that do not change the response
+UNKEYED_OPTIONS = ("cache",)
+
+
+def _normalize_content(content: Any) -> Any:
+    if isinstance(content, str):
+        return " ".join(content.split())
+    if isinstance(content, list):
+        return [_normalize_content(part) for part in content]
+    if isinstance(content, dict):
+        return {k: _normalize_content(v) for k, v in content.items()}
+    return content
+
+
+def text_cache_key(
+    method: str,
+    model: Optional[str],
+    messages: List[Dict[str, Any]],
+    options: Dict[str, Any],
+) -> str:
+    """
+    Derive the cache key for a TextAI call.
+
+    Message text is whitespace-normalized, so prompts that differ only in
+    indentation or line breaks share an entry.
+
+    Args:
+        method: TextAI method name
+        model: Model identifier
+        messages: Chat messages
+        options: Sampling and provider options (cache controls are ignored)
+
+    Returns:
+        Hex SHA-256 of the method, model, messages and options
+    """
+    keyed = {k: v for k, v in options.items() if k not in UNKEYED_OPTIONS and v is not None}
+    payload = json.dumps(
+        [method, model, _normalize_content(messages), keyed], sort_keys=True, default=repr
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedText:
+    """A finished response, kept as the chunks it was streamed in."""
+
+    chunks: List[str]
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def text(self) -> str:
+        """The full response."""
+        return "".join(self.chunks)
+
+    @property
+    def size(self) -> int:
+        """Response length in characters."""
+        return sum(len(chunk) for chunk in self.chunks)
+
+
+@dataclass
+class TextCacheStats:
+    """Counters for verifying cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    stored: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the counters as a dict."""
+        return asdict(self)
+
+
+class TextCacheBackend(Protocol):
+    """Storage behind CachedTextAIAdapter."""
+
+    async def get(self, key: str) -> Optional[CachedText]:
+        """Return the entry for a key, or None."""
+        ...
+
+    async def set(self, key: str, entry: CachedText) -> None:
+        """Store an entry, evicting old ones as needed."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry."""
+        ...
+
+
+class MemoryTextCache:
+    """In-process LRU backend bounded by entry count and total characters."""
+
+    def __init__(self, max_items: int = 1024, max_chars: int = 16 * 1024 * 1024):
+        """
+        Initialize the memory backend.
+
+        Args:
+            max_items: Maximum number of responses
+            max_chars: Maximum total response characters
+        """
+        self._entries: LRUCache[str, CachedText] = LRUCache(
+            max_items=max_items, max_bytes=max_chars, size_of=lambda entry: entry.size
+        )
+
+    async def get(self, key: str) -> Optional[CachedText]:
+        """Return the entry for a key, or None."""
+        return self._entries.get(key)
+
+    async def set(self, key: str, entry: CachedText) -> None:
+        """Store an entry, evicting least recently used ones as needed."""
+        self._entries.set(key, entry)
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry."""
+        self._entries.pop(key)
+
+
+class SQLiteTextCache:
+    """
+    SQLite backend, shared across restarts and worker processes.
+
+    Reads update an access time, and writes evict the least recently used
+    rows beyond ``max_items``. Queries run in a worker thread.
+    """
+
+    def __init__(self, path: Union[str, Path], max_items: int = 10000):
+        """
+        Initialize the SQLite backend.
+
+        Args:
+            path: Database file (created if missing)
+            max_items: Maximum number of responses
+        """
+        self.path = Path(path)
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS text_cache ("
+                "key TEXT PRIMARY KEY, chunks TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS text_cache_accessed ON text_cache (accessed_at)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def _get(self, key: str) -> Optional[CachedText]:
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT chunks, stored_at FROM text_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE text_cache SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return CachedText(chunks=json.loads(row[0]), stored_at=row[1])
+
+    def _set(self, key: str, entry: CachedText) -> None:
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO text_cache VALUES (?, ?, ?, ?)",
+                (key, json.dumps(entry.chunks), entry.stored_at, time.time()),
+            )
+            connection.execute(
+                "DELETE FROM text_cache WHERE key IN (SELECT key FROM text_cache "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_items,),
+            )
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM text_cache WHERE key = ?", (key,))
+
+    async def get(self, key: str) -> Optional[CachedText]:
+        """Return the entry for a key, or None."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, entry: CachedText) -> None:
+        """Store an entry, evicting least recently used ones beyond ``max_items``."""
+        await asyncio.to_thread(self._set, key, entry)
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry."""
+        await asyncio.to_thread(self._delete, key)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class CachedTextAIAdapter:
+    """
+    TextAI decorator that replays identical requests from a cache.
+
+    Entries are keyed by method, model, whitespace-normalized messages and
+    every sampling option. Sampled output (temperature above 0) is meant
+    to vary, so such calls bypass the cache unless ``cache_sampled`` is set
+    or the call passes ``cache=True``; ``cache=False`` always bypasses.
+    ``analyze`` calls without an explicit temperature are cached. Chat
+    streams are stored once they finish and replayed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        text_ai: TextAI,
+        backend: Optional[TextCacheBackend] = None,
+        ttl: Optional[float] = 24 * 60 * 60,
+        cache_sampled: bool = False,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            text_ai: TextAI that generates the responses
+            backend: Response storage (defaults to a MemoryTextCache)
+            ttl: Seconds a response is served (None for no expiry)
+            cache_sampled: Also cache calls with temperature above 0
+        """
+        self.text_ai = text_ai
+        self.backend = backend or MemoryTextCache()
+        self.ttl = ttl
+        self.cache_sampled = cache_sampled
+        self.stats = TextCacheStats()
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped adapter's extras (default_model, client, ...)
+        if name == "text_ai":
+            raise AttributeError(name)
+        return getattr(self.text_ai, name)
+
+    def _cacheable(self, force: Optional[bool], temperature: Optional[float]) -> bool:
+        if force is not None:
+            return force
+        return self.cache_sampled or not temperature
+
+    def _key(
+        self,
+        method: str,
+        model: Optional[str],
+        messages: List[Dict[str, Any]],
+        options: Dict[str, Any],
+    ) -> Any:
+        """
+        Cache key for a call.
+
+        Every call has an exact-match key here. Subclasses may return None
+        for calls they cannot key (the semantic cache does for multimodal
+        messages), and ``chat``/``analyze`` then bypass the cache.
+        """
+        model = model or getattr(self.text_ai, "default_model", None)
+        return text_cache_key(method, model, messages, options)
+
+    async def _lookup(self, key: Any) -> Optional[CachedText]:
+        entry = await self.backend.get(key)
+        if entry is not None and self.ttl is not None and time.time() - entry.stored_at >= self.ttl:
+            await self.backend.delete(key)
+            entry = None
+        if entry is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return entry
+
+    async def _store(self, key: Any, chunks: List[str]) -> None:
+        await self.backend.set(key, CachedText(chunks=chunks))
+        self.stats.stored += 1
+
+    async def chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Generate streaming chat responses, replaying cached streams.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            model: Optional model identifier
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters; ``cache``
+                forces (True) or skips (False) the cache
+
+        Yields:
+            Text chunks as they are generated or replayed
+        """
+        force = kwargs.pop("cache", None)
+
+        def generate() -> AsyncGenerator[str, None]:
+            # The port declares chat as a coroutine; adapters are async generators
+            return cast(
+                AsyncGenerator[str, None],
+                self.text_ai.chat(
+                    messages=messages,
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs,
+                ),
+            )
+
+        key = None
+        if self._cacheable(force, temperature):
+            options = dict(kwargs, temperature=temperature, max_tokens=max_tokens)
+            key = self._key("chat", model, messages, options)
+        if key is None:
+            self.stats.bypassed += 1
+            async for chunk in generate():
+                yield chunk
+            return
+
+        entry = await self._lookup(key)
+        if entry is not None:
+            for chunk in entry.chunks:
+                yield chunk
+            return
+
+        # Only streams consumed to the end are stored
+        chunks: List[str] = []
+        async for chunk in generate():
+            chunks.append(chunk)
+            yield chunk
+        await self._store(key, chunks)
+
+    async def analyze(
+        self,
+        text: str,
+        prompt: str,
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Analyze text based on a prompt, returning a cached result when possible.
+
+        Args:
+            text: The text to analyze
+            prompt: Instructions for the analysis
+            model: Optional model identifier
+            **kwargs: Additional provider-specific parameters; ``cache``
+                forces (True) or skips (False) the cache
+
+        Returns:
+            Complete analysis result
+        """
+        force = kwargs.pop("cache", None)
+        key = None
+        if self._cacheable(force, kwargs.get("temperature")):
+            messages = [{"role": "system", "content": prompt}, {"role": "user", "content": text}]
+            key = self._key("analyze", model, messages, kwargs)
+        if key is None:
+            self.stats.bypassed += 1
+            return await self.text_ai.analyze(text=text, prompt=prompt, model=model, **kwargs)
+
+        entry = await self._lookup(key)
+        if entry is not None:
+            return entry.text
+
+        result = await self.text_ai.analyze(text=text, prompt=prompt, model=model, **kwargs)
+        await self._store(key, [result])
+        return result
@@ -0,0 +1 @@
+"""Benchmarks for framework adapters, runnable with ``python -m``."""
@@ -0,0 +1,68 @@
+"""Local HTTP test server shared by the benchmarks."""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional, Set, Tuple
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve pages produced by the server's page factory over keep-alive HTTP/1.1."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        server = self.server
+        server.connections.add(self.client_address)  # type: ignore[attr-defined]
+        status, content_type, body = server.page_factory(self.path)  # type: ignore[attr-defined]
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silence per-request logging."""
+
+
+def _default_page(path: str) -> Tuple[int, str, bytes]:
+    body = f"<html><head><title>{path}</title></head><body><p>{path}</p></body></html>"
+    return 200, "text/html; charset=utf-8", body.encode("utf-8")
+
+
+class LocalServer:
+    """
+    Threaded HTTP server bound to an ephemeral localhost port.
+
+    Use as a context manager; ``connections`` records every distinct
+    client address so benchmarks can report connection reuse.
+    """
+
+    def __init__(
+        self,
+        page_factory: Optional[Callable[[str], Tuple[int, str, bytes]]] = None,
+    ):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.page_factory = page_factory or _default_page  # type: ignore[attr-defined]
+        self._server.connections = set()  # type: ignore[attr-defined]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    @property
+    def connections(self) -> Set[Tuple[str, int]]:
+        """Distinct client addresses seen so far."""
+        return self._server.connections  # type: ignore[attr-defined, no-any-return]
+
+    def __enter__(self) -> "LocalServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
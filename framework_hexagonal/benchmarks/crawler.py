@@ -0,0 +1,70 @@
+"""
+Measure crawler throughput against a locally generated site.
+
+Run with::
+
+    python -m framework_hexagonal.benchmarks.crawler --pages 1000 --concurrency 16
+
+The site is a deterministic graph: every page links to ``--fanout`` other
+pages, so the crawler must deduplicate heavily to stay within the page set.
+"""
+import argparse
+import asyncio
+from typing import Tuple
+
+from ..adapters.outbound.html_parsers import link_extractor
+from ..adapters.outbound.httpx_fetcher import HttpxWebFetcherAdapter
+from ..utils.crawler import Crawler
+from ._server import LocalServer
+
+
+def make_site(pages: int, fanout: int):  # type: ignore[no-untyped-def]
+    """Create a page factory serving a generated site of ``pages`` pages."""
+    def page_factory(path: str) -> Tuple[int, str, bytes]:
+        if path == "/robots.txt":
+            return 200, "text/plain", b"User-agent: *\nDisallow: /private/\n"
+        try:
+            index = int(path.rsplit("/", 1)[-1] or 0)
+        except ValueError:
+            return 404, "text/html", b"<h1>Not found</h1>"
+        links = "".join(
+            f'<a href="/page/{(index * 7 + k * 13 + 1) % pages}?utm_source=nav#top">Link {k}</a>'
+            for k in range(fanout)
+        )
+        body = (
+            f"<html><head><title>Page {index}</title></head><body>"
+            f"<nav>{links}</nav><a href='/private/{index}'>Private</a>"
+            f"<p>{'Lorem ipsum dolor sit amet. ' * 50}</p></body></html>"
+        )
+        return 200, "text/html; charset=utf-8", body.encode("utf-8")
+
+    return page_factory
+
+
+async def main(pages: int, fanout: int, concurrency: int) -> None:
+    """Crawl the generated site and print throughput."""
+    with LocalServer(make_site(pages, fanout)) as server:
+        async with HttpxWebFetcherAdapter() as fetcher:
+            crawler = Crawler(
+                fetcher,
+                max_pages=pages,
+                max_depth=pages,
+                concurrency=concurrency,
+                politeness_delay=0.0,
+                link_extractor=link_extractor(),
+            )
+            stats = await crawler.crawl([f"{server.base_url}/page/0"])
+
+    print(
+        f"pages={stats.pages} errors={stats.errors} robots_skipped={stats.skipped_by_robots} "
+        f"seconds={stats.elapsed:.2f} pages/s={stats.pages_per_second:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--fanout", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(main(args.pages, args.fanout, args.concurrency))
@@ -0,0 +1,67 @@
+"""
+Benchmark a per-call ``httpx.AsyncClient`` against the pooled fetcher adapter.
+
+Run with::
+
+    python -m framework_hexagonal.benchmarks.fetcher_pool --requests 500 --concurrency 20
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+
+from ..adapters.outbound.httpx_fetcher import HttpxWebFetcherAdapter
+from ._server import LocalServer
+
+
+async def _run(
+    urls: List[str], concurrency: int, fetch: Callable[[str], Awaitable[object]]
+) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(url: str) -> None:
+        async with semaphore:
+            await fetch(url)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(url) for url in urls))
+    return time.perf_counter() - start
+
+
+async def _per_call_fetch(url: str) -> None:
+    """Reproduce the old behaviour: a fresh client (and connection) per fetch."""
+    async with httpx.AsyncClient(follow_redirects=True) as client:
+        response = await client.get(url)
+        response.raise_for_status()
+        _ = response.text
+
+
+async def main(requests: int, concurrency: int) -> None:
+    """Run both variants against a local server and print a summary."""
+    with LocalServer() as server:
+        urls = [f"{server.base_url}/page/{i}" for i in range(requests)]
+
+        elapsed = await _run(urls, concurrency, _per_call_fetch)
+        per_call_connections = len(server.connections)
+        server.connections.clear()
+
+        async with HttpxWebFetcherAdapter() as fetcher:
+            pooled_elapsed = await _run(urls, concurrency, fetcher.fetch)
+        pooled_connections = len(server.connections)
+
+    print(f"{'variant':<10} {'seconds':>8} {'req/s':>8} {'conns':>6}")
+    for name, seconds, conns in (
+        ("per-call", elapsed, per_call_connections),
+        ("pooled", pooled_elapsed, pooled_connections),
+    ):
+        print(f"{name:<10} {seconds:>8.3f} {requests / seconds:>8.1f} {conns:>6}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,95 @@
+"""
+Micro-benchmark the HTML parser backends over a corpus of saved pages.
+
+Run with::
+
+    python -m framework_hexagonal.benchmarks.html_parsers --corpus ./saved_pages --selector "h1, h2"
+
+Without ``--corpus`` a synthetic corpus of marketing-style pages is generated.
+"""
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import List
+
+from ..adapters.outbound.html_parsers import PARSER_BACKENDS, HTMLParserBackend
+
+
+def synthetic_corpus(pages: int, sections: int, seed: int = 0) -> List[str]:
+    """Generate pages with navigation, scripts, styles and repeated content sections."""
+    rng = random.Random(seed)
+    words = "growth conversion pricing demo signup trusted teams customers platform".split()
+    corpus = []
+    for index in range(pages):
+        body = []
+        for section in range(sections):
+            text = " ".join(rng.choice(words) for _ in range(40))
+            body.append(
+                f"<section><h2>Section {section}</h2><p>{text}</p>"
+                f"<a class='cta' href='/signup?s={section}'>Start free trial</a></section>"
+            )
+        corpus.append(
+            "<html><head><title>Page {0}</title><style>body{{margin:0}}</style>"
+            "<script>window.dataLayer=[];</script></head><body>"
+            "<nav><a href='/'>Home</a><a href='/pricing'>Pricing</a></nav>"
+            "<h1>Landing page {0}</h1>{1}<footer>&copy; Example</footer></body></html>".format(
+                index, "".join(body)
+            )
+        )
+    return corpus
+
+
+def load_corpus(directory: Path) -> List[str]:
+    """Load every ``*.html``/``*.htm`` file below a directory."""
+    paths = sorted(p for p in directory.rglob("*") if p.suffix.lower() in (".html", ".htm"))
+    return [p.read_text(encoding="utf-8", errors="replace") for p in paths]
+
+
+def _time(func, corpus: List[str], repeat: int) -> float:  # type: ignore[no-untyped-def]
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in corpus:
+            func(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(corpus: List[str], selector: str, repeat: int) -> None:
+    """Time get_text and select_text for every installed backend."""
+    backends: List[HTMLParserBackend] = []
+    for name, factory in PARSER_BACKENDS.items():
+        try:
+            backends.append(factory())
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    reference = [PARSER_BACKENDS["bs4"]().get_text(html) for html in corpus]
+    size_mb = sum(len(html) for html in corpus) / 1_000_000
+    print(f"corpus: {len(corpus)} pages, {size_mb:.1f} MB; best of {repeat}")
+    print(f"{'backend':<12} {'get_text ms/page':>17} {'select ms/page':>15} {'mismatches':>11}")
+
+    for backend in backends:
+        text_seconds = _time(backend.get_text, corpus, repeat)
+        select_seconds = _time(lambda html: backend.select_text(html, selector), corpus, repeat)
+        mismatches = sum(
+            1 for html, expected in zip(corpus, reference) if backend.get_text(html) != expected
+        )
+        print(
+            f"{backend.name:<12} {1000 * text_seconds / len(corpus):>17.3f} "
+            f"{1000 * select_seconds / len(corpus):>15.3f} {mismatches:>11}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", type=Path, help="Directory of saved HTML pages")
+    parser.add_argument("--pages", type=int, default=200, help="Synthetic corpus size")
+    parser.add_argument("--sections", type=int, default=50, help="Sections per synthetic page")
+    parser.add_argument("--selector", default="h1, h2, a.cta")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.pages, args.sections)
+    main(pages, args.selector, args.repeat)
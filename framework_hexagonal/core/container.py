@@ -1,5 +1,7 @@
 """Dependency injection container for port implementations."""
-from typing import Dict, Type, TypeVar, Any, Optional, cast, get_type_hints
+from typing import Dict, Iterable, Type, TypeVar, Any, Optional, Union, cast, get_type_hints
+
+from ..utils.coalescing import CoalescingAdapter
 
 T = TypeVar('T')
 
@@ -16,14 +18,27 @@ class Container:
         """Initialize an empty container."""
         self._registry: Dict[Type[Any], Any] = {}
 
-    def register(self, port_type: Type[T], implementation: Any) -> None:
+    def register(
+        self,
+        port_type: Type[T],
+        implementation: Any,
+        coalesce: Union[bool, Iterable[str]] = False,
+    ) -> None:
         """
         Register an implementation for a port type.
 
         Args:
             port_type: The port interface type
             implementation: An instance implementing the port interface
+            coalesce: Share one execution among concurrent identical calls
+                (wraps the implementation in a CoalescingAdapter). True
+                coalesces every coroutine method; a list of method names
+                coalesces only those, including streaming methods
         """
+        if coalesce is True:
+            implementation = CoalescingAdapter(implementation)
+        elif coalesce:
+            implementation = CoalescingAdapter(implementation, methods=coalesce)
         self._registry[port_type] = implementation
 
     def get(self, port_type: Type[T]) -> T:
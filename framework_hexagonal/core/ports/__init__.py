@@ -1,18 +1,43 @@
 """Port interfaces for the hexagonal framework."""
 from .text_ai import TextAI
+from .embeddings import Embeddings
 from .image_ai import ImageAI
 from .web_search import WebSearch, SearchResult
-from .web_fetcher import WebFetcher, FetchedPage
+from .web_fetcher import (
+    WebFetcher,
+    FetchedPage,
+    PageContent,
+    ResponseTooLargeError,
+    UnsupportedContentTypeError,
+)
 from .screenshotter import Screenshotter
+from .image_processor import (
+    ImageProcessor,
+    ImageVariant,
+    ProcessedImage,
+    MODEL_INPUT_VARIANT,
+)
+from .artifact_store import ArtifactStore, StoredArtifact, GarbageCollection
 from .db_gateway import DBGateway
 
 __all__ = [
     "TextAI",
+    "Embeddings",
     "ImageAI",
     "WebSearch",
     "SearchResult",
     "WebFetcher",
     "FetchedPage",
+    "PageContent",
+    "ResponseTooLargeError",
+    "UnsupportedContentTypeError",
     "Screenshotter",
+    "ImageProcessor",
+    "ImageVariant",
+    "ProcessedImage",
+    "MODEL_INPUT_VARIANT",
+    "ArtifactStore",
+    "StoredArtifact",
+    "GarbageCollection",
     "DBGateway",
 ] 
\ No newline at end of file
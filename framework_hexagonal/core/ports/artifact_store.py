@@ -0,0 +1,109 @@
+"""ArtifactStore port for persisting generated files such as screenshots."""
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Protocol
+
+
+@dataclass
+class StoredArtifact:
+    """
+    A persisted artifact.
+
+    Attributes:
+        key: Store-relative key, e.g. ``screenshots/3f2a….png``
+        digest: Hex SHA-256 of the content
+        size: Content size in bytes
+        content_type: MIME type of the content
+        url: Public URL of the artifact, if the store is served
+        created: False when identical content was already stored
+    """
+
+    key: str
+    digest: str
+    size: int
+    content_type: str
+    url: Optional[str] = None
+    created: bool = True
+
+
+@dataclass
+class GarbageCollection:
+    """Outcome of an artifact garbage collection run."""
+
+    removed: int = 0
+    freed_bytes: int = 0
+    remaining: int = 0
+    remaining_bytes: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the outcome as a dict."""
+        return asdict(self)
+
+
+class ArtifactStore(Protocol):
+    """Interface for content-addressed artifact storage."""
+
+    async def put(
+        self,
+        data: bytes,
+        namespace: str = "",
+        extension: str = "",
+        content_type: Optional[str] = None,
+        **kwargs: Any,
+    ) -> StoredArtifact:
+        """
+        Store content under a key derived from its hash.
+
+        Storing the same content twice returns the existing artifact.
+
+        Args:
+            data: Content to store
+            namespace: Key prefix grouping related artifacts, e.g. 'screenshots'
+            extension: File extension without the dot, e.g. 'png'
+            content_type: MIME type (guessed from the extension if omitted)
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            The stored artifact
+        """
+        ...
+
+    async def get(self, key: str, **kwargs: Any) -> bytes:
+        """
+        Read an artifact's content.
+
+        Args:
+            key: Artifact key returned by ``put``
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            The content
+
+        Raises:
+            KeyError: If no artifact has that key
+        """
+        ...
+
+    async def delete(self, key: str, **kwargs: Any) -> bool:
+        """
+        Delete an artifact.
+
+        Args:
+            key: Artifact key returned by ``put``
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            True if an artifact was deleted
+        """
+        ...
+
+    async def collect_garbage(self, **kwargs: Any) -> GarbageCollection:
+        """
+        Remove artifacts beyond the store's retention limits.
+
+        Args:
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            What was removed and what remains
+        """
+        ...
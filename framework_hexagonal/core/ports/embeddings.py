@@ -0,0 +1,25 @@
+"""Embeddings port for turning text into vectors."""
+from typing import Any, List, Optional, Protocol
+
+
+class Embeddings(Protocol):
+    """Interface for text embedding capabilities."""
+
+    async def embed(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[List[float]]:
+        """
+        Embed a batch of texts.
+
+        Args:
+            texts: Texts to embed
+            model: Optional model identifier
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            One vector per text, in input order
+        """
+        ...
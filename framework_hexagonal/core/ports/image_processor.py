@@ -0,0 +1,101 @@
+"""ImageProcessor port for re-encoding and downscaling images."""
+import base64
+from dataclasses import dataclass
+from typing import Any, Dict, Literal, Optional, Protocol
+
+ImageFormat = Literal["jpeg", "webp", "png"]
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    """
+    Encoding settings for one output image.
+
+    Attributes:
+        format: Output format
+        quality: Encoder quality for lossy formats (1-100)
+        max_dimension: Longest side in pixels; larger images are downscaled
+    """
+
+    format: ImageFormat = "jpeg"
+    quality: int = 80
+    max_dimension: Optional[int] = None
+
+
+# Compact variant for vision-model prompts. Vision APIs downscale anything
+# beyond 2048px on the longest side, so larger uploads only cost bandwidth.
+MODEL_INPUT_VARIANT = ImageVariant(format="jpeg", quality=70, max_dimension=2048)
+
+
+@dataclass
+class ProcessedImage:
+    """An encoded image and its dimensions."""
+
+    data: bytes
+    format: str
+    width: int
+    height: int
+
+    @property
+    def mime_type(self) -> str:
+        """MIME type of the encoded data."""
+        return f"image/{self.format}"
+
+    @property
+    def size(self) -> int:
+        """Encoded size in bytes."""
+        return len(self.data)
+
+    def to_base64(self) -> str:
+        """Return the encoded data as base64 text."""
+        return base64.b64encode(self.data).decode("ascii")
+
+    def to_data_url(self) -> str:
+        """Return a ``data:`` URL, e.g. for vision-model messages."""
+        return f"data:{self.mime_type};base64,{self.to_base64()}"
+
+
+class ImageProcessor(Protocol):
+    """Interface for image encoding and compression."""
+
+    async def process(
+        self,
+        image: bytes,
+        format: ImageFormat = "jpeg",
+        quality: int = 80,
+        max_dimension: Optional[int] = None,
+        **kwargs: Any,
+    ) -> ProcessedImage:
+        """
+        Re-encode an image, downscaling it if needed.
+
+        Args:
+            image: Encoded source image
+            format: Output format (jpeg, webp or png)
+            quality: Encoder quality for lossy formats (1-100)
+            max_dimension: Longest side in pixels; larger images are downscaled
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Processed image
+        """
+        ...
+
+    async def process_variants(
+        self,
+        image: bytes,
+        variants: Dict[str, ImageVariant],
+        **kwargs: Any,
+    ) -> Dict[str, ProcessedImage]:
+        """
+        Produce several encodings of an image from a single decode.
+
+        Args:
+            image: Encoded source image
+            variants: Output settings keyed by variant name
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Processed images keyed by variant name
+        """
+        ...
@@ -1,7 +1,14 @@
 """Screenshotter port for capturing screenshots of web pages."""
-from typing import Optional, Protocol, Any, Literal, Dict, Union
+from typing import Optional, Protocol, Any, Literal, Dict, List, Union
 from pathlib import Path
 
+# Named viewports accepted by capture_multi
+VIEWPORT_PRESETS: Dict[str, Dict[str, int]] = {
+    "desktop": {"width": 1280, "height": 800},
+    "tablet": {"width": 768, "height": 1024},
+    "mobile": {"width": 375, "height": 812},
+}
+
 
 class Screenshotter(Protocol):
     """Interface for web page screenshot capabilities."""
@@ -14,7 +21,7 @@ class Screenshotter(Protocol):
         width: int = 1280,
         height: int = 800,
         format: Literal["png", "jpeg"] = "png",
-        wait_until: Literal["load", "domcontentloaded", "networkidle"] = "networkidle",
+        wait_until: Optional[Literal["load", "domcontentloaded", "networkidle"]] = None,
         timeout: float = 30.0,
         **kwargs: Any,
     ) -> bytes:
@@ -28,7 +35,8 @@ class Screenshotter(Protocol):
             width: Browser viewport width
             height: Browser viewport height
             format: Image format (png or jpeg)
-            wait_until: Page load state to wait for
+            wait_until: Page load state to wait for (None lets the adapter decide
+                when the page has settled)
             timeout: Maximum time to wait for page load in seconds
             **kwargs: Additional provider-specific parameters
 
@@ -58,4 +66,45 @@ class Screenshotter(Protocol):
         Returns:
             Binary image data
         """
-        ... 
\ No newline at end of file
+        ...
+
+    async def capture_multi(
+        self,
+        url: str,
+        viewports: Optional[List[Union[str, Dict[str, Any]]]] = None,
+        selectors: Optional[List[str]] = None,
+        full_page: bool = True,
+        format: Literal["png", "jpeg"] = "png",
+        wait_until: Optional[Literal["load", "domcontentloaded", "networkidle"]] = None,
+        timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> Dict[str, bytes]:
+        """
+        Capture several viewports and elements of a page from a single load.
+
+        Args:
+            url: The URL to screenshot
+            viewports: Preset names ('desktop', 'tablet', 'mobile') or
+                ``{"width", "height"}`` dicts with an optional "name";
+                defaults to all presets
+            selectors: CSS selectors of elements to capture at the first viewport
+            full_page: Whether viewport shots cover the full page
+            format: Image format (png or jpeg)
+            wait_until: Page load state to wait for (None lets the adapter decide
+                when the page has settled)
+            timeout: Maximum time to wait for page load in seconds
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Images keyed by viewport name ("<width>x<height>" for unnamed
+            sizes) and by selector; selectors matching nothing are omitted
+        """
+        ...
+
+    async def start(self) -> None:
+        """Acquire resources (e.g. launch a browser) ahead of the first capture."""
+        ...
+
+    async def close(self) -> None:
+        """Release all resources held by the screenshotter."""
+        ...
@@ -1,16 +1,86 @@
 """WebFetcher port for downloading and parsing web pages."""
-from typing import Dict, Optional, Protocol, Any, NamedTuple
+from dataclasses import asdict, dataclass, field
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Protocol, Any
 from bs4 import BeautifulSoup
 
 
-class FetchedPage(NamedTuple):
-    """Data container for fetched web page content."""
-    
+class ResponseTooLargeError(ValueError):
+    """Raised when a response body exceeds the fetcher's size cap."""
+
+
+class UnsupportedContentTypeError(ValueError):
+    """Raised when a response's content type is not in the fetcher's allowlist."""
+
+
+class FetchedPage:
+    """
+    Data container for fetched web page content.
+
+    The BeautifulSoup tree is built lazily on first access to ``soup`` and
+    cached afterwards, so callers that only need ``html`` or ``status_code``
+    never pay for parsing. Pages created with ``parser=None`` are never
+    parsed and their ``soup`` is None. Failed fetches from ``fetch_many``
+    carry the exception in ``error``.
+    """
+
+    __slots__ = ("url", "status_code", "html", "headers", "parser", "error", "_soup")
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        html: str,
+        soup: Optional[BeautifulSoup] = None,
+        headers: Optional[Dict[str, str]] = None,
+        parser: Optional[str] = "html.parser",
+        error: Optional[Exception] = None,
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.html = html
+        self.headers = headers or {}
+        self.parser = parser
+        self.error = error
+        self._soup = soup
+
+    @property
+    def soup(self) -> Optional[BeautifulSoup]:
+        """Parsed document, built on first access."""
+        if self._soup is None and self.parser is not None:
+            self._soup = BeautifulSoup(self.html, self.parser)
+        return self._soup
+
+    @property
+    def ok(self) -> bool:
+        """Whether the page was fetched without error."""
+        return self.error is None
+
+    @property
+    def is_parsed(self) -> bool:
+        """Whether the BeautifulSoup tree has already been built."""
+        return self._soup is not None
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"FetchedPage(url='{self.url}', error={self.error!r})"
+        return f"FetchedPage(url='{self.url}', status_code={self.status_code})"
+
+
+@dataclass
+class PageContent:
+    """Main content of a page with boilerplate removed, plus structural metadata."""
+
     url: str
-    status_code: int
-    html: str
-    soup: BeautifulSoup
-    headers: Dict[str, str]
+    title: str
+    text: str
+    description: Optional[str] = None
+    headings: List[Dict[str, str]] = field(default_factory=list)
+    ctas: List[Dict[str, str]] = field(default_factory=list)
+    links: List[Dict[str, str]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the content as a JSON-serializable dict."""
+        return asdict(self)
 
 
 class WebFetcher(Protocol):
@@ -21,6 +91,7 @@ class WebFetcher(Protocol):
         url: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: float = 30.0,
+        parse: bool = True,
         **kwargs: Any,
     ) -> FetchedPage:
         """
@@ -30,10 +101,37 @@ class WebFetcher(Protocol):
             url: The URL to fetch
             headers: Optional request headers
             timeout: Request timeout in seconds
+            parse: Whether the page may be parsed; False skips parsing entirely
             **kwargs: Additional provider-specific parameters
 
         Returns:
-            FetchedPage containing html content and parsed BeautifulSoup
+            FetchedPage containing html content and lazily parsed BeautifulSoup
+        """
+        ...
+
+    def fetch_many(
+        self,
+        urls: Iterable[str],
+        concurrency: int = 10,
+        per_host: int = 2,
+        timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> AsyncIterator[FetchedPage]:
+        """
+        Fetch many pages concurrently, yielding them in completion order.
+
+        A failed URL does not abort the batch; it is yielded as a page whose
+        ``error`` holds the exception.
+
+        Args:
+            urls: URLs to fetch
+            concurrency: Maximum number of requests in flight overall
+            per_host: Maximum number of requests in flight per host
+            timeout: Total time allowed for each request in seconds
+            **kwargs: Additional provider-specific parameters passed to ``fetch``
+
+        Yields:
+            FetchedPage for every URL as soon as it completes
         """
         ...
 
@@ -41,6 +139,7 @@ class WebFetcher(Protocol):
         self,
         url: str,
         selector: Optional[str] = None,
+        main_content: bool = False,
         **kwargs: Any,
     ) -> str:
         """
@@ -49,9 +148,56 @@ class WebFetcher(Protocol):
         Args:
             url: The URL to fetch
             selector: Optional CSS selector to filter content
+            main_content: Return only the main content, without navigation,
+                footers, banners and other boilerplate
             **kwargs: Additional provider-specific parameters
 
         Returns:
             Extracted text content
         """
-        ... 
\ No newline at end of file
+        ...
+
+    async def extract_content(
+        self,
+        url: str,
+        **kwargs: Any,
+    ) -> PageContent:
+        """
+        Extract a page's main content and structure (title, headings, CTAs, links).
+
+        Args:
+            url: The URL to fetch
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            PageContent with boilerplate removed
+        """
+        ...
+
+    def iter_chunks(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30.0,
+        chunk_size: int = 64 * 1024,
+        max_bytes: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """
+        Download a resource and yield its body in chunks as they arrive.
+
+        Args:
+            url: The URL to download
+            headers: Optional request headers
+            timeout: Request timeout in seconds
+            chunk_size: Preferred chunk size in bytes
+            max_bytes: Optional cap on the total body size
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            Raw (content-decoded) body chunks
+
+        Raises:
+            ResponseTooLargeError: If the body exceeds ``max_bytes``
+        """
+        ...
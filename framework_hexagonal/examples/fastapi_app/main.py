@@ -118,11 +118,12 @@ async def startup_event():
         HttpxWebFetcherAdapter(),
     )
     
-    # Register Playwright screenshotter adapter
+    # Register Playwright screenshotter adapter and launch its browser ahead of traffic
     fh.container.register(
         fh.Screenshotter,
         PlaywrightScreenshotterAdapter(),
     )
+    await fh.container.get(fh.Screenshotter).start()
     
     # Register SQLAlchemy DB adapter
     fh.container.register(
@@ -133,6 +134,13 @@ async def startup_event():
     )
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled adapter resources on shutdown."""
+    await fh.container.get(fh.WebFetcher).aclose()
+    await fh.container.get(fh.Screenshotter).close()
+
+
 # Dependency to get adapters
 def get_text_ai():
     """Get TextAI adapter from container."""
@@ -15,7 +15,11 @@ from framework_hexagonal.core.ports import (
     SearchResult,
     WebFetcher,
     FetchedPage,
+    PageContent,
     Screenshotter,
+    ImageProcessor,
+    ImageVariant,
+    ProcessedImage,
     DBGateway,
 )
 
@@ -50,6 +54,39 @@ class StubTextAIAdapter:
         return f"Analysis of text: {text[:10]}... based on prompt: {prompt[:10]}..."
 
 
+class CountingTextAI:
+    """TextAI whose responses number the calls made, for testing caches."""
+
+    default_model = "model-a"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[str, None]:
+        """Yield a response ending in the call count."""
+        self.calls += 1
+        for chunk in ("Hel", "lo ", str(self.calls)):
+            yield chunk
+
+    async def analyze(
+        self,
+        text: str,
+        prompt: str,
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Return the prompt, text and call count."""
+        self.calls += 1
+        return f"{prompt}:{text}:{self.calls}"
+
+
 class StubImageAIAdapter:
     """Stub implementation of ImageAI for testing."""
     
@@ -123,6 +160,18 @@ class StubWebFetcherAdapter:
             headers={"Content-Type": "text/html"},
         )
     
+    async def fetch_many(
+        self,
+        urls: List[str],
+        concurrency: int = 10,
+        per_host: int = 2,
+        timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> AsyncGenerator[FetchedPage, None]:
+        """Return mock fetched pages for each URL."""
+        for url in urls:
+            yield await self.fetch(url)
+    
     async def get_text(
         self,
         url: str,
@@ -131,6 +180,32 @@ class StubWebFetcherAdapter:
     ) -> str:
         """Return mock text content."""
         return f"Text content from {url}" + (f" with selector {selector}" if selector else "")
+    
+    async def extract_content(
+        self,
+        url: str,
+        **kwargs: Any,
+    ) -> PageContent:
+        """Return mock main content."""
+        return PageContent(
+            url=url,
+            title="Example Page",
+            text="This is a test page.",
+            headings=[{"level": "h1", "text": f"Example Page for {url}"}],
+        )
+    
+    async def iter_chunks(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30.0,
+        chunk_size: int = 64 * 1024,
+        max_bytes: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[bytes, None]:
+        """Return mock body chunks."""
+        for chunk in (b"<html>", b"<body>", b"</body>", b"</html>"):
+            yield chunk
 
 
 class StubScreenshotterAdapter:
@@ -161,6 +236,292 @@ class StubScreenshotterAdapter:
     ) -> bytes:
         """Return mock element screenshot bytes."""
         return b"MOCK_ELEMENT_SCREENSHOT_DATA"
+    
+    async def capture_multi(
+        self,
+        url: str,
+        viewports: Optional[List[Any]] = None,
+        selectors: Optional[List[str]] = None,
+        full_page: bool = True,
+        format: str = "png",
+        wait_until: str = "networkidle",
+        timeout: float = 30.0,
+        **kwargs: Any,
+    ) -> Dict[str, bytes]:
+        """Return mock screenshot bytes per viewport and selector."""
+        names = [v if isinstance(v, str) else v.get("name", f"{v['width']}x{v['height']}")
+                 for v in viewports or ["desktop", "tablet", "mobile"]]
+        images = {name: b"MOCK_SCREENSHOT_DATA" for name in names}
+        images.update({selector: b"MOCK_ELEMENT_SCREENSHOT_DATA" for selector in selectors or []})
+        return images
+    
+    async def start(self) -> None:
+        """Nothing to start."""
+    
+    async def close(self) -> None:
+        """Nothing to close."""
+
+
+class StubImageProcessorAdapter:
+    """Stub implementation of ImageProcessor for testing."""
+    
+    async def process(
+        self,
+        image: bytes,
+        format: str = "jpeg",
+        quality: int = 80,
+        max_dimension: Optional[int] = None,
+        **kwargs: Any,
+    ) -> ProcessedImage:
+        """Return the input bytes labelled with the requested format."""
+        return ProcessedImage(data=image, format=format, width=1, height=1)
+    
+    async def process_variants(
+        self,
+        image: bytes,
+        variants: Dict[str, ImageVariant],
+        **kwargs: Any,
+    ) -> Dict[str, ProcessedImage]:
+        """Return one stub image per variant."""
+        return {
+            name: await self.process(image, format=variant.format)
+            for name, variant in variants.items()
+        }
+
+
+# Minimal stand-ins for Playwright browser objects (no browser binaries needed)
+class FakeRequest:
+    """Fake Playwright request."""
+
+    def __init__(self, url: str, resource_type: str, size: int = 0):
+        self.url = url
+        self.resource_type = resource_type
+        self.size = size
+        self.failure: Optional[str] = None
+
+    async def sizes(self) -> Dict[str, int]:
+        # Responses are served without a Content-Length header
+        return {
+            "requestBodySize": 0,
+            "requestHeadersSize": 100,
+            "responseBodySize": self.size,
+            "responseHeadersSize": 0,
+        }
+
+
+class FakeResponse:
+    """Fake Playwright response."""
+
+    def __init__(self, request: FakeRequest):
+        self.request = request
+        self.headers: Dict[str, str] = {}
+
+
+class FakeFrame:
+    """Fake Playwright frame."""
+
+    def __init__(self, url: str):
+        self.url = url
+
+
+class FakeCDPSession:
+    """Fake Chrome DevTools protocol session recording commands."""
+
+    def __init__(self, context: "FakeContext"):
+        self.context = context
+
+    async def send(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        self.context.cdp_commands.append((method, params))
+        return {}
+
+    async def detach(self) -> None:
+        pass
+
+
+class FakeRoute:
+    """Fake Playwright route recording the handler's decision."""
+
+    def __init__(self, request: FakeRequest):
+        self.request = request
+        self.aborted = False
+
+    async def abort(self, error_code: str = "failed") -> None:
+        self.aborted = True
+        self.request.failure = "net::ERR_BLOCKED_BY_CLIENT"
+
+    async def continue_(self) -> None:
+        pass
+
+
+class FakePage:
+    """Fake Playwright page that replays the browser's subresources on goto."""
+
+    def __init__(self, context: "FakeContext"):
+        self.context = context
+        self.url = "about:blank"
+        self.viewport: Optional[Dict[str, int]] = None
+        self.closed = False
+        self.scripts: List[str] = []
+        self.goto_calls: List[Dict[str, Any]] = []
+        self.screenshots: List[Dict[str, Any]] = []
+        self.handlers: Dict[str, List[Any]] = {}
+        self.routes: List[Any] = []
+
+    def on(self, event: str, handler: Any) -> None:
+        self.handlers.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event: str, handler: Any) -> None:
+        self.handlers[event].remove(handler)
+
+    def _emit(self, event: str, *args: Any) -> None:
+        for handler in list(self.handlers.get(event, [])):
+            handler(*args)
+
+    def crash(self) -> None:
+        self._emit("crash", self)
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def route(self, pattern: str, handler: Any) -> None:
+        self.routes.append(handler)
+
+    async def unroute(self, pattern: str, handler: Any) -> None:
+        self.routes.remove(handler)
+
+    async def goto(self, url: str, **kwargs: Any) -> None:
+        self.url = url
+        self.goto_calls.append({"url": url, **kwargs})
+        self._emit("framenavigated", FakeFrame(url))
+        if url == "about:blank":
+            return
+        for resource_url, resource_type, size in self.context.browser.resources:
+            request = FakeRequest(resource_url, resource_type, size)
+            self._emit("request", request)
+            route = FakeRoute(request)
+            for handler in self.routes:
+                await handler(route)
+            if route.aborted:
+                self._emit("requestfailed", request)
+            else:
+                self._emit("response", FakeResponse(request))
+                self._emit("requestfinished", request)
+
+    async def evaluate(self, script: str, *args: Any) -> Any:
+        self.scripts.append(script)
+        if "scrollHeight" in script:
+            if self.context.browser.page_height is None:
+                raise RuntimeError("Execution context was destroyed")
+            return self.context.browser.page_height
+        return True
+
+    async def set_viewport_size(self, viewport: Dict[str, int]) -> None:
+        self.viewport = viewport
+
+    async def screenshot(self, clip: Optional[Dict[str, int]] = None, **kwargs: Any) -> bytes:
+        self.screenshots.append({"clip": clip, **kwargs})
+        width = self.viewport["width"] if self.viewport else 0
+        if self.context.browser.render_png and clip:
+            from PIL import Image
+            from io import BytesIO
+
+            output = BytesIO()
+            shade = (clip["y"] // 10) % 256
+            Image.new("RGB", (clip["width"], clip["height"]), (shade, 0, 0)).save(output, "PNG")
+            return output.getvalue()
+        offset = f"+{clip['y']}" if clip and clip["y"] else ""
+        return f"SHOT:{self.url}@{width}{offset}".encode()
+
+    async def query_selector(self, selector: str) -> Optional["FakeElement"]:
+        if selector not in self.context.browser.elements:
+            return None
+        return FakeElement(selector)
+
+    async def wait_for_selector(self, selector: str, **kwargs: Any) -> Optional["FakeElement"]:
+        return await self.query_selector(selector)
+
+
+class FakeElement:
+    """Fake Playwright element handle."""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+
+    async def screenshot(self, **kwargs: Any) -> bytes:
+        return f"ELEMENT:{self.selector}".encode()
+
+
+class FakeContext:
+    """Fake Playwright browser context."""
+
+    def __init__(self, browser: "FakeBrowser", **options: Any):
+        self.browser = browser
+        self.options = options
+        self.pages: List[FakePage] = []
+        self.closed = False
+        self.cookies_cleared = 0
+        self.cdp_commands: List[Any] = []
+        self.handlers: Dict[str, Any] = {}
+
+    def on(self, event: str, handler: Any) -> None:
+        self.handlers[event] = handler
+
+    async def new_page(self) -> FakePage:
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def new_cdp_session(self, page: FakePage) -> FakeCDPSession:
+        if not self.browser.chromium:
+            raise RuntimeError("CDP session is only available in Chromium")
+        return FakeCDPSession(self)
+
+    async def clear_cookies(self) -> None:
+        self.cookies_cleared += 1
+
+    async def clear_permissions(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.closed = True
+        for page in self.pages:
+            page.closed = True
+
+
+class FakeBrowser:
+    """Fake Playwright browser counting created contexts."""
+
+    def __init__(self) -> None:
+        self.contexts: List[FakeContext] = []
+        self.connected = True
+        # (url, resource type, size) loaded by every navigation
+        self.resources: List[Any] = []
+        # Selectors that match an element on every page
+        self.elements: List[str] = []
+        # Document height reported to full-page captures
+        # None makes measuring the page height fail
+        self.page_height: Optional[int] = 600
+        # Return real PNG tiles from clipped screenshots
+        self.render_png = False
+        # Whether contexts support DevTools protocol sessions
+        self.chromium = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_context(self, **options: Any) -> FakeContext:
+        context = FakeContext(self, **options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.connected = False
+
+
+@pytest.fixture
+def fake_browser() -> FakeBrowser:
+    """Fake Playwright browser."""
+    return FakeBrowser()
 
 
 # In-memory SQLite for testing
@@ -330,6 +691,7 @@ async def container():
     container.register(WebSearch, StubWebSearchAdapter())
     container.register(WebFetcher, StubWebFetcherAdapter())
     container.register(Screenshotter, StubScreenshotterAdapter())
+    container.register(ImageProcessor, StubImageProcessorAdapter())
     
     # Set up DB adapter
     db_adapter = StubDBGatewayAdapter()
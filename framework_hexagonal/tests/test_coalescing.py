@@ -0,0 +1,122 @@
+"""Tests for in-flight request coalescing."""
+import asyncio
+
+import pytest
+
+from framework_hexagonal.core.container import Container
+from framework_hexagonal.core.ports import Screenshotter
+from framework_hexagonal.utils.coalescing import CoalescingAdapter, SingleFlight
+
+
+class SlowAdapter:
+    def __init__(self):
+        self.captures = 0
+        self.chats = 0
+        self.release = asyncio.Event()
+
+    @property
+    def pool_stats(self):
+        raise AssertionError("properties must not be evaluated")
+
+    async def capture(self, url, **kwargs):
+        self.captures += 1
+        await self.release.wait()
+        if url == "bad":
+            raise ValueError("bad url")
+        return f"{url}:{self.captures}".encode()
+
+    async def chat(self, messages, **kwargs):
+        self.chats += 1
+        for chunk in ("a", "b", "c"):
+            await self.release.wait()
+            yield chunk
+
+    async def close(self):
+        return "closed"
+
+
+async def test_concurrent_identical_calls_share_one_execution():
+    """Test that identical concurrent calls share one execution and errors reach every caller."""
+    adapter = SlowAdapter()
+    container = Container()
+    container.register(Screenshotter, adapter, coalesce=True)
+    coalesced = container.get(Screenshotter)
+
+    calls = [
+        asyncio.ensure_future(coalesced.capture("https://a.test", full_page=True))
+        for _ in range(3)
+    ]
+    other = asyncio.ensure_future(coalesced.capture("https://a.test", full_page=False))
+    await asyncio.sleep(0)
+    adapter.release.set()
+
+    assert await asyncio.gather(*calls) == [b"https://a.test:1"] * 3
+    assert await other == b"https://a.test:2"
+    assert coalesced.stats.as_dict() == {"calls": 4, "executed": 2, "coalesced": 2, "abandoned": 0}
+    assert await coalesced.capture("https://a.test", full_page=True) == b"https://a.test:3"
+    assert await coalesced.close() == "closed"
+
+    adapter.release.clear()
+    failing = [asyncio.ensure_future(coalesced.capture("bad")) for _ in range(2)]
+    await asyncio.sleep(0)
+    adapter.release.set()
+    for result in await asyncio.gather(*failing, return_exceptions=True):
+        assert isinstance(result, ValueError)
+
+
+async def test_cancellation_only_stops_abandoned_calls():
+    """Test that a call is only cancelled once every waiter has gone."""
+    flights = SingleFlight()
+    started = []
+
+    async def work():
+        started.append(1)
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.ensure_future(flights.do("k", work))
+    second = asyncio.ensure_future(flights.do("k", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "done"
+    assert len(started) == 1
+
+    lone = asyncio.ensure_future(flights.do("k", work))
+    await asyncio.sleep(0)
+    lone.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await lone
+    assert flights.stats.abandoned == 1
+    assert flights.in_flight() == 0
+
+
+async def test_streams_fan_out_to_late_subscribers():
+    """Test that named streams are shared, replayed to late subscribers and kept for the rest."""
+    adapter = SlowAdapter()
+    # Streams are shared only when named
+    assert CoalescingAdapter(adapter).chat.__func__ is SlowAdapter.chat
+    coalesced = CoalescingAdapter(adapter, methods=("capture", "chat"))
+    adapter.release.set()
+
+    async def consume(delay, content="hi"):
+        await asyncio.sleep(delay)
+        return [chunk async for chunk in coalesced.chat([{"role": "user", "content": content}])]
+
+    adapter.release.clear()
+    early = asyncio.ensure_future(consume(0))
+    late = asyncio.ensure_future(consume(0.01))
+    await asyncio.sleep(0.02)
+    adapter.release.set()
+
+    assert await early == await late == ["a", "b", "c"]
+    assert adapter.chats == 1
+
+    # A subscriber leaving early does not stop the stream for the others
+    adapter.release.clear()
+    stream = coalesced.chat([{"role": "user", "content": "again"}])
+    other = asyncio.ensure_future(consume(0, "again"))
+    adapter.release.set()
+    assert await stream.__anext__() == "a"
+    await stream.aclose()
+    assert await other == ["a", "b", "c"]
+    assert adapter.chats == 2
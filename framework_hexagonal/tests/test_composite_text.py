@@ -0,0 +1,174 @@
+"""Tests for the hedging, failover composite TextAI adapter."""
+import asyncio
+
+import pytest
+
+from framework_hexagonal.adapters.outbound.composite_text import (
+    CompositeTextAIAdapter,
+    TextAIBackend,
+)
+from framework_hexagonal.utils.circuit_breaker import CircuitBreaker
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FakeBackend:
+    def __init__(self, name, delay=0.0, fail=False, error=None):
+        self.default_model = name
+        self.delay = delay
+        self.fail = fail
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+        self.closed = 0
+        self.models = []
+
+    async def analyze(self, text, prompt, model=None, **kwargs):
+        self.calls += 1
+        self.models.append(model)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        if self.fail:
+            raise ConnectionError(f"{self.default_model} down")
+        return f"{self.default_model}:{text}"
+
+    async def chat(self, messages, model=None, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise ConnectionError(f"{self.default_model} down")
+            for chunk in ("a", "b", "c"):
+                yield f"{self.default_model}-{chunk}"
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.closed += 1
+
+
+async def test_slow_primary_is_hedged_and_loser_cancelled():
+    """Test that a slow backend is hedged and the losing call cancelled."""
+    slow, fast = FakeBackend("slow", delay=5.0), FakeBackend("fast", delay=0.01)
+    composite = CompositeTextAIAdapter([slow, fast], initial_hedge_delay=0.05)
+
+    assert await composite.analyze("x", "p") == "fast:x"
+    assert slow.cancelled == 1
+
+    stats = composite.backend_stats
+    assert stats["fast"].hedges == 1 and stats["fast"].hedge_wins == 1
+    assert stats["slow"].cancelled == 1 and stats["slow"].failures == 0
+    assert stats["slow"].in_flight == 0 and stats["fast"].in_flight == 0
+    assert stats["fast"].analyze_p95 is not None
+
+    # The cancelled call is a lower bound on the slow backend's latency,
+    # so the fast one is routed to first
+    slow.calls = 0
+    assert await composite.analyze("y", "p") == "fast:y"
+    assert slow.calls == 0
+
+
+async def test_cancelled_losers_do_not_make_a_slow_backend_look_fast():
+    """Test that cancelled hedges keep a slow backend ranked behind a fast one."""
+    slow, fast = FakeBackend("slow", delay=0.6), FakeBackend("fast", delay=0.02)
+    composite = CompositeTextAIAdapter([slow, fast], initial_hedge_delay=0.1)
+
+    # Both are unmeasured, so the slow backend goes first and loses the hedge
+    assert await composite.analyze("a", "p") == "fast:a"
+    for index in range(3):
+        # A slow response from the fast backend hedges to the slow one,
+        # which is cancelled shortly after it starts
+        fast.delay = 0.15
+        assert await composite.analyze(f"hiccup{index}", "p") == f"fast:hiccup{index}"
+        fast.delay = 0.02
+        assert await composite.analyze(f"b{index}", "p") == f"fast:b{index}"
+
+    stats = composite.backend_stats
+    assert slow.calls == 4 and slow.cancelled == 4
+    assert stats["fast"].hedges == 1
+    assert stats["slow"].hedges == 3
+    # Cancelled calls are not latency samples
+    assert stats["slow"].analyze_p50 is None
+    assert [backend.name for backend in composite._ranked("analyze")] == ["fast", "slow"]
+
+
+async def test_chat_races_on_first_chunk_then_streams_winner():
+    """Test that chat races on the first chunk and streams only from the winner."""
+    slow, fast = FakeBackend("slow", delay=5.0), FakeBackend("fast", delay=0.01)
+    composite = CompositeTextAIAdapter([slow, fast], initial_hedge_delay=0.05)
+
+    chunks = [chunk async for chunk in composite.chat([{"role": "user", "content": "hi"}])]
+
+    assert chunks == ["fast-a", "fast-b", "fast-c"]
+    assert slow.cancelled == 1 and slow.closed == 1
+    assert fast.closed == 1
+    assert composite.backend_stats["fast"].chat_p50 is not None
+    assert all(s.in_flight == 0 for s in composite.backend_stats.values())
+
+
+async def test_failover_and_circuit_breaker():
+    """Test failover to the next backend and the circuit opening after failures."""
+    down = FakeBackend("down", fail=True)
+    local = FakeBackend("local")
+    composite = CompositeTextAIAdapter(
+        [down, TextAIBackend("local", local, model="llama3")],
+        hedge=False,
+        failure_threshold=2,
+        reset_timeout=60,
+    )
+
+    assert await composite.analyze("a", "p") == "local:a"
+    assert local.models == ["llama3"]
+    assert await composite.analyze("b", "p") == "local:b"
+    assert composite.backend_stats["down"].state == "open"
+    assert composite.backend_stats["down"].failures == 2
+
+    down.calls = 0
+    assert await composite.analyze("c", "p") == "local:c"
+    assert down.calls == 0
+
+    local.fail = True
+    with pytest.raises(ConnectionError):
+        await composite.analyze("d", "p")
+
+
+async def test_client_errors_are_raised_without_failover():
+    """Test that client errors are raised without failover or opening circuits."""
+    primary = FakeBackend("primary", error=FakeStatusError(400))
+    secondary = FakeBackend("secondary")
+    composite = CompositeTextAIAdapter([primary, secondary], failure_threshold=1)
+
+    for _ in range(3):
+        with pytest.raises(FakeStatusError):
+            await composite.analyze("x", "p")
+    assert secondary.calls == 0
+    assert composite.backend_stats["primary"].failures == 0
+    assert composite.backend_stats["primary"].state == "closed"
+
+    # Rate limits still fail over and count against the backend
+    primary.error = FakeStatusError(429)
+    assert await composite.analyze("x", "p") == "secondary:x"
+    assert composite.backend_stats["primary"].state == "open"
+
+
+def test_circuit_breaker_half_open_allows_one_trial():
+    """Test that a half-open circuit admits a single trial call."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
@@ -0,0 +1,92 @@
+"""Tests for the token-budgeted conversation window."""
+import asyncio
+
+import pytest
+
+from framework_hexagonal.utils.conversation import MESSAGE_OVERHEAD_TOKENS, ConversationWindow
+
+
+def words(text):
+    return len(text.split())
+
+
+class FakeSummarizer:
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def analyze(self, text, prompt, model=None, **kwargs):
+        self.calls.append(text)
+        await self.release.wait()
+        return f"summary#{len(self.calls)}"
+
+
+def test_window_keeps_pinned_and_most_recent_turns():
+    """Test that the window keeps pinned messages and the most recent turns that fit."""
+    counted = []
+
+    def counter(text):
+        counted.append(text)
+        return words(text)
+
+    window = ConversationWindow(max_tokens=33, system_prompt="be brief", counter=counter)
+    for index in range(10):
+        window.add("user", f"question {index} " + "x " * 3)
+
+    messages = window.build()
+    # 2 + 4 overhead for the system prompt, 5 + 4 per turn
+    assert messages[0] == {"role": "system", "content": "be brief"}
+    assert [m["content"].split()[1] for m in messages[1:]] == ["7", "8", "9"]
+
+    # Counts are cached per message
+    window.build()
+    assert len(counted) == 11
+    assert sum(window.count(m) for m in messages) == 33
+    assert len(window.history) == 10
+
+    # The latest turn is sent even if it alone exceeds the budget
+    window.add("user", "y " * 100)
+    assert window.build()[1:] == [{"role": "user", "content": "y " * 100}]
+
+    with pytest.raises(ValueError):
+        ConversationWindow(max_tokens=0)
+
+
+async def test_dropped_turns_are_summarized_in_the_background():
+    """Test that dropped turns are folded into a summary without blocking build."""
+    summarizer = FakeSummarizer()
+    window = ConversationWindow(
+        max_tokens=3 * (1 + MESSAGE_OVERHEAD_TOKENS),
+        counter=lambda text: 1,
+        summarizer=summarizer,
+        min_summary_turns=2,
+    )
+    for index in range(4):
+        window.add("user", f"turn {index}")
+
+    # Building never waits for the summary
+    summarizer.release.clear()
+    assert [m["content"] for m in window.build()] == ["turn 1", "turn 2", "turn 3"]
+    window.add("assistant", "turn 4")
+    window.build()
+    summarizer.release.set()
+    await window.wait_for_summary()
+
+    assert window.summary == "summary#1"
+    assert "user: turn 0" in summarizer.calls[0] and "turn 1" in summarizer.calls[0]
+    messages = window.build()
+    assert messages[0]["role"] == "system" and messages[0]["content"].endswith("summary#1")
+    assert [m["content"] for m in messages[1:]] == ["turn 3", "turn 4"]
+
+    # Later drops update the summary incrementally
+    window.add("user", "turn 5")
+    window.add("assistant", "turn 6")
+    window.build()
+    await window.wait_for_summary()
+    assert summarizer.calls[-1].startswith("Current summary:\nsummary#1")
+    assert window.summary == "summary#2"
+
+    window.clear()
+    assert window.build() == [] and window.summary is None
+    await window.close()
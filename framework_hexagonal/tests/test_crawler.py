@@ -0,0 +1,134 @@
+"""Tests for the site crawler."""
+import json
+
+import pytest
+
+from framework_hexagonal.adapters.outbound.html_parsers import link_extractor
+from framework_hexagonal.core.ports import FetchedPage
+from framework_hexagonal.utils.crawler import (
+    BloomFilter,
+    Crawler,
+    JSONLSink,
+    MemorySink,
+    normalize_url,
+)
+
+SITE = {
+    "https://example.com/robots.txt": "User-agent: *\nDisallow: /admin",
+    "https://example.com/": (
+        "<title>Home</title><a href='/about#team'>About</a>"
+        "<a href='/pricing?utm_source=x'>Pricing</a><a href='/admin'>Admin</a>"
+        "<a href='https://other.example/'>Elsewhere</a><a href='mailto:hi@example.com'>Mail</a>"
+    ),
+    "https://example.com/about": "<title>About</title><a href='/'>Home</a><a href='/deep'>Deep</a>",
+    "https://example.com/pricing": "<title>Pricing</title><a href='/missing'>Broken</a>",
+    "https://example.com/deep": "<title>Deep</title><a href='/deeper'>Deeper</a>",
+}
+
+
+class SiteFetcher:
+    """WebFetcher serving pages from an in-memory site."""
+
+    def __init__(self, site=SITE, redirects=None):
+        self.site = site
+        self.redirects = redirects or {}
+        self.requested = []
+
+    async def fetch(self, url, headers=None, timeout=30.0, parse=True, **kwargs):
+        self.requested.append(url)
+        url = self.redirects.get(url, url)
+        if url not in self.site:
+            raise ValueError(f"404 for {url}")
+        return FetchedPage(url=url, status_code=200, html=self.site[url], parser=None)
+
+
+def test_normalize_url():
+    """Test URL normalization used for deduplication."""
+    assert normalize_url("HTTPS://Example.COM:443/a?b=2&a=1&utm_medium=x#frag") == (
+        "https://example.com/a?a=1&b=2"
+    )
+    assert normalize_url("../c", base="http://example.com:8080/a/b") == "http://example.com:8080/c"
+    assert normalize_url("javascript:void(0)") is None
+
+    bloom = BloomFilter(capacity=100)
+    assert bloom.add("https://example.com/")
+    assert not bloom.add("https://example.com/")
+
+
+@pytest.mark.asyncio
+async def test_crawler_respects_scope_depth_and_robots(tmp_path):
+    """Test dedup, depth limit, robots.txt, host scoping and error capture."""
+    fetcher = SiteFetcher()
+    sink = MemorySink()
+    crawler = Crawler(fetcher, sink=sink, max_depth=2, politeness_delay=0.0, concurrency=3)
+
+    stats = await crawler.crawl(["https://example.com"])
+
+    by_url = {result.url: result for result in sink.results}
+    assert set(by_url) == {
+        "https://example.com/",
+        "https://example.com/about",
+        "https://example.com/pricing",
+        "https://example.com/deep",
+        "https://example.com/missing",
+    }
+    assert by_url["https://example.com/"].title == "Home"
+    assert by_url["https://example.com/deep"].depth == 2
+    assert by_url["https://example.com/missing"].error.startswith("ValueError")
+    assert "https://example.com/admin" not in fetcher.requested
+    assert fetcher.requested.count("https://example.com/") == 1
+    assert stats.pages == 5
+    assert stats.errors == 1
+    assert stats.skipped_by_robots == 1
+
+    path = tmp_path / "crawl.jsonl"
+    await Crawler(
+        SiteFetcher(), sink=JSONLSink(path), max_pages=2, politeness_delay=0.0
+    ).crawl(["https://example.com/"])
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 2
+
+
+@pytest.mark.asyncio
+async def test_robots_disallowed_urls_do_not_use_the_page_budget():
+    """Test that max_pages counts fetched pages, not disallowed URLs."""
+    admin_links = "".join(f"<a href='/admin/{i}'>A</a>" for i in range(20))
+    page_links = "".join(f"<a href='/p{i}'>P</a>" for i in range(5))
+    site = {
+        "https://example.com/robots.txt": "User-agent: *\nDisallow: /admin",
+        "https://example.com/": admin_links + page_links,
+        **{f"https://example.com/p{i}": "<title>P</title>" for i in range(5)},
+    }
+    fetcher = SiteFetcher(site)
+    crawler = Crawler(fetcher, max_pages=6, politeness_delay=0.0, concurrency=4)
+
+    stats = await crawler.crawl(["https://example.com/"])
+
+    assert stats.pages == 6
+    assert stats.skipped_by_robots == 20
+    assert not any("/admin" in url for url in fetcher.requested)
+
+
+@pytest.mark.asyncio
+async def test_start_url_redirect_extends_host_scope():
+    """Test that a seed redirecting to another host is crawled on that host."""
+    site = {
+        "https://www.example.com/": "<title>Home</title><a href='/about'>About</a>",
+        "https://www.example.com/about": "<title>About</title><a href='/'>Home</a>",
+    }
+    fetcher = SiteFetcher(site, redirects={"https://example.com/": "https://www.example.com/"})
+    sink = MemorySink()
+    crawler = Crawler(
+        fetcher,
+        sink=sink,
+        politeness_delay=0.0,
+        respect_robots=False,
+        link_extractor=link_extractor("bs4"),
+    )
+
+    stats = await crawler.crawl(["https://example.com/"])
+
+    assert [result.title for result in sink.results] == ["Home", "About"]
+    # The final URL of the seed is not fetched again
+    assert fetcher.requested == ["https://example.com/", "https://www.example.com/about"]
+    assert stats.pages == 2
@@ -0,0 +1,47 @@
+"""Tests for the pluggable HTML parser backends."""
+import pytest
+
+from framework_hexagonal.adapters.outbound.html_parsers import (
+    PARSER_BACKENDS,
+    BeautifulSoupBackend,
+    get_parser_backend,
+)
+
+SAMPLE_HTML = """<?xml version="1.0" encoding="utf-8"?>
+<html><head><title>Title</title><style>p { color: red; }</style>
+<script>var tracking = true;</script></head>
+<body><nav><a href="/">Home</a></nav>
+<h1> Main   heading </h1><p class="lead">Hello <b>world</b> &amp; friends</p>
+<template><span>hidden</span></template><!-- comment -->
+<p>Second paragraph</p></body></html>"""
+
+
+@pytest.fixture(params=list(PARSER_BACKENDS))
+def backend(request):
+    """Yield each installed parser backend."""
+    try:
+        return PARSER_BACKENDS[request.param]()
+    except ImportError:
+        pytest.skip(f"{request.param} is not installed")
+
+
+def test_backend_matches_beautifulsoup(backend):
+    """Test that every backend extracts the same text as BeautifulSoup."""
+    reference = BeautifulSoupBackend()
+
+    assert backend.get_text(SAMPLE_HTML) == reference.get_text(SAMPLE_HTML)
+    assert backend.select_text(SAMPLE_HTML, "p") == reference.select_text(SAMPLE_HTML, "p")
+    assert backend.select_text(SAMPLE_HTML, "h1, p.lead") == [
+        "Main   heading",
+        "Helloworld& friends",
+    ]
+    assert backend.select_attr(SAMPLE_HTML, "a", "href") == ["/"]
+
+
+def test_get_parser_backend():
+    """Test backend lookup by name."""
+    assert get_parser_backend("bs4").name == "bs4"
+    assert get_parser_backend("auto").name in PARSER_BACKENDS
+
+    with pytest.raises(ValueError):
+        get_parser_backend("regex")
@@ -0,0 +1,116 @@
+"""Tests for the web fetcher HTTP cache."""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from framework_hexagonal.adapters.outbound.http_cache import (
+    PARSED_PAGE_SIZE_FACTOR,
+    CachedResponse,
+    FileHTTPCacheBackend,
+    HTTPCache,
+    MemoryHTTPCacheBackend,
+)
+from framework_hexagonal.adapters.outbound.httpx_fetcher import HttpxWebFetcherAdapter
+from framework_hexagonal.core.ports.web_fetcher import FetchedPage
+
+
+def make_origin(requests):
+    """Create a mock origin honouring If-None-Match for /etag."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/etag":
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, html="<h1>etag</h1>", headers={"ETag": '"v1"'})
+        if request.url.path == "/fresh":
+            return httpx.Response(
+                200, html="<h1>fresh</h1>", headers={"Cache-Control": "max-age=60"}
+            )
+        return httpx.Response(200, html="<h1>private</h1>", headers={"Cache-Control": "no-store"})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_cache_revalidates_and_serves_fresh_hits():
+    """Test fresh hits, 304 revalidation and no-store handling."""
+    requests = []
+    cache = HTTPCache()
+    async with HttpxWebFetcherAdapter(transport=make_origin(requests), cache=cache) as fetcher:
+        first = await fetcher.fetch("https://example.com/etag")
+        first_soup = first.soup
+        second = await fetcher.fetch("https://example.com/etag")
+
+        await fetcher.fetch("https://example.com/fresh")
+        await fetcher.fetch("https://example.com/fresh")
+
+        await fetcher.fetch("https://example.com/private")
+        await fetcher.fetch("https://example.com/private")
+
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert second.html == "<h1>etag</h1>"
+    assert second.soup is first_soup
+    assert [r.url.path for r in requests] == ["/etag", "/etag", "/fresh", "/private", "/private"]
+    assert cache.stats.as_dict() == {
+        "hits": 1,
+        "misses": 4,
+        "revalidated": 1,
+        "stored": 2,
+        "bytes_saved": len("<h1>etag</h1>") + len("<h1>fresh</h1>"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_file_backend_persists_across_instances(tmp_path):
+    """Test that the on-disk backend revalidates entries written by another cache."""
+    requests = []
+    transport = make_origin(requests)
+    async with HttpxWebFetcherAdapter(
+        transport=transport, cache=HTTPCache(FileHTTPCacheBackend(tmp_path))
+    ) as fetcher:
+        await fetcher.fetch("https://example.com/etag")
+
+    cache = HTTPCache(FileHTTPCacheBackend(tmp_path))
+    async with HttpxWebFetcherAdapter(transport=transport, cache=cache) as fetcher:
+        page = await fetcher.fetch("https://example.com/etag")
+
+    assert page.soup.h1.get_text() == "etag"
+    assert cache.stats.revalidated == 1
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_file_backend_concurrent_writes_and_stale_schema(tmp_path):
+    """Test that concurrent writes of one URL succeed and unreadable entries are misses."""
+    backend = FileHTTPCacheBackend(tmp_path)
+    entry = CachedResponse(
+        url="https://example.com/", status_code=200, html="<p>x</p>", headers={}, stored_at=0.0
+    )
+
+    await asyncio.gather(*(backend.set("https://example.com/", entry) for _ in range(20)))
+
+    assert await backend.get("https://example.com/") == entry
+    assert not list(tmp_path.glob("*.tmp"))
+
+    path = next(tmp_path.glob("*.json"))
+    path.write_text(json.dumps({**entry.to_dict(), "removed_field": 1}), encoding="utf-8")
+    assert await backend.get("https://example.com/") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_counts_kept_pages_in_its_size_bound():
+    """Test that parsed pages kept in memory count towards max_bytes."""
+    html = "<p>x</p>" * 100
+    backend = MemoryHTTPCacheBackend(max_bytes=2 * len(html) * (1 + PARSED_PAGE_SIZE_FACTOR))
+    for index in range(3):
+        url = f"https://example.com/{index}"
+        page = FetchedPage(url=url, status_code=200, html=html, headers={}, parser="html.parser")
+        entry = CachedResponse(
+            url=url, status_code=200, html=html, headers={}, stored_at=0.0, page=page
+        )
+        await backend.set(url, entry)
+
+    assert await backend.get("https://example.com/0") is None
+    assert await backend.get("https://example.com/2") is not None
@@ -0,0 +1,194 @@
+"""Tests for the HTTPX web fetcher adapter."""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from framework_hexagonal.adapters.outbound.httpx_fetcher import (
+    HTML_CONTENT_TYPES,
+    HttpxWebFetcherAdapter,
+)
+from framework_hexagonal.core.ports import ResponseTooLargeError, UnsupportedContentTypeError
+
+
+def make_transport(requests=None):
+    """Create a mock transport serving a small HTML page for every URL."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        html = f"<html><body><h1>Page {request.url.path}</h1><p>Body</p></body></html>"
+        return httpx.Response(200, html=html)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_fetcher_reuses_client():
+    """Test that consecutive fetches share one pooled client."""
+    fetcher = HttpxWebFetcherAdapter(transport=make_transport())
+
+    page = await fetcher.fetch("https://example.com/a")
+    client = fetcher._client
+    await fetcher.fetch("https://example.com/b")
+
+    assert page.status_code == 200
+    assert page.soup.h1.get_text() == "Page /a"
+    assert fetcher._client is client
+
+    await fetcher.aclose()
+    assert fetcher._client is None
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_fetcher_context_manager():
+    """Test that the adapter closes its pool when used as a context manager."""
+    async with HttpxWebFetcherAdapter(transport=make_transport()) as fetcher:
+        text = await fetcher.get_text("https://example.com/", selector="h1")
+        client = fetcher._client
+
+    assert text == "Page /"
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_fetch_parses_lazily():
+    """Test that the soup is only built on first access and then cached."""
+    async with HttpxWebFetcherAdapter(transport=make_transport()) as fetcher:
+        page = await fetcher.fetch("https://example.com/lazy")
+        assert not page.is_parsed
+
+        soup = page.soup
+        assert page.is_parsed
+        assert page.soup is soup
+
+        raw = await fetcher.fetch("https://example.com/raw", parse=False)
+        assert "<h1>Page /raw</h1>" in raw.html
+        assert raw.soup is None
+
+
+@pytest.mark.asyncio
+async def test_get_text_off_loop_keeps_event_loop_responsive():
+    """Test that event-loop lag stays bounded while a large page is parsed."""
+    html = "<html><body>" + "".join(
+        f"<div><h2>Item {i}</h2><p>Description of item {i}</p></div>" for i in range(10000)
+    ) + "</body></html>"
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, html=html))
+
+    async with HttpxWebFetcherAdapter(
+        transport=transport, text_backend="bs4", executor="process", max_workers=1
+    ) as fetcher:
+        # Warm up the worker process so start-up cost is not measured
+        await fetcher.get_text("https://example.com/warmup", selector="h2")
+
+        max_lag = 0.0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal max_lag
+            while not done.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(0.005)
+                max_lag = max(max_lag, time.perf_counter() - start - 0.005)
+
+        ticker_task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        text = await fetcher.get_text("https://example.com/large")
+        parse_seconds = time.perf_counter() - start
+        done.set()
+        await ticker_task
+
+    assert text.startswith("Item 0Description of item 0")
+    assert max_lag < 0.1
+    assert max_lag < parse_seconds / 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_limits_and_error_capture():
+    """Test per-host limits, completion-order streaming and per-URL errors."""
+    in_flight = {}
+    peak = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        try:
+            if request.url.path == "/slow":
+                await asyncio.sleep(1)
+            else:
+                await asyncio.sleep(0.01)
+            if request.url.path == "/missing":
+                return httpx.Response(404, html="not found")
+            return httpx.Response(200, html=f"<p>{request.url}</p>")
+        finally:
+            in_flight[host] -= 1
+
+    urls = [f"https://a.example/{i}" for i in range(6)] + [
+        "https://b.example/slow",
+        "https://b.example/missing",
+        "not a url",
+    ]
+    async with HttpxWebFetcherAdapter(transport=httpx.MockTransport(handler)) as fetcher:
+        pages = [
+            page
+            async for page in fetcher.fetch_many(urls, concurrency=4, per_host=2, timeout=0.2)
+        ]
+
+    by_url = {page.url: page for page in pages}
+    assert len(pages) == len(urls)
+    assert peak["a.example"] == 2
+    assert all(by_url[f"https://a.example/{i}"].ok for i in range(6))
+    assert isinstance(by_url["https://b.example/slow"].error, asyncio.TimeoutError)
+    assert by_url["https://b.example/missing"].status_code == 404
+    assert not by_url["not a url"].ok
+    assert pages[-1].url == "https://b.example/slow"
+
+
+@pytest.mark.asyncio
+async def test_fetch_enforces_size_cap_and_content_types():
+    """Test that oversized and non-HTML responses are rejected while streaming."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/video.mp4":
+            return httpx.Response(200, content=b"\0" * 1000, headers={"Content-Type": "video/mp4"})
+        if request.url.path == "/chunked":
+            # No Content-Length: the cap must trigger while streaming
+            chunks = [b"<p>" + b"x" * 400 + b"</p>"] * 5
+            return httpx.Response(
+                200, headers={"Content-Type": "text/html"}, stream=ChunkStream(chunks)
+            )
+        return httpx.Response(
+            200, text="<p>café</p>", headers={"Content-Type": "text/html; charset=utf-8"}
+        )
+
+    async with HttpxWebFetcherAdapter(
+        transport=httpx.MockTransport(handler),
+        max_bytes=1024,
+        allowed_content_types=HTML_CONTENT_TYPES,
+    ) as fetcher:
+        page = await fetcher.fetch("https://example.com/")
+        assert page.html == "<p>café</p>"
+
+        with pytest.raises(UnsupportedContentTypeError):
+            await fetcher.fetch("https://example.com/video.mp4")
+        with pytest.raises(ResponseTooLargeError):
+            await fetcher.fetch("https://example.com/chunked")
+
+        chunks = [c async for c in fetcher.iter_chunks("https://example.com/video.mp4")]
+        assert b"".join(chunks) == b"\0" * 1000
+        with pytest.raises(ResponseTooLargeError):
+            async for _ in fetcher.iter_chunks("https://example.com/video.mp4", max_bytes=10):
+                pass
+
+
+class ChunkStream(httpx.AsyncByteStream):
+    """Async byte stream without a known length."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
@@ -0,0 +1,59 @@
+"""Tests for the local artifact store and atomic file writes."""
+import os
+import time
+
+import pytest
+
+from framework_hexagonal.adapters.outbound.local_artifact_store import LocalArtifactStoreAdapter
+from framework_hexagonal.utils.files import save_file
+
+
+async def test_save_file_creates_parents_and_leaves_no_temp_files(tmp_path):
+    """Test that atomic saves create parent directories and leave no temp files."""
+    path = await save_file(tmp_path / "a" / "b.png", b"one")
+    await save_file(path, b"two")
+    assert path.read_bytes() == b"two"
+    assert os.listdir(path.parent) == ["b.png"]
+
+
+async def test_put_deduplicates_by_content(tmp_path):
+    """Test that artifacts are keyed by content digest and stored once."""
+    store = LocalArtifactStoreAdapter(tmp_path, base_url="/static/")
+    first = await store.put(b"image", namespace="screenshots", extension="png")
+    second = await store.put(b"image", namespace="screenshots", extension="png")
+
+    assert first.created and not second.created
+    assert first.key == second.key == f"screenshots/{first.digest}.png"
+    assert first.url == f"/static/screenshots/{first.digest}.png"
+    assert first.content_type == "image/png"
+    assert await store.get(first.key) == b"image"
+
+    assert await store.delete(first.key)
+    assert not await store.delete(first.key)
+    with pytest.raises(KeyError):
+        await store.get(first.key)
+    with pytest.raises(ValueError):
+        await store.get("../outside.png")
+
+
+async def test_collect_garbage_by_age_then_size(tmp_path):
+    """Test that garbage collection drops old artifacts, then the oldest beyond the size cap."""
+    store = LocalArtifactStoreAdapter(tmp_path, max_age=3600, max_bytes=10)
+    old = await store.put(b"x" * 4, extension="png")
+    middle = await store.put(b"y" * 6, extension="png")
+    new = await store.put(b"z" * 6, extension="png")
+    now = time.time()
+    os.utime(tmp_path / old.key, (now - 7200, now - 7200))
+    os.utime(tmp_path / middle.key, (now - 60, now - 60))
+    (tmp_path / ".stale.png.1.1.tmp").write_bytes(b"partial")
+    os.utime(tmp_path / ".stale.png.1.1.tmp", (now - 7200, now - 7200))
+
+    result = await store.collect_garbage()
+
+    assert result.as_dict() == {
+        "removed": 2,
+        "freed_bytes": 10,
+        "remaining": 1,
+        "remaining_bytes": 6,
+    }
+    assert sorted(os.listdir(tmp_path)) == [new.key]
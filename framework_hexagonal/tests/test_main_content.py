@@ -0,0 +1,82 @@
+"""Tests for main-content extraction."""
+import pickle
+
+import pytest
+
+from framework_hexagonal.adapters.outbound.html_parsers import BeautifulSoupBackend
+from framework_hexagonal.adapters.outbound.main_content import extract_main_content
+
+ARTICLE = " ".join(
+    f"Teams using our platform shipped {i} times faster, cut churn, and grew revenue."
+    for i in range(12)
+)
+
+LANDING_PAGE = f"""<html><head><title>Acme | Growth</title>
+<meta name="description" content="Grow faster with Acme.">
+<script>window.analytics = {{}};</script></head>
+<body>
+<header><nav><a href="/">Home</a><a href="/pricing">Pricing</a><a href="/blog">Blog</a>
+<a class="btn btn-primary" href="/signup">Start free trial</a></nav></header>
+<div id="cookie-banner">We use cookies to improve your experience. Accept all cookies?</div>
+<div class="content">
+  <h1>Grow your revenue</h1>
+  <p>{ARTICLE}</p>
+  <h2>Why Acme</h2>
+  <ul><li>Fast onboarding, measured in minutes, not weeks.</li></ul>
+  <button>Book a demo</button>
+</div>
+<aside class="sidebar"><h3>Related posts</h3><a href="/a">A</a></aside>
+<footer><a href="/privacy">Privacy</a> &copy; 2024 Acme Inc.</footer>
+</body></html>"""
+
+
+def test_extract_main_content_removes_boilerplate():
+    """Test that boilerplate is dropped while structure is kept."""
+    content = extract_main_content(LANDING_PAGE, url="https://acme.example/")
+    full_text = BeautifulSoupBackend().get_text(LANDING_PAGE)
+
+    assert content.title == "Acme | Growth"
+    assert content.description == "Grow faster with Acme."
+    assert content.text.startswith("Grow your revenue\nTeams using our platform")
+    assert "cookies" not in content.text
+    assert "Privacy" not in content.text
+    assert "Pricing" not in content.text
+    assert len(content.text) < len(full_text)
+    assert {"level": "h2", "text": "Why Acme"} in content.headings
+    assert [cta["text"] for cta in content.ctas] == ["Start free trial", "Book a demo"]
+    assert content.ctas[0]["href"] == "https://acme.example/signup"
+    assert {"text": "Pricing", "href": "https://acme.example/pricing"} in content.links
+
+    # Results cross process boundaries when extraction runs in a process pool
+    assert pickle.loads(pickle.dumps(content)) == content
+
+
+@pytest.mark.parametrize("tree_builder", ["html.parser", "lxml"])
+def test_extract_main_content_tree_builders(tree_builder):
+    """Test extraction with each BeautifulSoup tree builder."""
+    if tree_builder == "lxml":
+        pytest.importorskip("lxml")
+    content = extract_main_content(LANDING_PAGE, tree_builder=tree_builder)
+
+    assert "Why Acme" in content.text
+
+
+def test_extract_main_content_keeps_hero_sections():
+    """Test that hero sections are not mistaken for banner boilerplate."""
+    html = f"""<html><body>
+    <header class="site-header"><h1>Launch campaigns in minutes</h1>
+      <nav><a href="/">Home</a></nav></header>
+    <section class="hero-banner"><h2>Trusted by 4,000 teams</h2>
+      <a class="cta" href="/signup">Get started</a></section>
+    <div class="cookie-banner">Accept all cookies?</div>
+    <div class="share-buttons"><h3>Share this page</h3></div>
+    <div class="content"><p>{ARTICLE}</p></div>
+    </body></html>"""
+
+    content = extract_main_content(html, url="https://acme.example/")
+
+    assert content.headings == [
+        {"level": "h1", "text": "Launch campaigns in minutes"},
+        {"level": "h2", "text": "Trusted by 4,000 teams"},
+    ]
+    assert "cookies" not in content.text
@@ -0,0 +1,110 @@
+"""Tests for the metrics registry and TextAI instrumentation."""
+import asyncio
+
+import pytest
+
+from framework_hexagonal.adapters.outbound.instrumented_text import InstrumentedTextAIAdapter
+from framework_hexagonal.utils.metrics import MetricsRegistry, add_metrics_route
+
+
+class StreamingTextAI:
+    default_model = "fake-model"
+
+    def __init__(self, chunks, delay=0.0, fail_after=None):
+        self.chunks = chunks
+        self.delay = delay
+        self.fail_after = fail_after
+
+    async def chat(self, messages, model=None, **kwargs):
+        for index, chunk in enumerate(self.chunks):
+            if index == self.fail_after:
+                raise ConnectionError("stream dropped")
+            await asyncio.sleep(self.delay)
+            yield chunk
+
+    async def analyze(self, text, prompt, model=None, **kwargs):
+        return "x" * 40
+
+
+def test_registry_renders_prometheus_text():
+    """Test the Prometheus text rendering and metric registration checks."""
+    registry = MetricsRegistry()
+    requests = registry.counter("app_requests_total", "Requests", ("route",))
+    latency = registry.histogram("app_latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    requests.inc(route='/a"b')
+    requests.inc(2, route="/c")
+    latency.observe(0.05, route="/c")
+    latency.observe(0.5, route="/c")
+    latency.observe(5, route="/c")
+
+    assert registry.render() == (
+        "# HELP app_latency_seconds Latency\n"
+        "# TYPE app_latency_seconds histogram\n"
+        'app_latency_seconds_bucket{route="/c",le="0.1"} 1\n'
+        'app_latency_seconds_bucket{route="/c",le="1"} 2\n'
+        'app_latency_seconds_bucket{route="/c",le="+Inf"} 3\n'
+        'app_latency_seconds_sum{route="/c"} 5.55\n'
+        'app_latency_seconds_count{route="/c"} 3\n'
+        "# HELP app_requests_total Requests\n"
+        "# TYPE app_requests_total counter\n"
+        'app_requests_total{route="/a\\"b"} 1\n'
+        'app_requests_total{route="/c"} 2\n'
+    )
+    assert registry.counter("app_requests_total", "Requests", ("route",)) is requests
+    with pytest.raises(ValueError):
+        registry.gauge("app_requests_total", "Requests", ("route",))
+    with pytest.raises(ValueError):
+        requests.inc(method="GET")
+
+
+async def test_chat_records_first_token_gaps_and_consumer_time():
+    """Test that chat streams record first-token, gap, consumer and throughput metrics."""
+    registry = MetricsRegistry()
+    streaming = StreamingTextAI(["aaaa"] * 5, delay=0.01)
+    text_ai = InstrumentedTextAIAdapter(streaming, registry=registry)
+
+    async for _ in text_ai.chat([{"role": "user", "content": "hi"}]):
+        await asyncio.sleep(0.02)
+
+    assert text_ai.default_model == "fake-model"
+    assert text_ai.requests.value(method="chat", model="fake-model", status="ok") == 1
+    assert text_ai.time_to_first_token.count(model="fake-model") == 1
+    assert text_ai.chunk_gap.count(model="fake-model") == 4
+    assert text_ai.consumer_time.count(model="fake-model") == 5
+    assert text_ai.consumer_time.sum(model="fake-model") >= 0.1
+    assert text_ai.output_tokens.value(method="chat", model="fake-model") == 5
+    assert text_ai.tokens_per_second.count(model="fake-model") == 1
+    assert text_ai.in_flight.value(method="chat", model="fake-model") == 0
+
+    dropping = StreamingTextAI(["a", "b"], fail_after=1)
+    failing = InstrumentedTextAIAdapter(dropping, registry=registry)
+    with pytest.raises(ConnectionError):
+        async for _ in failing.chat([{"role": "user", "content": "hi"}], model="other"):
+            pass
+    # Both wrappers report into the registry's shared series
+    assert text_ai.requests.value(method="chat", model="other", status="error") == 1
+
+    stream = text_ai.chat([{"role": "user", "content": "hi"}])
+    await stream.__anext__()
+    await stream.aclose()
+    assert text_ai.requests.value(method="chat", model="fake-model", status="cancelled") == 1
+
+    assert await text_ai.analyze("t", "p") == "x" * 40
+    assert text_ai.output_tokens.value(method="analyze", model="fake-model") == 10
+
+
+def test_metrics_route_serves_registry():
+    """Test that the FastAPI route serves the registry in the Prometheus format."""
+    fastapi = pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    registry = MetricsRegistry()
+    registry.counter("app_up", "Up").inc()
+    app = fastapi.FastAPI()
+    add_metrics_route(app, registry)
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "app_up 1" in response.text
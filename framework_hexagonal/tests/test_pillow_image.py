@@ -0,0 +1,53 @@
+"""Tests for the Pillow image processor adapter."""
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from framework_hexagonal.adapters.outbound.pillow_image import PillowImageProcessorAdapter
+from framework_hexagonal.core.ports import MODEL_INPUT_VARIANT, ImageVariant
+
+
+def make_png(width, height, mode="RGB"):
+    output = BytesIO()
+    color = (10, 120, 200, 0) if mode == "RGBA" else (10, 120, 200)
+    Image.new(mode, (width, height), color).save(output, "PNG")
+    return output.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_model_input_variant_is_small_jpeg():
+    """Test that the model-input variant is a downscaled JPEG."""
+    screenshot = make_png(1280, 9000)
+    processor = PillowImageProcessorAdapter(executor="process", max_workers=1)
+    try:
+        variants = await processor.process_variants(
+            screenshot,
+            {"model_input": MODEL_INPUT_VARIANT, "archive": ImageVariant(format="png")},
+        )
+    finally:
+        await processor.aclose()
+
+    model_input = variants["model_input"]
+    assert (model_input.format, model_input.height) == ("jpeg", 2048)
+    assert model_input.width == round(1280 * 2048 / 9000)
+    assert model_input.data.startswith(b"\xff\xd8")
+    assert (variants["archive"].width, variants["archive"].height) == (1280, 9000)
+
+
+@pytest.mark.asyncio
+async def test_transparent_png_flattens_to_white_jpeg():
+    """Test that transparent PNGs are flattened onto white and unknown formats rejected."""
+    processor = PillowImageProcessorAdapter(executor=None)
+
+    processed = await processor.process(
+        make_png(40, 20, mode="RGBA"), format="jpeg", max_dimension=100
+    )
+
+    with Image.open(BytesIO(processed.data)) as image:
+        assert image.mode == "RGB"
+        assert image.size == (40, 20)
+        assert min(image.getpixel((5, 5))) > 245
+
+    with pytest.raises(ValueError):
+        await processor.process(make_png(4, 4), format="gif")
@@ -0,0 +1,78 @@
+"""Tests for screenshotter warm-up and health supervision."""
+import asyncio
+
+import pytest
+
+from framework_hexagonal.adapters.outbound import playwright_screenshot
+from framework_hexagonal.adapters.outbound.playwright_screenshot import (
+    PlaywrightScreenshotterAdapter,
+)
+from framework_hexagonal.tests.conftest import FakeBrowser
+
+
+def make_adapter(**kwargs):
+    adapter = PlaywrightScreenshotterAdapter(**kwargs)
+    adapter.launched = []
+
+    async def launch():
+        browser = FakeBrowser()
+        adapter.launched.append(browser)
+        return browser
+
+    adapter._launch_browser = launch
+    return adapter
+
+
+@pytest.mark.asyncio
+async def test_start_prelaunches_and_warms_contexts():
+    """Test that start launches the browser and warms pooled contexts."""
+    adapter = make_adapter(warm_contexts=2, health_check_interval=None)
+    await adapter.start()
+
+    assert len(adapter.launched) == 1
+    assert adapter.pool_stats.idle == 2
+    await adapter.capture("https://example.com/", wait_until="load")
+    assert adapter.pool_stats.created == 2
+
+    await adapter.close()
+    assert not adapter.health.started
+
+
+@pytest.mark.asyncio
+async def test_supervisor_relaunches_dead_browser():
+    """Test that the supervisor relaunches a disconnected browser."""
+    adapter = make_adapter(health_check_interval=0.02)
+    await adapter.start()
+    first = adapter.launched[0]
+
+    first.connected = False
+    await asyncio.sleep(0.1)
+
+    assert len(adapter.launched) == 2
+    assert adapter.health.last_restart_reason == "disconnected"
+    assert adapter.pool_stats.idle == 1
+    assert adapter._browser is adapter.launched[1]
+    await adapter.close()
+    assert adapter._supervisor is None
+
+
+@pytest.mark.asyncio
+async def test_memory_restart_drains_in_flight_captures(monkeypatch):
+    """Test that a memory restart waits for in-flight captures to finish."""
+    monkeypatch.setattr(playwright_screenshot, "browser_memory_mb", lambda browser_type: 4096.0)
+    adapter = make_adapter(health_check_interval=None, max_browser_memory_mb=2048)
+    await adapter.start()
+    old = adapter.launched[0]
+    leased = await adapter.pool.acquire()
+
+    restart = asyncio.create_task(adapter.check_health())
+    await asyncio.sleep(0.05)
+    assert not restart.done() and old.connected
+    await adapter.pool.release(leased)
+    await restart
+
+    assert not old.connected
+    assert leased.context.closed
+    assert adapter.health.browser_memory_mb == 4096.0
+    assert adapter.health.last_restart_reason == "memory"
+    assert all(item.browser is adapter.launched[1] for item in adapter.pool._idle)
@@ -0,0 +1,134 @@
+"""Tests for screenshot interception profiles."""
+import time
+
+import pytest
+
+from framework_hexagonal.adapters.outbound.playwright_interception import (
+    PROFILES,
+    CaptureReport,
+    InterceptionProfile,
+    NetworkMonitor,
+    get_profile,
+)
+from framework_hexagonal.adapters.outbound.playwright_screenshot import (
+    PlaywrightScreenshotterAdapter,
+)
+from framework_hexagonal.tests.conftest import FakeRequest
+
+RESOURCES = [
+    ("https://example.com/app.css", "stylesheet", 2000),
+    ("https://example.com/hero.jpg", "image", 50000),
+    ("https://example.com/brand.woff2", "font", 30000),
+    ("https://www.googletagmanager.com/gtm.js", "script", 90000),
+    ("https://widget.intercom.io/widget.js", "script", 120000),
+    ("https://www.linkedin.com/px/track", "image", 100),
+]
+
+
+def test_profile_blocks_by_type_and_domain():
+    """Test that profiles block requests by resource type and domain."""
+    fast = PROFILES["fast"]
+    assert fast.blocks("https://example.com/a.woff2", "font")
+    assert fast.blocks("https://js.intercomcdn.com/x.js", "script")
+    assert fast.blocks("https://www.linkedin.com/px/1", "image")
+    assert not fast.blocks("https://www.linkedin.com/company/acme", "document")
+    assert not fast.blocks("https://example.com/app.js", "script")
+    assert not PROFILES["faithful"].intercepts
+
+    with pytest.raises(ValueError):
+        get_profile("turbo")
+
+
+@pytest.mark.asyncio
+async def test_fast_profile_blocks_and_reports(fake_browser):
+    """Test that the fast profile blocks heavy resources and reports what it blocked."""
+    fake_browser.resources = RESOURCES
+    reports = []
+    adapter = PlaywrightScreenshotterAdapter(profile="fast", on_report=reports.append)
+    adapter._browser = fake_browser
+
+    await adapter.capture("https://example.com/")
+    await adapter.capture("https://example.com/", profile="faithful")
+
+    fast, faithful = reports
+    assert (fast.profile, fast.requests, fast.blocked) == ("fast", 6, 4)
+    assert fast.blocked_by_type == {"font": 1, "script": 2, "image": 1}
+    assert fast.bytes_transferred == 52000
+    assert fast.failed == 0
+    assert fast.settled_by == "network-quiet"
+    assert (faithful.blocked, faithful.bytes_transferred) == (0, 292100)
+
+    # The pooled page is reused: the route handler and listeners were removed
+    page = fake_browser.contexts[0].pages[0]
+    assert page.routes == []
+    assert page.goto_calls[0]["wait_until"] == "domcontentloaded"
+    pool_events = ("crash", "framenavigated")
+    assert all(
+        not handlers for event, handlers in page.handlers.items() if event not in pool_events
+    )
+
+
+@pytest.mark.asyncio
+async def test_explicit_wait_until_skips_settling(fake_browser):
+    """Test that an explicit wait_until bypasses network settling."""
+    reports = []
+    quick = InterceptionProfile(name="quick", quiet_ms=10, settle_timeout=0.5)
+    adapter = PlaywrightScreenshotterAdapter(profile=quick, on_report=reports.append)
+    adapter._browser = fake_browser
+
+    await adapter.capture("https://example.com/", wait_until="networkidle")
+    await adapter.capture("https://example.com/")
+
+    assert [report.settled_by for report in reports] == ["networkidle", "network-quiet"]
+    page = fake_browser.contexts[0].pages[0]
+    assert [call["wait_until"] for call in page.goto_calls if call["url"] != "about:blank"] == [
+        "networkidle",
+        "load",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_capture_multi_loads_page_once(fake_browser):
+    """Test that capture_multi loads the page once for every viewport and element."""
+    fake_browser.resources = RESOURCES[:2]
+    fake_browser.elements = ["#hero", "form"]
+    reports = []
+    adapter = PlaywrightScreenshotterAdapter(on_report=reports.append)
+    adapter._browser = fake_browser
+
+    images = await adapter.capture_multi(
+        "https://example.com/",
+        viewports=["desktop", "mobile", {"width": 1920, "height": 1080, "name": "wide"}],
+        selectors=["#hero", "form", "#missing"],
+        wait_until="load",
+    )
+
+    assert images == {
+        "desktop": b"SHOT:https://example.com/@1280",
+        "mobile": b"SHOT:https://example.com/@375",
+        "wide": b"SHOT:https://example.com/@1920",
+        "#hero": b"ELEMENT:#hero",
+        "form": b"ELEMENT:form",
+    }
+    page = fake_browser.contexts[0].pages[0]
+    assert [call["url"] for call in page.goto_calls].count("https://example.com/") == 1
+    assert len(reports) == 1 and reports[0].requests == 2
+
+    with pytest.raises(ValueError):
+        await adapter.capture_multi("https://example.com/", viewports=["watch"])
+
+
+@pytest.mark.asyncio
+async def test_settle_ignores_streams_and_aged_long_polls():
+    """Test that settling ignores streams and long polls older than max_request_age."""
+    profile = InterceptionProfile(
+        name="quick", quiet_ms=20, settle_timeout=2.0, wait_for_fonts=False, max_request_age=0.2
+    )
+    monitor = NetworkMonitor(None, profile, CaptureReport(url="", profile="quick"))
+    monitor._on_request(FakeRequest("https://example.com/events", "eventsource"))
+    monitor._on_request(FakeRequest("https://example.com/poll", "xhr"))
+    assert monitor.in_flight == 1
+
+    start = time.perf_counter()
+    assert await monitor.settle() == "network-quiet"
+    assert 0.2 <= time.perf_counter() - start < 1.0
@@ -0,0 +1,121 @@
+"""Tests for the Playwright browser context pool."""
+import asyncio
+
+import pytest
+
+from framework_hexagonal.adapters.outbound.playwright_pool import BrowserContextPool
+from framework_hexagonal.adapters.outbound.playwright_screenshot import (
+    PlaywrightScreenshotterAdapter,
+)
+
+
+def make_pool(browser, **kwargs):
+    async def factory():
+        return browser
+
+    return BrowserContextPool(factory, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_contexts_and_resets_state(fake_browser):
+    """Test that released contexts are reused with their state reset."""
+    pool = make_pool(fake_browser, max_size=2)
+
+    for _ in range(5):
+        async with pool.page(viewport={"width": 800, "height": 600}) as page:
+            await page.goto("https://example.com/")
+
+    assert len(fake_browser.contexts) == 1
+    context = fake_browser.contexts[0]
+    assert context.cookies_cleared == 5
+    assert page.url == "about:blank"
+    assert page.viewport == {"width": 800, "height": 600}
+    stats = pool.stats
+    assert (stats.created, stats.acquired, stats.idle, stats.in_use) == (1, 5, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_pool_clears_storage_of_every_origin_loaded(fake_browser):
+    """Test that reset clears storage of every origin the context loaded."""
+    pool = make_pool(fake_browser, max_size=1)
+
+    async with pool.page() as page:
+        await page.goto("https://example.com/a")
+        await page.goto("https://login.example.org/")
+    async with pool.page():
+        pass
+
+    context = fake_browser.contexts[0]
+    assert sorted(context.cdp_commands, key=lambda command: command[1]["origin"]) == [
+        ("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        for origin in ("https://example.com", "https://login.example.org")
+    ]
+
+    # Without DevTools protocol access, a context that loaded a page is recycled
+    fake_browser.chromium = False
+    async with pool.page() as page:
+        await page.goto("https://example.com/")
+    async with pool.page():
+        pass
+    assert len(fake_browser.contexts) == 2 and context.closed
+
+
+@pytest.mark.asyncio
+async def test_pool_recycles_after_max_uses_and_crash(fake_browser):
+    """Test that contexts are recycled after max_uses and after a crash."""
+    pool = make_pool(fake_browser, max_size=1, max_uses=2)
+
+    for _ in range(3):
+        async with pool.page():
+            pass
+    assert len(fake_browser.contexts) == 2
+    assert fake_browser.contexts[0].closed
+
+    async with pool.page() as page:
+        page.crash()
+    assert fake_browser.contexts[1].closed
+    async with pool.page():
+        pass
+    assert len(fake_browser.contexts) == 3
+    assert pool.stats.recycled == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_concurrency_and_times_out(fake_browser):
+    """Test that the pool bounds concurrent leases and times out waiting acquires."""
+    pool = make_pool(fake_browser, max_size=2, acquire_timeout=0.05)
+    first = await pool.acquire()
+    second = await pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        await pool.acquire()
+    assert pool.stats.timeouts == 1
+    assert pool.stats.in_use == 2
+
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0.01)
+    await pool.release(first)
+    third = await waiter
+    assert third is first
+    assert pool.stats.max_wait_time >= 0.01
+
+    await pool.release(second)
+    await pool.release(third)
+    await pool.close()
+    assert all(context.closed for context in fake_browser.contexts)
+    assert len(fake_browser.contexts) == 2
+
+
+@pytest.mark.asyncio
+async def test_screenshotter_captures_through_pool(fake_browser):
+    """Test that the screenshotter captures through pooled contexts."""
+    adapter = PlaywrightScreenshotterAdapter(pool_size=2)
+    adapter._browser = fake_browser
+
+    shots = await asyncio.gather(
+        *(adapter.capture(f"https://example.com/{i}") for i in range(6))
+    )
+
+    assert shots[3] == b"SHOT:https://example.com/3@1280"
+    assert len(fake_browser.contexts) <= 2
+    assert adapter.pool_stats.acquired == 6
@@ -8,6 +8,8 @@ from framework_hexagonal.core.ports import (
     WebSearch,
     WebFetcher,
     Screenshotter,
+    ImageProcessor,
+    MODEL_INPUT_VARIANT,
     DBGateway,
 )
 from framework_hexagonal.tests.conftest import TestModel
@@ -82,10 +84,27 @@ async def test_web_fetcher(container):
     assert "<h1>Example Page for https://example.com</h1>" in page.html
     assert page.soup is not None
     
+    # Test fetch_many method
+    pages = [p async for p in web_fetcher.fetch_many(["https://a.example", "https://b.example"])]
+    
+    assert [p.url for p in pages] == ["https://a.example", "https://b.example"]
+    assert all(p.ok for p in pages)
+    
     # Test get_text method
     text = await web_fetcher.get_text("https://example.com", selector="h1")
     
     assert "Text content from https://example.com" in text
+    
+    # Test extract_content method
+    content = await web_fetcher.extract_content("https://example.com")
+    
+    assert content.title == "Example Page"
+    assert content.headings[0]["level"] == "h1"
+    
+    # Test iter_chunks method
+    body = b"".join([chunk async for chunk in web_fetcher.iter_chunks("https://example.com")])
+    
+    assert body.startswith(b"<html>")
 
 
 @pytest.mark.asyncio
@@ -105,6 +124,32 @@ async def test_screenshotter(container):
     )
     
     assert element_screenshot == b"MOCK_ELEMENT_SCREENSHOT_DATA"
+    
+    # Test capture_multi method
+    images = await screenshotter.capture_multi(
+        "https://example.com",
+        viewports=["desktop", {"width": 375, "height": 812}],
+        selectors=["#header"],
+    )
+    
+    assert set(images) == {"desktop", "375x812", "#header"}
+
+
+@pytest.mark.asyncio
+async def test_image_processor(container):
+    """Test ImageProcessor port."""
+    image_processor = container.get(ImageProcessor)
+    
+    # Test process method
+    processed = await image_processor.process(b"PNG", format="webp")
+    
+    assert processed.mime_type == "image/webp"
+    assert processed.to_data_url() == "data:image/webp;base64,UE5H"
+    
+    # Test process_variants method
+    variants = await image_processor.process_variants(b"PNG", {"model_input": MODEL_INPUT_VARIANT})
+    
+    assert variants["model_input"].format == "jpeg"
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,150 @@
+"""Tests for client-side rate limiting and its OpenAI integration."""
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from framework_hexagonal.adapters.outbound.openai_text import OpenAITextAdapter
+from framework_hexagonal.utils.rate_limit import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    AdaptiveConcurrency,
+    RateLimiter,
+    TokenBucket,
+    estimate_tokens,
+)
+
+
+class FakeOpenAIServer:
+    """httpx transport answering chat completions, with scripted 429s."""
+
+    def __init__(self, rate_limited=0, retry_after_ms=50):
+        self.rate_limited = rate_limited
+        self.retry_after_ms = retry_after_ms
+        self.requests = []
+
+    async def __call__(self, request):
+        body = json.loads(request.content)
+        self.requests.append((time.monotonic(), body))
+        if self.rate_limited:
+            self.rate_limited -= 1
+            return httpx.Response(
+                429,
+                headers={"retry-after-ms": str(self.retry_after_ms)},
+                json={"error": {"message": "Rate limit reached", "type": "requests"}},
+            )
+        if body.get("stream"):
+            events = [
+                {"id": "c", "object": "chat.completion.chunk", "created": 0, "model": body["model"],
+                 "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}]}
+                for text in ("Hel", "lo")
+            ]
+            sse = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=sse)
+        return httpx.Response(200, json={
+            "id": "c", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": "analysis"}}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        })
+
+
+def make_adapter(server, limiter):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    return OpenAITextAdapter(api_key="test", rate_limiter=limiter, http_client=client)
+
+
+def test_estimates_and_token_bucket():
+    """Test token estimates and token bucket refill timing."""
+    messages = [
+        {"role": "user", "content": "x" * 400},
+        {"role": "user", "content": [{"type": "text", "text": "y" * 40}]},
+    ]
+    assert estimate_tokens(messages, max_tokens=100) == 210
+    assert estimate_tokens("abcd") == 513
+
+    bucket = TokenBucket(600, capacity=1)
+    assert bucket.time_until(1) == 0
+    bucket.consume(1)
+    assert bucket.time_until(1) == pytest.approx(0.1, abs=0.01)
+    assert bucket.time_until(5) == pytest.approx(0.1, abs=0.01)
+
+
+def test_aimd_concurrency():
+    """Test additive increase and multiplicative decrease of the concurrency limit."""
+    concurrency = AdaptiveConcurrency(initial=4, latency_target=1.0, cooldown=60)
+    for _ in range(4):
+        concurrency.on_success(0.1)
+    assert concurrency.current == 4 and concurrency.limit > 4.9
+    concurrency.on_overload()
+    concurrency.on_success(2.0)  # within the cooldown: not applied twice
+    assert concurrency.current == 2
+
+
+async def test_interactive_requests_jump_the_queue():
+    """Test that interactive requests are admitted ahead of queued batch requests."""
+    limiter = RateLimiter(concurrency=1)
+    held = await limiter.acquire()
+    order = []
+
+    async def request(name, priority):
+        async with await limiter.acquire(priority=priority):
+            order.append(name)
+
+    tasks = [
+        asyncio.ensure_future(request("batch-1", PRIORITY_BATCH)),
+        asyncio.ensure_future(request("batch-2", PRIORITY_BATCH)),
+        asyncio.ensure_future(request("chat", PRIORITY_INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    held.release()
+    await asyncio.gather(*tasks)
+    assert order == ["chat", "batch-1", "batch-2"]
+    assert limiter.stats.queued == 3
+
+
+async def test_tokens_per_minute_budget_delays_requests():
+    """Test that the tokens-per-minute budget delays requests and honours reported usage."""
+    limiter = RateLimiter(tokens_per_minute=6000)
+    started = time.monotonic()
+    async with await limiter.acquire(tokens=6000):
+        pass
+    async with await limiter.acquire(tokens=100):
+        pass
+    assert time.monotonic() - started == pytest.approx(1.0, abs=0.15)
+
+    # Reported usage replaces the estimate
+    limiter = RateLimiter(tokens_per_minute=60)
+    async with await limiter.acquire(tokens=50) as permit:
+        permit.record_usage(20)
+    assert limiter.tokens.tokens == pytest.approx(40, abs=0.5)
+
+
+async def test_rate_limited_requests_back_off_and_retry_through_the_limiter():
+    """Test that 429s back off for Retry-After and are retried through the limiter."""
+    server = FakeOpenAIServer(rate_limited=1, retry_after_ms=100)
+    limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=100000)
+    adapter = make_adapter(server, limiter)
+
+    assert await adapter.analyze("page text", "Review the page") == "analysis"
+    assert len(server.requests) == 2
+    assert server.requests[1][0] - server.requests[0][0] >= 0.1
+    stats = limiter.stats
+    assert stats.rate_limited == 1 and stats.granted == 2 and stats.in_flight == 0
+    assert stats.concurrency_limit == 4
+
+    chunks = [chunk async for chunk in adapter.chat([{"role": "user", "content": "hi"}])]
+    assert chunks == ["Hel", "lo"]
+    assert limiter.stats.in_flight == 0
+
+
+async def test_rate_limit_errors_surface_after_retries():
+    """Test that a 429 is raised once the retries are used up."""
+    server = FakeOpenAIServer(rate_limited=10, retry_after_ms=1)
+    adapter = make_adapter(server, RateLimiter())
+    with pytest.raises(Exception) as error:
+        await adapter.analyze("text", "prompt")
+    assert getattr(error.value, "status_code", None) == 429
+    assert len(server.requests) == 3
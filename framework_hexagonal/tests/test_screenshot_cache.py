@@ -0,0 +1,114 @@
+"""Tests for the screenshot cache decorator."""
+import asyncio
+
+import pytest
+
+from framework_hexagonal.adapters.outbound.screenshot_cache import (
+    CachedScreenshotterAdapter,
+    DiskScreenshotStore,
+    ScreenshotEntry,
+)
+
+
+class CountingScreenshotter:
+    """Screenshotter returning a new image on every call."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    async def capture(self, url, output_path=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return f"{url}|{kwargs.get('width')}|{self.calls}".encode()
+
+    async def capture_element(self, url, selector, output_path=None, **kwargs):
+        self.calls += 1
+        return f"{url}|{selector}|{self.calls}".encode()
+
+    async def capture_multi(self, url, viewports=None, selectors=None, **kwargs):
+        self.calls += 1
+        return {name: f"{name}|{self.calls}".encode() for name in viewports}
+
+
+@pytest.mark.asyncio
+async def test_cache_keys_on_url_and_options(tmp_path):
+    """Test that cache keys cover the URL and capture options but not the output path."""
+    inner = CountingScreenshotter()
+    cache = CachedScreenshotterAdapter(inner)
+
+    first = await cache.capture("https://example.com", output_path=tmp_path / "a.png")
+    assert await cache.capture("https://example.com", output_path=tmp_path / "b.png") == first
+    assert (tmp_path / "b.png").read_bytes() == first
+    assert await cache.capture("https://example.com", width=375) != first
+    assert await cache.capture("https://example.com", cache=False) != first
+    await cache.capture_element("https://example.com", "#hero")
+    await cache.capture_element("https://example.com", "#hero")
+    await cache.capture_multi("https://example.com", viewports=["desktop"])
+    assert await cache.capture_multi("https://example.com", viewports=["desktop"]) == {
+        "desktop": b"desktop|5"
+    }
+
+    assert inner.calls == 5
+    assert cache.stats.memory_hits == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_capture():
+    """Test that concurrent misses for one key share a single capture."""
+    inner = CountingScreenshotter(delay=0.05)
+    cache = CachedScreenshotterAdapter(inner)
+
+    images = await asyncio.gather(*(cache.capture("https://example.com") for _ in range(5)))
+
+    assert len(set(images)) == 1
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate():
+    """Test that stale entries are served while one refresh runs in the background."""
+    inner = CountingScreenshotter(delay=0.05)
+    cache = CachedScreenshotterAdapter(inner, ttl=0.3, stale_ttl=60)
+
+    first = await cache.capture("https://example.com")
+    await asyncio.sleep(0.31)
+
+    # Served instantly from the stale entry while one refresh runs
+    assert await asyncio.wait_for(cache.capture("https://example.com"), 0.02) == first
+    assert await cache.capture("https://example.com") == first
+    await asyncio.sleep(0.1)
+
+    assert await cache.capture("https://example.com") != first
+    assert inner.calls == 2
+    assert (cache.stats.stale_served, cache.stats.refreshes) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart_and_dedupes(tmp_path):
+    """Test that the disk tier survives a restart and stores identical images once."""
+    inner = CountingScreenshotter()
+    cache = CachedScreenshotterAdapter(inner, directory=tmp_path)
+    first = await cache.capture("https://example.com")
+
+    restarted = CachedScreenshotterAdapter(inner, directory=tmp_path)
+    assert await restarted.capture("https://example.com") == first
+    assert restarted.stats.disk_hits == 1
+    assert inner.calls == 1
+
+    store = DiskScreenshotStore(tmp_path / "dedupe")
+    store.write("a", ScreenshotEntry({"": b"same"}))
+    store.write("b", ScreenshotEntry({"": b"same"}))
+    assert len(list((tmp_path / "dedupe" / "blobs").iterdir())) == 1
+
+
+def test_disk_tier_prunes_least_recently_used(tmp_path):
+    """Test that the disk tier prunes least recently used entries over its size cap."""
+    store = DiskScreenshotStore(tmp_path, max_bytes=250)
+    for key in ("a", "b", "c"):
+        store.write(key, ScreenshotEntry({"": key.encode() * 100}))
+
+    assert store.read("a") is None
+    assert store.read("b") is not None
+    assert store.read("c") is not None
+    assert len(list((tmp_path / "blobs").iterdir())) == 2
@@ -0,0 +1,129 @@
+"""Tests for the multi-process screenshot farm."""
+import asyncio
+import os
+
+import pytest
+
+from framework_hexagonal.adapters.outbound.screenshot_farm import (
+    ScreenshotFarmAdapter,
+    _from_shared_memory,
+    _to_shared_memory,
+)
+
+
+class FakeWorkerScreenshotter:
+    """Screenshotter run inside worker processes; must be importable by them."""
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def capture(self, url, width=1280, size=0, delay=0.0, **kwargs):
+        if url == "crash":
+            os._exit(1)
+        if url == "bad":
+            raise ValueError("bad url")
+        await asyncio.sleep(delay)
+        return f"{os.getpid()}:{url}@{width}".encode().ljust(size, b"\0")
+
+    async def capture_multi(self, url, viewports=None, **kwargs):
+        return {name: f"{url}@{name}".encode() for name in viewports}
+
+
+def test_shared_memory_round_trip():
+    """Test that images survive the shared-memory round trip."""
+    images = {"desktop": b"a" * 1000, "mobile": b"", "#hero": b"xyz"}
+    name, manifest = _to_shared_memory(images)
+    assert _from_shared_memory(name, manifest) == images
+
+
+async def test_farm_returns_large_images_and_spreads_load(tmp_path):
+    """Test that the farm returns large images and spreads captures over workers."""
+    farm = ScreenshotFarmAdapter(workers=2, screenshotter_factory=FakeWorkerScreenshotter)
+    try:
+        image = await farm.capture("https://a.test", size=5_000_000, output_path=tmp_path / "a.png")
+        assert len(image) == 5_000_000
+        assert image.split(b":", 1)[1].startswith(b"https://a.test@1280")
+        assert (tmp_path / "a.png").read_bytes() == image
+
+        images = await asyncio.gather(
+            *(farm.capture(f"https://{i}.test", delay=0.2) for i in range(6))
+        )
+        pids = {image.split(b":", 1)[0] for image in images}
+        assert len(pids) == 2
+        assert sorted(stats.completed for stats in farm.stats) == [3, 4]
+        assert all(stats.in_flight == 0 for stats in farm.stats)
+
+        multi = await farm.capture_multi("https://b.test", viewports=["desktop", "mobile"])
+        assert multi == {"desktop": b"https://b.test@desktop", "mobile": b"https://b.test@mobile"}
+
+        with pytest.raises(ValueError, match="bad url"):
+            await farm.capture("bad")
+    finally:
+        await farm.close()
+
+
+async def test_farm_restarts_dead_worker():
+    """Test that a crashed worker fails its capture and is restarted."""
+    farm = ScreenshotFarmAdapter(workers=1, screenshotter_factory=FakeWorkerScreenshotter)
+    try:
+        with pytest.raises(RuntimeError, match="died"):
+            await asyncio.wait_for(farm.capture("crash"), 10)
+        assert farm.stats[0].restarts == 1
+        assert (await farm.capture("https://c.test")).endswith(b"https://c.test@1280")
+    finally:
+        await farm.close()
+
+
+async def test_farm_detects_crash_while_other_workers_answer():
+    """Test that a crash is detected while other workers keep answering."""
+    farm = ScreenshotFarmAdapter(workers=2, screenshotter_factory=FakeWorkerScreenshotter)
+    stop = asyncio.Event()
+
+    async def steady_load():
+        while not stop.is_set():
+            await farm.capture("https://load.test", delay=0.02)
+
+    try:
+        await farm.start()
+        load = [asyncio.ensure_future(steady_load()) for _ in range(3)]
+        await asyncio.sleep(0.2)
+        with pytest.raises(RuntimeError, match="died"):
+            await asyncio.wait_for(farm.capture("crash"), 5)
+        stop.set()
+        await asyncio.gather(*load, return_exceptions=True)
+        assert sum(stats.restarts for stats in farm.stats) == 1
+    finally:
+        stop.set()
+        await farm.close()
+
+
+async def test_farm_call_timeout():
+    """Test that a capture exceeding call_timeout raises TimeoutError."""
+    farm = ScreenshotFarmAdapter(
+        workers=1, screenshotter_factory=FakeWorkerScreenshotter, call_timeout=0.3
+    )
+    try:
+        with pytest.raises(TimeoutError):
+            await farm.capture("https://slow.test", delay=2.0)
+        assert farm.stats[0].in_flight == 0 and farm.stats[0].failed == 1
+    finally:
+        await farm.close()
+
+
+async def test_farm_close_waits_for_busy_worker_without_restarts():
+    """Test that close lets in-flight captures finish without restarting workers."""
+    farm = ScreenshotFarmAdapter(workers=2, screenshotter_factory=FakeWorkerScreenshotter)
+    await farm.start()
+    processes = list(farm._processes)
+    busy = asyncio.ensure_future(farm.capture("https://busy.test", delay=1.5))
+    await asyncio.sleep(0.2)
+
+    await farm.close()
+
+    assert (await busy).endswith(b"https://busy.test@1280")
+    assert [stats.restarts for stats in farm.stats] == [0, 0]
+    assert not any(process.is_alive() for process in processes)
+    assert farm._processes == processes
@@ -0,0 +1,69 @@
+"""Tests for tiled full-page captures."""
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from framework_hexagonal.adapters.outbound.playwright_screenshot import (
+    PlaywrightScreenshotterAdapter,
+)
+from framework_hexagonal.adapters.outbound.screenshot_tiles import tile_clips
+
+
+def test_tile_clips_cover_page():
+    """Test that tile clips cover the whole page without overlap."""
+    clips = tile_clips(10000, 1280, 4096)
+
+    assert [clip["y"] for clip in clips] == [0, 4096, 8192]
+    assert [clip["height"] for clip in clips] == [4096, 4096, 1808]
+    with pytest.raises(ValueError):
+        tile_clips(100, 1280, 0)
+
+
+@pytest.mark.asyncio
+async def test_tall_page_is_tiled_and_stitched(fake_browser):
+    """Test that tall pages are tiled, stitched and capped at max_page_height."""
+    fake_browser.page_height = 50000
+    fake_browser.render_png = True
+    adapter = PlaywrightScreenshotterAdapter(tile_height=4000, max_page_height=20000)
+    adapter._browser = fake_browser
+
+    image = await adapter.capture("https://example.com/", width=320, wait_until="load")
+
+    with Image.open(BytesIO(image)) as stitched:
+        assert stitched.size == (320, 20000)
+        assert stitched.getpixel((0, 0))[0] == 0
+        assert stitched.getpixel((0, 19999))[0] == 1600 % 256
+    page = fake_browser.contexts[0].pages[0]
+    assert page.goto_calls[0]["url"] == "https://example.com/"
+    assert sum(1 for call in page.goto_calls if call["url"] != "about:blank") == 1
+    # Fixed and sticky elements are unpinned after the first tile, then restored
+    assert sum("__unpinned.push" in script for script in page.scripts) == 1
+    assert any("delete window.__unpinned" in script for script in page.scripts)
+
+
+@pytest.mark.asyncio
+async def test_pages_within_single_shot_limit_are_not_tiled(fake_browser):
+    """Test that pages within the single-shot limit are captured in one shot."""
+    fake_browser.page_height = 9000
+    adapter = PlaywrightScreenshotterAdapter(tile_height=4000)
+    adapter._browser = fake_browser
+
+    image = await adapter.capture("https://example.com/", wait_until="load")
+
+    assert image == b"SHOT:https://example.com/@1280"
+    page = fake_browser.contexts[0].pages[0]
+    assert not any("scrollTo" in script for script in page.scripts)
+
+
+@pytest.mark.asyncio
+async def test_unmeasurable_page_falls_back_to_full_page_shot(fake_browser):
+    """Test that a page whose height cannot be measured falls back to one full-page shot."""
+    fake_browser.page_height = None
+    adapter = PlaywrightScreenshotterAdapter()
+    adapter._browser = fake_browser
+
+    await adapter.capture("https://example.com/", wait_until="load")
+
+    page = fake_browser.contexts[0].pages[0]
+    assert page.screenshots == [{"clip": None, "full_page": True, "type": "png"}]
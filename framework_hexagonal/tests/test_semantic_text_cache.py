@@ -0,0 +1,102 @@
+"""Tests for embeddings batching, the vector index and the semantic TextAI cache."""
+import hashlib
+import json
+
+import httpx
+import numpy as np
+import pytest
+
+from framework_hexagonal.adapters.outbound.openai_embeddings import OpenAIEmbeddingsAdapter
+from framework_hexagonal.adapters.outbound.semantic_text_cache import SemanticCachedTextAIAdapter
+from framework_hexagonal.tests.conftest import CountingTextAI
+from framework_hexagonal.utils.vector_index import VectorIndex
+
+
+class FakeEmbeddings:
+    """Deterministic bag-of-words embedder: texts with the same words embed identically."""
+
+    def __init__(self, dimensions=64):
+        self.dimensions = dimensions
+        self.calls = 0
+
+    async def embed(self, texts, model=None, **kwargs):
+        self.calls += 1
+        vectors = []
+        for text in texts:
+            vector = [0.0] * self.dimensions
+            for word in text.lower().replace("?", "").split():
+                vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % self.dimensions] += 1.0
+            vectors.append(vector)
+        return vectors
+
+
+async def test_openai_embeddings_batches_and_deduplicates():
+    """Test that embeddings are batched and duplicate texts embedded once."""
+    requests = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        requests.append(body["input"])
+        data = [
+            {"object": "embedding", "index": i, "embedding": [float(len(text)), 1.0]}
+            for i, text in reversed(list(enumerate(body["input"])))
+        ]
+        return httpx.Response(200, json={"object": "list", "data": data, "model": body["model"],
+                                         "usage": {"prompt_tokens": 1, "total_tokens": 1}})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    adapter = OpenAIEmbeddingsAdapter(api_key="test", batch_size=2, http_client=client)
+    vectors = await adapter.embed(["a", "bb", "a", "ccc", ""])
+
+    assert vectors == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0], [3.0, 1.0], [1.0, 1.0]]
+    assert sorted(map(tuple, requests)) == [("a", "bb"), ("ccc", " ")]
+
+
+def test_vector_index_groups_eviction_and_persistence(tmp_path):
+    """Test index groups, LRU replacement and save/load round trips."""
+    index = VectorIndex(max_entries=2, initial_capacity=1)
+    first = index.add([1, 0, 0], group=1, payload=["one"])
+    index.add([0, 1, 0], group=1, payload=["two"])
+    assert index.search([0.9, 0.1, 0], group=2) is None
+    slot, score = index.search([0.9, 0.1, 0], group=1, min_score=0.9)
+    assert slot == first and score == pytest.approx(0.9939, abs=1e-3)
+
+    # "two" is the least recently matched, so it is replaced
+    index.add([0, 0, 1], group=1, payload=["three"])
+    assert len(index) == 2
+    assert index.search([0, 1, 0], group=1, min_score=0.5) is None
+
+    index.save(tmp_path / "index.npz")
+    loaded = VectorIndex.load(tmp_path / "index.npz")
+    assert len(loaded) == 2
+    assert loaded.payload(loaded.search(np.array([0, 0, 2]), group=1)[0]) == ["three"]
+
+
+async def test_semantic_cache_matches_reworded_requests(tmp_path):
+    """Test that reworded requests above the similarity threshold are served from the cache."""
+    text_ai = CountingTextAI()
+    embeddings = FakeEmbeddings()
+    path = tmp_path / "semantic.npz"
+    cache = SemanticCachedTextAIAdapter(text_ai, embeddings, threshold=0.9, path=path)
+
+    first = await cache.analyze("Where is the signup button", "Review the CTA")
+    assert await cache.analyze("where is the SIGNUP button?", "Review the CTA") == first
+    assert await cache.analyze("Where is the signup button", "Review headlines") != first
+    assert await cache.analyze("How fast does the page load", "Review the CTA") != first
+    assert cache.last_similarity == pytest.approx(1.0)
+
+    history = [{"role": "system", "content": "Be brief"}]
+    question = history + [{"role": "user", "content": "what is CRO?"}]
+    reworded = history + [{"role": "user", "content": "What is CRO"}]
+    answer = [c async for c in cache.chat(question, temperature=0)]
+    again = [c async for c in cache.chat(reworded, temperature=0)]
+    assert again == answer
+
+    image = [{"role": "user", "content": [{"type": "text", "text": "hi"}]}]
+    [c async for c in cache.chat(image, temperature=0)]
+    assert text_ai.calls == 5
+    assert cache.stats.as_dict() == {"hits": 2, "misses": 4, "bypassed": 1, "stored": 4}
+
+    await cache.close()
+    reloaded = SemanticCachedTextAIAdapter(CountingTextAI(), embeddings, threshold=0.9, path=path)
+    assert await reloaded.analyze("where is the signup button", "Review the CTA") == first
@@ -0,0 +1,64 @@
+"""Tests for the TextAI response cache."""
+import pytest
+
+from framework_hexagonal.adapters.outbound.text_ai_cache import (
+    CachedTextAIAdapter,
+    MemoryTextCache,
+    SQLiteTextCache,
+)
+from framework_hexagonal.tests.conftest import CountingTextAI
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+async def test_analyze_is_cached_on_normalized_prompt(tmp_path, backend):
+    """Test that analyze results are cached on the normalized prompt."""
+    text_ai = CountingTextAI()
+    store = MemoryTextCache() if backend == "memory" else SQLiteTextCache(tmp_path / "cache.db")
+    cached = CachedTextAIAdapter(text_ai, backend=store)
+
+    first = await cached.analyze("page", "  Review\n   the CTA ")
+    assert await cached.analyze("page", "Review the CTA") == first
+    assert await cached.analyze("page", "Review the CTA", model="model-a") == first
+    assert await cached.analyze("page", "Review the CTA", model="model-b") != first
+    assert await cached.analyze("page", "Review the CTA", cache=False) != first
+    assert text_ai.calls == 3
+    assert cached.stats.as_dict() == {"hits": 2, "misses": 2, "bypassed": 1, "stored": 2}
+
+
+async def test_chat_stream_is_replayed_and_sampled_calls_bypass():
+    """Test that chat streams are replayed and sampled calls bypass the cache."""
+    text_ai = CountingTextAI()
+    cached = CachedTextAIAdapter(text_ai)
+    messages = [{"role": "user", "content": "hi"}]
+
+    assert await collect(cached.chat(messages, temperature=0)) == ["Hel", "lo ", "1"]
+    assert await collect(cached.chat(messages, temperature=0)) == ["Hel", "lo ", "1"]
+    assert await collect(cached.chat(messages)) == ["Hel", "lo ", "2"]
+    assert await collect(cached.chat(messages, cache=True)) == ["Hel", "lo ", "3"]
+    assert await collect(cached.chat(messages, cache=True)) == ["Hel", "lo ", "3"]
+
+    # An abandoned stream is not stored
+    stream = cached.chat(messages, temperature=0, max_tokens=5)
+    await stream.__anext__()
+    await stream.aclose()
+    assert await collect(cached.chat(messages, temperature=0, max_tokens=5)) == ["Hel", "lo ", "5"]
+
+
+async def test_ttl_expiry_and_sqlite_eviction(tmp_path):
+    """Test TTL expiry and size-bounded eviction in the SQLite backend."""
+    text_ai = CountingTextAI()
+    cached = CachedTextAIAdapter(text_ai, ttl=0)
+    await cached.analyze("a", "p")
+    await cached.analyze("a", "p")
+    assert text_ai.calls == 2
+
+    store = SQLiteTextCache(tmp_path / "cache.db", max_items=2)
+    cached = CachedTextAIAdapter(text_ai, backend=store)
+    for text in ("a", "b", "c"):
+        await cached.analyze(text, "p")
+    assert store._connect().execute("SELECT COUNT(*) FROM text_cache").fetchone()[0] == 2
+    store.close()
@@ -0,0 +1,116 @@
+"""Size-bounded LRU cache shared by the caching adapters."""
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterator, Optional, Tuple, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class LRUCache(Generic[K, V]):
+    """
+    In-process least-recently-used cache bounded by entry count and/or size.
+
+    ``size_of`` measures each value (e.g. ``len`` for bytes); when
+    ``max_bytes`` is set, the least recently used entries are evicted until
+    the total fits. A single value larger than ``max_bytes`` is not stored.
+    """
+
+    def __init__(
+        self,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        size_of: Optional[Callable[[V], int]] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_items: Maximum number of entries (None for unbounded)
+            max_bytes: Maximum total size of all values (None for unbounded)
+            size_of: Function returning the size of a value (defaults to 1 per entry)
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.size_of = size_of or (lambda value: 1)
+        self.total_bytes = 0
+        self.evictions = 0
+        self._data: "OrderedDict[K, Tuple[V, int]]" = OrderedDict()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Get a value and mark it as most recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing
+
+        Returns:
+            Cached value or default
+        """
+        item = self._data.get(key)
+        if item is None:
+            return default
+        self._data.move_to_end(key)
+        return item[0]
+
+    def set(self, key: K, value: V) -> bool:
+        """
+        Store a value, evicting least recently used entries as needed.
+
+        Args:
+            key: Cache key
+            value: Value to store
+
+        Returns:
+            True if stored, False if the value alone exceeds ``max_bytes``
+        """
+        size = self.size_of(value)
+        self.pop(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+
+        self._data[key] = (value, size)
+        self.total_bytes += size
+        while self._over_limit():
+            self._evict_oldest()
+        return True
+
+    def pop(self, key: K) -> Optional[V]:
+        """
+        Remove a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Removed value, or None if the key was missing
+        """
+        item = self._data.pop(key, None)
+        if item is None:
+            return None
+        self.total_bytes -= item[1]
+        return item[0]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._data.clear()
+        self.total_bytes = 0
+
+    def _over_limit(self) -> bool:
+        if self.max_items is not None and len(self._data) > self.max_items:
+            return True
+        return self.max_bytes is not None and self.total_bytes > self.max_bytes
+
+    def _evict_oldest(self) -> None:
+        _, (_, size) = self._data.popitem(last=False)
+        self.total_bytes -= size
+        self.evictions += 1
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._data))
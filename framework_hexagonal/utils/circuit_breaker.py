@@ -0,0 +1,77 @@
+"""Circuit breaker for failing downstream services."""
+import time
+from typing import Literal
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` failures in a row the circuit opens and
+    ``allow`` refuses calls. Once ``reset_timeout`` seconds have passed it
+    lets one trial call through (half-open); success closes the circuit,
+    failure opens it for another ``reset_timeout``.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds before an open circuit allows a trial call
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at = 0.0
+        self._state: CircuitState = "closed"
+        self._trial_running = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit turns half-open once the timeout passes."""
+        if self._state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = "half_open"
+            self._trial_running = False
+        return self._state
+
+    def available(self) -> bool:
+        """Whether ``allow`` would admit a call now, without claiming the trial."""
+        state = self.state
+        return state == "closed" or (state == "half_open" and not self._trial_running)
+
+    def allow(self) -> bool:
+        """
+        Admit a call, claiming the single trial slot of a half-open circuit.
+
+        Returns:
+            True if the call may proceed
+        """
+        if not self.available():
+            return False
+        if self._state == "half_open":
+            self._trial_running = True
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        self.failures = 0
+        self._state = "closed"
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        self.failures += 1
+        if self._state == "half_open" or self.failures >= self.failure_threshold:
+            self._state = "open"
+            self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    def release(self) -> None:
+        """Give back an unused trial slot, e.g. when the call was cancelled."""
+        self._trial_running = False
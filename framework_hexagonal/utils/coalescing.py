@@ -0,0 +1,284 @@
+"""In-flight request coalescing (singleflight) for adapters."""
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+from dataclasses import asdict, dataclass, field
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar('T')
+
+# Adapter methods that manage resources rather than produce results
+LIFECYCLE_METHODS = ("start", "close", "aclose")
+
+
+@dataclass
+class CoalescingStats:
+    """Counters for verifying how many calls coalescing saved."""
+
+    calls: int = 0
+    executed: int = 0
+    coalesced: int = 0
+    abandoned: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the counters as a dict."""
+        return asdict(self)
+
+
+@dataclass
+class _Flight:
+    task: "asyncio.Task[Any]"
+    waiters: int = 0
+
+
+@dataclass
+class _Broadcast:
+    """One underlying stream, buffered so late subscribers replay it from the start."""
+
+    chunks: List[Any] = field(default_factory=list)
+    done: bool = False
+    error: Optional[BaseException] = None
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+    subscribers: int = 0
+    task: Optional["asyncio.Task[None]"] = None
+
+    def notify(self) -> None:
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+class SingleFlight:
+    """
+    Share one execution among concurrent calls with the same key.
+
+    Each key has at most one underlying call in flight; callers arriving
+    while it runs await the same result. Nothing is cached: once the call
+    finishes the next caller starts a new one. A cancelled caller never
+    cancels a call others still wait on, but a call whose waiters have
+    all gone is cancelled. Streams are fanned out: every subscriber gets
+    every chunk, including those produced before it joined.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self.stats = CoalescingStats()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._broadcasts: Dict[Hashable, _Broadcast] = {}
+
+    def in_flight(self) -> int:
+        """Number of keys with a call or stream running."""
+        return len(self._flights) + len(self._broadcasts)
+
+    @staticmethod
+    def _forget(registry: Dict[Hashable, Any], key: Hashable, entry: Any) -> None:
+        # A newer call may already own the key
+        if registry.get(key) is entry:
+            del registry[key]
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``fn()``, or the already running call for ``key``.
+
+        Args:
+            key: Identity of the call
+            fn: Starts the call when none is in flight
+
+        Returns:
+            The call's result (its exception is raised to every waiter)
+        """
+        self.stats.calls += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            self.stats.executed += 1
+            flight = self._flights[key] = _Flight(task=asyncio.ensure_future(fn()))
+            flight.task.add_done_callback(lambda _: self._forget(self._flights, key, flight))
+        else:
+            self.stats.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                self.stats.abandoned += 1
+                flight.task.cancel()
+                self._forget(self._flights, key, flight)
+            raise
+        finally:
+            flight.waiters -= 1
+
+    async def _produce(self, broadcast: _Broadcast, stream: AsyncIterator[Any]) -> None:
+        try:
+            async for chunk in stream:
+                broadcast.chunks.append(chunk)
+                broadcast.notify()
+        except asyncio.CancelledError:
+            broadcast.error = asyncio.CancelledError()
+            raise
+        except Exception as e:
+            broadcast.error = e
+        finally:
+            broadcast.done = True
+            broadcast.notify()
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def stream(
+        self, key: Hashable, fn: Callable[[], AsyncIterator[T]]
+    ) -> AsyncGenerator[T, None]:
+        """
+        Iterate ``fn()``, or subscribe to the already running stream for ``key``.
+
+        Args:
+            key: Identity of the stream
+            fn: Starts the stream when none is in flight
+
+        Yields:
+            Every chunk of the stream (its exception is raised to every subscriber)
+        """
+        self.stats.calls += 1
+        broadcast = self._broadcasts.get(key)
+        if broadcast is None:
+            self.stats.executed += 1
+            broadcast = self._broadcasts[key] = _Broadcast()
+            task = broadcast.task = asyncio.ensure_future(self._produce(broadcast, fn()))
+            task.add_done_callback(lambda _: self._forget(self._broadcasts, key, broadcast))
+        else:
+            self.stats.coalesced += 1
+
+        broadcast.subscribers += 1
+        position = 0
+        try:
+            while True:
+                while position < len(broadcast.chunks):
+                    yield broadcast.chunks[position]
+                    position += 1
+                if broadcast.done:
+                    if broadcast.error is not None:
+                        raise broadcast.error
+                    return
+                await broadcast.changed.wait()
+        finally:
+            broadcast.subscribers -= 1
+            if not broadcast.subscribers and not broadcast.done:
+                self.stats.abandoned += 1
+                if broadcast.task is not None:
+                    broadcast.task.cancel()
+                self._forget(self._broadcasts, key, broadcast)
+
+
+def call_key(method: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """
+    Derive the coalescing key of an adapter call.
+
+    Args:
+        method: Method name
+        args: Positional arguments
+        kwargs: Keyword arguments
+
+    Returns:
+        Hex SHA-256 of the method and arguments
+    """
+    payload = json.dumps([method, list(args), kwargs], sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CoalescingAdapter:
+    """
+    Decorator that coalesces concurrent identical calls to any adapter.
+
+    Coroutine methods share one execution per key; async generator methods
+    (e.g. ``TextAI.chat``) share one stream that is fanned out to every
+    caller. A shared stream keeps every chunk for late subscribers and is
+    read as fast as the source produces, so streams are only coalesced when
+    named in ``methods``; never name byte streams such as
+    ``WebFetcher.iter_chunks``. Calls are keyed on the method name and all
+    arguments, so calls that differ in any argument (an output path, a
+    callback) run separately. Other attributes are forwarded to the wrapped
+    adapter.
+    """
+
+    def __init__(
+        self,
+        adapter: Any,
+        methods: Optional[Iterable[str]] = None,
+        key: Callable[[str, tuple, Dict[str, Any]], Hashable] = call_key,
+    ):
+        """
+        Initialize the coalescing decorator.
+
+        Args:
+            adapter: Adapter whose calls are coalesced
+            methods: Methods to coalesce (default: every public coroutine
+                method except start/close/aclose; async generator methods
+                are only coalesced when listed)
+            key: Function deriving the key from method name, args and kwargs
+        """
+        self.adapter = adapter
+        self.key = key
+        self.flights = SingleFlight()
+        # Streams are only shared when asked for by name
+        listed = methods is not None
+        if methods is None:
+            methods = [
+                name for name in dir(type(adapter))
+                if not name.startswith("_") and name not in LIFECYCLE_METHODS
+            ]
+        self._wrapped: Dict[str, Callable[..., Any]] = {}
+        for name in methods:
+            # Inspect the class attribute so properties are not evaluated
+            attribute = inspect.getattr_static(adapter, name, None)
+            if isinstance(attribute, (staticmethod, classmethod)):
+                attribute = attribute.__func__
+            if inspect.isasyncgenfunction(attribute) and listed:
+                self._wrapped[name] = self._wrap_stream(name, getattr(adapter, name))
+            elif inspect.iscoroutinefunction(attribute):
+                self._wrapped[name] = self._wrap_call(name, getattr(adapter, name))
+
+    @property
+    def stats(self) -> CoalescingStats:
+        """Coalescing counters across all methods."""
+        return self.flights.stats
+
+    def _wrap_call(
+        self, name: str, method: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(method)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            key = self.key(name, args, kwargs)
+            return await self.flights.do(key, lambda: method(*args, **kwargs))
+
+        return call
+
+    def _wrap_stream(
+        self, name: str, method: Callable[..., AsyncIterator[Any]]
+    ) -> Callable[..., AsyncIterator[Any]]:
+        @functools.wraps(method)
+        def stream(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+            key = self.key(name, args, kwargs)
+            return self.flights.stream(key, lambda: method(*args, **kwargs))
+
+        return stream
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ("adapter", "_wrapped"):
+            raise AttributeError(name)
+        wrapped = self._wrapped.get(name)
+        if wrapped is not None:
+            return wrapped
+        return getattr(self.adapter, name)
@@ -0,0 +1,267 @@
+"""Token-budgeted chat history with pinned messages and rolling summaries."""
+import asyncio
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+from ..core.ports.text_ai import TextAI
+from .rate_limit import CHARS_PER_TOKEN
+
+TokenCounter = Callable[[str], int]
+
+# Tokens the chat format adds around each message (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+SUMMARY_PROMPT = (
+    "Summarize the conversation below for use as context in later turns. "
+    "If a current summary is given, update it with the new turns. Keep facts, "
+    "names, numbers, decisions and open questions; drop pleasantries. "
+    "Reply with the summary only."
+)
+
+
+def approximate_token_count(text: str) -> int:
+    """Estimate the tokens in ``text`` from its length."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def tiktoken_counter(model: str = "gpt-4o") -> TokenCounter:
+    """
+    Return an exact token counter for an OpenAI model.
+
+    Args:
+        model: Model whose tokenizer is used (unknown models use o200k_base)
+
+    Returns:
+        Function counting the tokens of a string
+
+    Raises:
+        ImportError: If tiktoken is not installed
+    """
+    if not TIKTOKEN_AVAILABLE:
+        raise ImportError(
+            "Exact token counts require tiktoken. "
+            "Install it with: pip install 'framework_hexagonal[tokens]'"
+        )
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        encoding = tiktoken.get_encoding("o200k_base")
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def default_token_counter() -> TokenCounter:
+    """tiktoken's gpt-4o tokenizer when installed, else a length estimate."""
+    return tiktoken_counter() if TIKTOKEN_AVAILABLE else approximate_token_count
+
+
+def _text(content: Any) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return ""
+
+
+@dataclass
+class _Entry:
+    message: Dict[str, Any]
+    tokens: int
+
+
+class ConversationWindow:
+    """
+    Chat history that fits each request into a token budget.
+
+    Every message is counted once when added. ``build`` returns the pinned
+    messages (e.g. the system prompt) followed by as many of the most
+    recent turns as fit in ``max_tokens``; the latest turn is always
+    included. With a ``summarizer``, turns that fall out of the window are
+    folded into a running summary in the background, a few at a time, and
+    the summary is sent after the pinned messages. Until a summarization
+    finishes, dropped turns are simply left out, so ``build`` never waits
+    on the model.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 8000,
+        system_prompt: Optional[str] = None,
+        counter: Optional[TokenCounter] = None,
+        summarizer: Optional[TextAI] = None,
+        summary_model: Optional[str] = None,
+        summary_max_tokens: int = 512,
+        summary_prompt: str = SUMMARY_PROMPT,
+        min_summary_turns: int = 4,
+    ):
+        """
+        Initialize an empty conversation.
+
+        Args:
+            max_tokens: Token budget of the messages returned by ``build``
+            system_prompt: Optional system message pinned at the start
+            counter: Counts the tokens of a string (defaults to
+                ``default_token_counter()``)
+            summarizer: TextAI that summarizes dropped turns (None to drop them);
+                may be set after construction
+            summary_model: Optional model identifier for summaries
+            summary_max_tokens: Maximum length of the summary
+            summary_prompt: Instructions for the summarizer
+            min_summary_turns: Dropped turns collected before a summary update
+
+        Raises:
+            ValueError: If max_tokens is not positive
+        """
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        self.max_tokens = max_tokens
+        self.counter = counter or default_token_counter()
+        self.summarizer = summarizer
+        self.summary_model = summary_model
+        self.summary_max_tokens = summary_max_tokens
+        self.summary_prompt = summary_prompt
+        self.min_summary_turns = min_summary_turns
+        self.last_error: Optional[Exception] = None
+        self._pinned: List[_Entry] = []
+        self._turns: List[_Entry] = []
+        self._summary: Optional[_Entry] = None
+        self._summary_text: Optional[str] = None
+        # Turns before this index are covered by the summary
+        self._summarized = 0
+        self._summarize_until = 0
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._generation = 0
+        if system_prompt:
+            self.pin(system_prompt)
+
+    def count(self, message: Dict[str, Any]) -> int:
+        """Tokens a message takes in a request."""
+        return self.counter(_text(message.get("content"))) + MESSAGE_OVERHEAD_TOKENS
+
+    def _entry(self, message: Dict[str, Any]) -> _Entry:
+        return _Entry(message=message, tokens=self.count(message))
+
+    def pin(self, content: str, role: str = "system") -> None:
+        """Add a message that is sent with every request, ahead of the history."""
+        self._pinned.append(self._entry({"role": role, "content": content}))
+
+    def add(self, role: str, content: Any) -> None:
+        """
+        Append a turn to the history.
+
+        Args:
+            role: Message role ('user' or 'assistant')
+            content: Message content
+        """
+        self._turns.append(self._entry({"role": role, "content": content}))
+
+    @property
+    def history(self) -> List[Dict[str, Any]]:
+        """Every turn added, including those outside the window."""
+        return [entry.message for entry in self._turns]
+
+    @property
+    def summary(self) -> Optional[str]:
+        """Current summary of the turns before the window."""
+        return self._summary_text
+
+    def build(self, max_tokens: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return the messages for the next request.
+
+        Args:
+            max_tokens: Budget for this request (defaults to ``max_tokens``)
+
+        Returns:
+            Pinned messages, the summary if any, and the most recent turns
+        """
+        budget = (max_tokens or self.max_tokens) - sum(entry.tokens for entry in self._pinned)
+        if self._summary is not None:
+            budget -= self._summary.tokens
+        start = len(self._turns)
+        while start > self._summarized:
+            tokens = self._turns[start - 1].tokens
+            if tokens > budget and start < len(self._turns):
+                break
+            budget -= tokens
+            start -= 1
+
+        if start - self._summarized >= self.min_summary_turns and self.summarizer is not None:
+            self._summarize_until = max(self._summarize_until, start)
+            self._schedule()
+
+        messages = [dict(entry.message) for entry in self._pinned]
+        if self._summary is not None:
+            messages.append(dict(self._summary.message))
+        messages.extend(dict(entry.message) for entry in self._turns[start:])
+        return messages
+
+    def _schedule(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = loop.create_task(self._summarize())
+
+    async def _summarize(self) -> None:
+        generation = self._generation
+        summarizer = self.summarizer
+        if summarizer is None:
+            return
+        while self._summarized < self._summarize_until:
+            start, end = self._summarized, self._summarize_until
+            transcript = "\n\n".join(
+                f"{entry.message['role']}: {_text(entry.message['content'])}"
+                for entry in self._turns[start:end]
+            )
+            if self.summary:
+                transcript = f"Current summary:\n{self.summary}\n\nNew turns:\n{transcript}"
+            try:
+                summary = await summarizer.analyze(
+                    text=transcript,
+                    prompt=self.summary_prompt,
+                    model=self.summary_model,
+                    max_tokens=self.summary_max_tokens,
+                )
+            except Exception as e:
+                # Retried on a later build
+                self.last_error = e
+                return
+            if generation != self._generation:
+                return
+            self._summary_text = summary.strip()
+            content = f"Summary of the earlier conversation:\n{self._summary_text}"
+            self._summary = self._entry({"role": "system", "content": content})
+            self._summarized = end
+
+    async def wait_for_summary(self) -> None:
+        """Wait for a running summary update to finish."""
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+    def clear(self) -> None:
+        """Forget the history and summary; pinned messages are kept."""
+        self._generation += 1
+        self._turns.clear()
+        self._summary = None
+        self._summary_text = None
+        self._summarized = 0
+        self._summarize_until = 0
+
+    async def close(self) -> None:
+        """Cancel a running summary update."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
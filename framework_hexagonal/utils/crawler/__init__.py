@@ -0,0 +1,24 @@
+"""Site crawler built on the WebFetcher port."""
+
+from .engine import Crawler
+from .links import LinkExtractor, extract_links
+from .results import CrawlResult, CrawlStats
+from .robots import RobotsCache
+from .sinks import CrawlSink, DBGatewaySink, JSONLSink, MemorySink
+from .urls import BloomFilter, SeenSet, normalize_url
+
+__all__ = [
+    "Crawler",
+    "LinkExtractor",
+    "extract_links",
+    "CrawlResult",
+    "CrawlStats",
+    "RobotsCache",
+    "CrawlSink",
+    "DBGatewaySink",
+    "JSONLSink",
+    "MemorySink",
+    "BloomFilter",
+    "SeenSet",
+    "normalize_url",
+]
@@ -0,0 +1,184 @@
+"""Asynchronous site crawler built on the WebFetcher port."""
+import asyncio
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from ...core.ports.web_fetcher import WebFetcher
+from .links import LinkExtractor, extract_links
+from .results import CrawlResult, CrawlStats
+from .robots import RobotsCache
+from .sinks import CrawlSink, MemorySink
+from .urls import SeenSet, SeenURLs, normalize_url
+
+
+class Crawler:
+    """
+    Breadth-first crawler with a shared frontier and a pool of async workers.
+
+    URLs are normalized and deduplicated before scheduling, robots.txt is
+    honoured (including Crawl-delay), request starts to the same host are
+    spaced by a politeness delay, and every crawled page is written to the
+    sink as soon as it completes. A start URL that redirects to another
+    host adds that host to the crawl scope.
+    """
+
+    def __init__(
+        self,
+        fetcher: WebFetcher,
+        sink: Optional[CrawlSink] = None,
+        max_pages: int = 100,
+        max_depth: int = 3,
+        concurrency: int = 8,
+        politeness_delay: float = 1.0,
+        same_host: bool = True,
+        respect_robots: bool = True,
+        user_agent: str = "*",
+        timeout: float = 30.0,
+        seen: Optional[SeenURLs] = None,
+        link_extractor: Optional[LinkExtractor] = None,
+    ):
+        """
+        Initialize the crawler.
+
+        Args:
+            fetcher: WebFetcher used to download pages
+            sink: Destination for results (defaults to an in-memory list)
+            max_pages: Maximum number of pages to fetch (URLs disallowed by
+                robots.txt do not count)
+            max_depth: Maximum link depth from the start URLs
+            concurrency: Number of concurrent workers
+            politeness_delay: Minimum seconds between request starts per host
+            same_host: Only follow links to the start URLs' hosts
+            respect_robots: Whether to honour robots.txt
+            user_agent: User agent matched against robots rules
+            timeout: Per-page fetch timeout in seconds
+            seen: Seen-URL store (defaults to an exact set; use BloomFilter for huge crawls)
+            link_extractor: Returns the title and hrefs of a page (defaults
+                to a standard library parser; see
+                ``html_parsers.link_extractor`` for the faster backends)
+        """
+        self.fetcher = fetcher
+        self.sink: CrawlSink = sink or MemorySink()
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.concurrency = concurrency
+        self.politeness_delay = politeness_delay
+        self.same_host = same_host
+        self.timeout = timeout
+        self.robots = RobotsCache(fetcher, user_agent=user_agent) if respect_robots else None
+        self.seen: SeenURLs = seen or SeenSet()
+        self.link_extractor = link_extractor or extract_links
+        self.stats = CrawlStats()
+        self._frontier: "asyncio.Queue[Tuple[str, int]]" = asyncio.Queue()
+        self._allowed_hosts: Set[str] = set()
+        self._fetched = 0
+        self._host_next: Dict[str, float] = {}
+        self._host_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def _schedule(self, url: str, depth: int) -> None:
+        if self._fetched >= self.max_pages or depth > self.max_depth:
+            return
+        if self.same_host and urlsplit(url).netloc not in self._allowed_hosts:
+            return
+        if self.seen.add(url):
+            self._frontier.put_nowait((url, depth))
+
+    async def _wait_turn(self, url: str) -> None:
+        """Space request starts to the same host by the politeness delay."""
+        delay = self.politeness_delay
+        if self.robots is not None:
+            delay = max(delay, await self.robots.crawl_delay(url) or 0.0)
+
+        loop = asyncio.get_running_loop()
+        host = urlsplit(url).netloc
+        async with self._host_locks[host]:
+            wait = self._host_next.get(host, 0.0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._host_next[host] = loop.time() + delay
+
+    def _extract(self, html: str, base_url: str) -> Tuple[Optional[str], List[str]]:
+        title, hrefs = self.link_extractor(html)
+        links = []
+        for href in hrefs:
+            link = normalize_url(href, base=base_url)
+            if link is not None:
+                links.append(link)
+        return title, links
+
+    def _follow_redirect(self, url: str, final_url: str, depth: int) -> None:
+        final = normalize_url(final_url)
+        if final is None or final == url:
+            return
+        if depth == 0:
+            # e.g. example.com redirecting to www.example.com
+            self._allowed_hosts.add(urlsplit(final).netloc)
+        self.seen.add(final)
+
+    async def _process(self, url: str, depth: int) -> None:
+        if self.robots is not None and not await self.robots.allowed(url):
+            self.stats.skipped_by_robots += 1
+            return
+        # Counted here so disallowed URLs do not use up the page budget
+        if self._fetched >= self.max_pages:
+            return
+        self._fetched += 1
+
+        await self._wait_turn(url)
+        result = CrawlResult(url=url, depth=depth)
+        start = time.perf_counter()
+        try:
+            page = await self.fetcher.fetch(url, timeout=self.timeout, parse=False)
+            result.status_code = page.status_code
+            self._follow_redirect(url, page.url, depth)
+            result.content_length = len(page.html)
+            result.title, result.links = self._extract(page.html, page.url)
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+            self.stats.errors += 1
+        result.elapsed = time.perf_counter() - start
+
+        for link in result.links:
+            self._schedule(link, depth + 1)
+        self.stats.pages += 1
+        await self.sink.write(result)
+
+    async def _worker(self) -> None:
+        while True:
+            url, depth = await self._frontier.get()
+            try:
+                await self._process(url, depth)
+            except Exception:
+                self.stats.errors += 1
+            finally:
+                self._frontier.task_done()
+
+    async def crawl(self, start_urls: Iterable[str]) -> CrawlStats:
+        """
+        Crawl from the start URLs until the frontier is exhausted or limits are hit.
+
+        Args:
+            start_urls: Seed URLs (depth 0)
+
+        Returns:
+            Statistics for the run
+        """
+        seeds = [url for url in (normalize_url(u) for u in start_urls) if url is not None]
+        self._allowed_hosts.update(urlsplit(url).netloc for url in seeds)
+        for url in seeds:
+            self._schedule(url, 0)
+
+        start = time.perf_counter()
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        try:
+            await self._frontier.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await self.sink.close()
+            self.stats.elapsed = time.perf_counter() - start
+
+        return self.stats
@@ -0,0 +1,48 @@
+"""Title and link extraction for the crawler."""
+from html.parser import HTMLParser
+from typing import Callable, List, Optional, Tuple
+
+# Extracts (title, hrefs) from an HTML document; hrefs are left unresolved
+LinkExtractor = Callable[[str], Tuple[Optional[str], List[str]]]
+
+
+class _LinkParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.title: Optional[str] = None
+        self.links: List[str] = []
+        self._title_parts: Optional[List[str]] = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "a":
+            for name, value in attrs:
+                if name == "href" and value is not None:
+                    self.links.append(value)
+                    break
+        elif tag == "title" and self.title is None:
+            self._title_parts = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title" and self._title_parts is not None:
+            self.title = "".join(self._title_parts).strip()
+            self._title_parts = None
+
+    def handle_data(self, data: str) -> None:
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+
+
+def extract_links(html: str) -> Tuple[Optional[str], List[str]]:
+    """
+    Extract the title and every ``a[href]`` of a document with the standard library.
+
+    Args:
+        html: Raw HTML document
+
+    Returns:
+        Tuple of (title or None, hrefs in document order)
+    """
+    parser = _LinkParser()
+    parser.feed(html)
+    parser.close()
+    return parser.title, parser.links
@@ -0,0 +1,36 @@
+"""Result and statistics records produced by the crawler."""
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class CrawlResult:
+    """Outcome of crawling a single URL."""
+
+    url: str
+    depth: int
+    status_code: int = 0
+    title: Optional[str] = None
+    links: List[str] = field(default_factory=list)
+    content_length: int = 0
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a JSON-serializable dict."""
+        return asdict(self)
+
+
+@dataclass
+class CrawlStats:
+    """Aggregate counters for a crawl run."""
+
+    pages: int = 0
+    errors: int = 0
+    skipped_by_robots: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        """Crawl throughput."""
+        return self.pages / self.elapsed if self.elapsed else 0.0
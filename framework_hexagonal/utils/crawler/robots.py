@@ -0,0 +1,93 @@
+"""robots.txt fetching and caching for the crawler."""
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+from ...core.ports.web_fetcher import WebFetcher
+
+
+class RobotsCache:
+    """
+    Per-origin cache of parsed robots.txt files.
+
+    Missing or unreachable robots.txt files allow everything. Concurrent
+    lookups for the same origin share a single download.
+    """
+
+    def __init__(
+        self,
+        fetcher: WebFetcher,
+        user_agent: str = "*",
+        ttl: float = 3600.0,
+        timeout: float = 10.0,
+    ):
+        """
+        Initialize the robots cache.
+
+        Args:
+            fetcher: WebFetcher used to download robots.txt
+            user_agent: User agent matched against robots rules
+            ttl: Seconds a parsed robots.txt is reused
+            timeout: Timeout for robots.txt downloads in seconds
+        """
+        self.fetcher = fetcher
+        self.user_agent = user_agent
+        self.ttl = ttl
+        self.timeout = timeout
+        self._parsers: Dict[str, Tuple[float, RobotFileParser]] = {}
+        self._pending: Dict[str, "asyncio.Future[RobotFileParser]"] = {}
+
+    async def _load(self, origin: str) -> RobotFileParser:
+        parser = RobotFileParser(f"{origin}/robots.txt")
+        try:
+            page = await self.fetcher.fetch(
+                f"{origin}/robots.txt", timeout=self.timeout, parse=False
+            )
+            parser.parse(page.html.splitlines())
+        except Exception:
+            parser.parse([])
+        return parser
+
+    async def get(self, url: str) -> RobotFileParser:
+        """
+        Get the robots parser for a URL's origin.
+
+        Args:
+            url: Any URL on the origin
+
+        Returns:
+            Parsed robots.txt rules
+        """
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+
+        cached = self._parsers.get(origin)
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        pending = self._pending.get(origin)
+        if pending is not None:
+            return await pending
+
+        future: "asyncio.Future[RobotFileParser]" = asyncio.get_running_loop().create_future()
+        self._pending[origin] = future
+        try:
+            parser = await self._load(origin)
+            self._parsers[origin] = (time.monotonic(), parser)
+            future.set_result(parser)
+            return parser
+        finally:
+            del self._pending[origin]
+            if not future.done():
+                future.cancel()
+
+    async def allowed(self, url: str) -> bool:
+        """Whether the user agent may fetch a URL."""
+        return (await self.get(url)).can_fetch(self.user_agent, url)
+
+    async def crawl_delay(self, url: str) -> Optional[float]:
+        """Crawl-delay requested by the URL's origin, if any."""
+        delay = (await self.get(url)).crawl_delay(self.user_agent)
+        return float(delay) if delay is not None else None
@@ -0,0 +1,109 @@
+"""Destinations for crawl results."""
+import asyncio
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Protocol, Type, Union
+
+from .results import CrawlResult
+
+if TYPE_CHECKING:
+    from ...core.ports.db_gateway import DBGateway
+
+
+class CrawlSink(Protocol):
+    """Interface for consumers of crawl results."""
+
+    async def write(self, result: CrawlResult) -> None:
+        """
+        Consume one crawl result.
+
+        Args:
+            result: Result for a crawled page
+        """
+        ...
+
+    async def close(self) -> None:
+        """Flush buffered results and release resources."""
+        ...
+
+
+class MemorySink:
+    """Collect results in a list."""
+
+    def __init__(self) -> None:
+        """Initialize an empty sink."""
+        self.results: List[CrawlResult] = []
+
+    async def write(self, result: CrawlResult) -> None:
+        """Append a result."""
+        self.results.append(result)
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+class JSONLSink:
+    """Append results to a JSON Lines file, writing in buffered batches off the event loop."""
+
+    def __init__(self, path: Union[str, Path], flush_every: int = 100):
+        """
+        Initialize the JSONL sink.
+
+        Args:
+            path: Output file (appended to, parent directories created)
+            flush_every: Number of results buffered before writing
+        """
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self._buffer: List[str] = []
+
+    def _append(self, lines: List[str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+
+    async def write(self, result: CrawlResult) -> None:
+        """Buffer a result, flushing when the batch is full."""
+        self._buffer.append(json.dumps(result.to_dict(), ensure_ascii=False) + "\n")
+        if len(self._buffer) >= self.flush_every:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write buffered results to the file."""
+        if self._buffer:
+            lines, self._buffer = self._buffer, []
+            await asyncio.to_thread(self._append, lines)
+
+    async def close(self) -> None:
+        """Flush remaining results."""
+        await self.flush()
+
+
+class DBGatewaySink:
+    """Persist results as records through the DBGateway port."""
+
+    def __init__(
+        self,
+        db: "DBGateway",
+        model: Type[Any],
+        to_record: Optional[Callable[[CrawlResult], Dict[str, Any]]] = None,
+    ):
+        """
+        Initialize the database sink.
+
+        Args:
+            db: Database gateway
+            model: SQLAlchemy model class for crawl records
+            to_record: Maps a result to model column values (defaults to all fields)
+        """
+        self.db = db
+        self.model = model
+        self.to_record = to_record or asdict
+
+    async def write(self, result: CrawlResult) -> None:
+        """Create a record for a result."""
+        await self.db.create(self.model, self.to_record(result))
+
+    async def close(self) -> None:
+        """Nothing to release."""
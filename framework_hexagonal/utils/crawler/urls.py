@@ -0,0 +1,130 @@
+"""URL normalization and seen-URL sets for the crawler."""
+import hashlib
+import math
+from typing import Optional, Protocol
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Query parameters that only track campaigns and never change page content
+TRACKING_PARAMS = ("utm_", "gclid", "fbclid", "mc_cid", "mc_eid")
+
+
+def normalize_url(url: str, base: Optional[str] = None) -> Optional[str]:
+    """
+    Normalize a URL so equivalent spellings deduplicate to one key.
+
+    Resolves relative references, lower-cases scheme and host, drops default
+    ports, fragments and tracking parameters, sorts the query and ensures a
+    non-empty path.
+
+    Args:
+        url: URL or relative reference
+        base: Base URL to resolve relative references against
+
+    Returns:
+        Normalized absolute http(s) URL, or None for other schemes
+    """
+    url = url.strip()
+    if base is not None:
+        url = urljoin(base, url)
+
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return None
+
+    netloc = parts.hostname.lower()
+    if port is not None and port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith(TRACKING_PARAMS)
+        )
+    )
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+class SeenURLs(Protocol):
+    """Set-like store recording which URLs were already scheduled."""
+
+    def add(self, url: str) -> bool:
+        """
+        Record a URL.
+
+        Args:
+            url: Normalized URL
+
+        Returns:
+            True if the URL was not seen before
+        """
+        ...
+
+
+class SeenSet:
+    """Exact seen-URL store backed by a Python set."""
+
+    def __init__(self) -> None:
+        """Initialize an empty set."""
+        self._seen: set = set()
+
+    def add(self, url: str) -> bool:
+        """Record a URL, returning True if it is new."""
+        if url in self._seen:
+            return False
+        self._seen.add(url)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+
+class BloomFilter:
+    """
+    Memory-bounded seen-URL store.
+
+    Uses a fixed bit array sized for ``capacity`` items at the given false
+    positive rate; a false positive only means a URL is skipped.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        """
+        Initialize the filter.
+
+        Args:
+            capacity: Expected number of distinct URLs
+            error_rate: Acceptable false positive probability
+        """
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, url: str):  # type: ignore[no-untyped-def]
+        digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        # Kirsch-Mitzenmacher double hashing
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, url: str) -> bool:
+        """Record a URL, returning True if it is (probably) new."""
+        new = False
+        for position in self._positions(url):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def __len__(self) -> int:
+        return self.count
@@ -0,0 +1,46 @@
+"""Atomic file writes that keep blocking I/O off the event loop."""
+import asyncio
+import os
+import threading
+from pathlib import Path
+from typing import Union
+
+
+def write_atomic(path: Union[str, Path], data: bytes) -> Path:
+    """
+    Write a file via a temporary sibling and rename it into place.
+
+    Readers never see a partially written file, and an interrupted write
+    leaves the previous content intact. Blocking; see ``save_file``.
+
+    Args:
+        path: Destination path (parent directories are created)
+        data: File content
+
+    Returns:
+        The destination path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+async def save_file(path: Union[str, Path], data: bytes) -> Path:
+    """
+    Atomically write a file in a worker thread.
+
+    Args:
+        path: Destination path (parent directories are created)
+        data: File content
+
+    Returns:
+        The destination path
+    """
+    return await asyncio.to_thread(write_atomic, path, data)
@@ -0,0 +1,325 @@
+"""In-process metrics registry with Prometheus text exposition."""
+import math
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, cast
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request latencies, from a fast cache hit to a long generation
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} takes labels {list(self.labelnames)}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {_escape(self.help)}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """
+        Add to the count.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Value of every label of the metric
+
+        Raises:
+            ValueError: If the amount is negative or labels do not match
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Current count for a label set."""
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down per label set."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the value for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """Add to the value for a label set (negative to subtract)."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        """Subtract from the value for a label set."""
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        """Current value for a label set."""
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class _HistogramSeries:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets per label set."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        if "le" in self.labelnames:
+            raise ValueError("Histograms cannot have an 'le' label")
+        bounds = sorted(float(bound) for bound in buckets)
+        if not bounds or bounds[-1] != math.inf:
+            bounds.append(math.inf)
+        self.buckets = tuple(bounds)
+        self._series: Dict[Tuple[str, ...], _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value: Observed value
+            **labels: Value of every label of the metric
+        """
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _HistogramSeries(len(self.buckets))
+            series.counts[index] += 1
+            series.sum += value
+            series.count += 1
+
+    def count(self, **labels: Any) -> int:
+        """Number of observations for a label set."""
+        series = self._series.get(self._key(labels))
+        return series.count if series else 0
+
+    def sum(self, **labels: Any) -> float:
+        """Sum of observations for a label set."""
+        series = self._series.get(self._key(labels))
+        return series.sum if series else 0.0
+
+    def _samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            items = sorted(
+                (key, list(series.counts), series.sum, series.count)
+                for key, series in self._series.items()
+            )
+        for key, counts, total, count in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Named collection of metrics rendered together.
+
+    Metrics are created on first request and shared afterwards, so
+    adapters instantiated several times report into the same series.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(
+        self, cls: Type[M], name: str, help: str, labelnames: Sequence[str], **options: Any
+    ) -> M:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                created = cls(name, help, labelnames, **options)
+                self._metrics[name] = created
+                return created
+            if type(metric) is not cls:
+                raise ValueError(f"Metric {name} is already registered with a different type")
+            if metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered with different labels")
+            return cast(M, metric)
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """
+        Get or create a counter.
+
+        Args:
+            name: Metric name
+            help: Description shown in the exposition
+            labelnames: Names of the metric's labels
+
+        Returns:
+            The counter
+
+        Raises:
+            ValueError: If the name is registered with another type or labels
+        """
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge (see ``counter``)."""
+        return self._get_or_create(Gauge, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """
+        Get or create a histogram (see ``counter``).
+
+        Args:
+            name: Metric name
+            help: Description shown in the exposition
+            labelnames: Names of the metric's labels
+            buckets: Upper bounds of the buckets (+Inf is added)
+
+        Returns:
+            The histogram
+        """
+        return self._get_or_create(Histogram, name, help, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Return a registered metric by name, or None."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return "".join(metric.render() + "\n" for metric in metrics)
+
+
+# Registry used when none is passed explicitly
+default_registry = MetricsRegistry()
+
+
+def add_metrics_route(
+    app: Any, registry: Optional[MetricsRegistry] = None, path: str = "/metrics"
+) -> None:
+    """
+    Serve a registry on a FastAPI app for Prometheus to scrape.
+
+    Args:
+        app: FastAPI application
+        registry: Registry to serve (defaults to ``default_registry``)
+        path: Route path
+
+    Raises:
+        ImportError: If FastAPI is not installed
+    """
+    try:
+        from fastapi.responses import Response
+    except ImportError:
+        raise ImportError(
+            "The metrics route requires FastAPI. "
+            "Install it with: pip install 'framework_hexagonal[example]'"
+        )
+    registry = registry or default_registry
+
+    @app.get(path, include_in_schema=False)
+    async def metrics() -> Response:
+        return Response(content=registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,452 @@
+"""Client-side rate limiting: token buckets, AIMD concurrency and a priority queue."""
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import asdict, dataclass, field
+from types import TracebackType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+R = TypeVar('R')
+
+# Queue priorities: lower values are served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+# Rough characters per token for English text and code
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(
+    content: Union[str, Iterable[Mapping[str, Any]]],
+    max_tokens: Optional[int] = None,
+    default_completion_tokens: int = 512,
+) -> int:
+    """
+    Estimate the tokens a request will consume against a tokens-per-minute budget.
+
+    Providers count the prompt plus ``max_tokens`` (or their default
+    completion length) against the budget when the request is admitted.
+
+    Args:
+        content: Prompt text, or chat messages with 'content' fields
+        max_tokens: Completion limit of the request
+        default_completion_tokens: Completion estimate when ``max_tokens`` is unset
+
+    Returns:
+        Estimated total tokens
+    """
+    if isinstance(content, str):
+        chars = len(content)
+    else:
+        chars = 0
+        for message in content:
+            value = message.get("content")
+            if isinstance(value, str):
+                chars += len(value)
+            elif isinstance(value, list):
+                chars += sum(
+                    len(part.get("text", "")) for part in value if isinstance(part, Mapping)
+                )
+    completion = max_tokens if max_tokens is not None else default_completion_tokens
+    return chars // CHARS_PER_TOKEN + completion
+
+
+def rate_limit_retry_after(error: BaseException) -> Optional[float]:
+    """
+    Detect a provider 429 and its requested back-off.
+
+    Works with OpenAI SDK errors and ``httpx.HTTPStatusError`` alike.
+
+    Args:
+        error: Exception raised by a request
+
+    Returns:
+        Seconds to wait (0.0 if the provider gave no hint), or None if the
+        error is not a rate-limit response
+    """
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    if status != 429:
+        return None
+    headers = getattr(response, "headers", None) or {}
+    for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            return float(headers[header]) * scale
+        except (KeyError, TypeError, ValueError):
+            continue
+    return 0.0
+
+
+class TokenBucket:
+    """Continuously refilling budget of ``rate`` units per minute."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate_per_minute: Units refilled per minute
+            capacity: Maximum balance (defaults to one minute's worth)
+        """
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until ``amount`` units are available (above capacity: a full bucket)."""
+        self._refill()
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.rate)
+
+    def consume(self, amount: float) -> None:
+        """Take units; the balance may go negative when correcting estimates."""
+        self._refill()
+        self.tokens -= amount
+
+    def refund(self, amount: float) -> None:
+        """Return units, e.g. when a request used fewer tokens than estimated."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD concurrency limit.
+
+    Each success raises the limit by ``increase / limit`` (about
+    ``increase`` per round of requests); a rate-limit response, or a
+    latency above ``latency_target``, multiplies it by ``backoff``. At
+    most one decrease is applied per ``cooldown`` seconds, so a burst of
+    429s from one overload counts once.
+    """
+
+    def __init__(
+        self,
+        initial: float = 8,
+        minimum: float = 1,
+        maximum: float = 64,
+        increase: float = 1.0,
+        backoff: float = 0.5,
+        latency_target: Optional[float] = None,
+        cooldown: float = 1.0,
+    ):
+        """
+        Initialize the limit.
+
+        Args:
+            initial: Starting concurrency
+            minimum: Lowest concurrency
+            maximum: Highest concurrency
+            increase: Additive increase per round of successful requests
+            backoff: Multiplicative decrease on overload
+            latency_target: Seconds above which a request counts as overload (None to
+                ignore latency)
+            cooldown: Minimum seconds between decreases
+        """
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+        self._last_decrease = float("-inf")
+
+    @property
+    def current(self) -> int:
+        """Requests allowed in flight."""
+        return max(int(self.minimum), int(self.limit))
+
+    def on_success(self, latency: float) -> None:
+        """Record a completed request."""
+        if self.latency_target is not None and latency > self.latency_target:
+            self.on_overload()
+        else:
+            self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+
+    def on_overload(self) -> None:
+        """Record a rate-limit response or an overly slow request."""
+        now = time.monotonic()
+        if now - self._last_decrease >= self.cooldown:
+            self.limit = max(self.minimum, self.limit * self.backoff)
+            self._last_decrease = now
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters for tuning client-side limits."""
+
+    granted: int = 0
+    rate_limited: int = 0
+    queued: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    in_flight: int = 0
+    concurrency_limit: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a dict."""
+        return asdict(self)
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    sequence: int
+    tokens: int = field(compare=False)
+    future: "asyncio.Future[None]" = field(compare=False)
+    enqueued: float = field(compare=False)
+
+
+class RateLimitPermit:
+    """
+    Admission of one request; use as an async context manager around the call.
+
+    On exit the outcome feeds the limiter: success and latency raise the
+    concurrency limit, a 429 lowers it and pauses admissions for the
+    provider's Retry-After.
+    """
+
+    def __init__(self, limiter: "RateLimiter", tokens: int):
+        self.limiter = limiter
+        self.tokens = tokens
+        self.started = time.monotonic()
+        self.latency: Optional[float] = None
+        self._released = False
+
+    def first_response(self) -> None:
+        """Mark the first response byte/chunk; streaming calls report this as their latency."""
+        if self.latency is None:
+            self.latency = time.monotonic() - self.started
+
+    def record_usage(self, tokens: int) -> None:
+        """Correct the tokens-per-minute budget with the provider's reported usage."""
+        self.limiter._adjust_tokens(tokens - self.tokens)
+        self.tokens = tokens
+
+    async def __aenter__(self) -> "RateLimitPermit":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.release(exc)
+
+    def release(self, error: Optional[BaseException] = None) -> None:
+        """Free the concurrency slot and report the outcome."""
+        if self._released:
+            return
+        self._released = True
+        retry_after = rate_limit_retry_after(error) if error is not None else None
+        if retry_after is not None:
+            # A rejected request consumed nothing from the provider's token budget
+            self.limiter._adjust_tokens(-self.tokens)
+            self.limiter._on_rate_limited(retry_after)
+        elif error is None:
+            latency = self.latency if self.latency is not None else time.monotonic() - self.started
+            self.limiter.concurrency.on_success(latency)
+        self.limiter._release()
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute budgets with adaptive concurrency.
+
+    Callers wait in a priority queue (lower values first, FIFO within a
+    priority) until both budgets and a concurrency slot allow their
+    request. Token costs are estimates, corrected with reported usage
+    through the permit. A 429 halves concurrency and holds the queue for
+    the provider's Retry-After, instead of letting callers retry into the
+    same overload.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        concurrency: Union[int, AdaptiveConcurrency, None] = None,
+        default_retry_after: float = 1.0,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Request budget (None for unlimited)
+            tokens_per_minute: Token budget (None for unlimited)
+            concurrency: Fixed limit, an AdaptiveConcurrency, or None for the AIMD default
+            default_retry_after: Pause after a 429 that carries no Retry-After header
+        """
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        if isinstance(concurrency, int):
+            concurrency = AdaptiveConcurrency(
+                initial=concurrency, minimum=concurrency, maximum=concurrency
+            )
+        self.concurrency = concurrency or AdaptiveConcurrency()
+        self.default_retry_after = default_retry_after
+        self._stats = RateLimiterStats()
+        self._queue: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """Current counters, with live in-flight and concurrency values."""
+        self._stats.in_flight = self._in_flight
+        self._stats.concurrency_limit = self.concurrency.current
+        return self._stats
+
+    async def acquire(
+        self, tokens: int = 0, priority: int = PRIORITY_INTERACTIVE
+    ) -> RateLimitPermit:
+        """
+        Wait for admission.
+
+        Args:
+            tokens: Estimated tokens the request consumes
+            priority: Queue priority (lower values first)
+
+        Returns:
+            Permit to hold for the duration of the request
+        """
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            priority, next(self._sequence), tokens, loop.create_future(), time.monotonic()
+        )
+        heapq.heappush(self._queue, waiter)
+        self._dispatch()
+        if not waiter.future.done():
+            self._stats.queued += 1
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as the caller was cancelled: give the slot back
+                self._release()
+            else:
+                self._dispatch()
+            raise
+        wait = time.monotonic() - waiter.enqueued
+        self._stats.granted += 1
+        self._stats.total_wait_time += wait
+        self._stats.max_wait_time = max(self._stats.max_wait_time, wait)
+        return RateLimitPermit(self, tokens)
+
+    async def admit(
+        self,
+        call: Callable[[], Awaitable[R]],
+        tokens: int = 0,
+        priority: int = PRIORITY_INTERACTIVE,
+        retries: int = 2,
+        retryable: Optional[Callable[[Exception], bool]] = None,
+    ) -> Tuple[RateLimitPermit, R]:
+        """
+        Acquire a permit and start a request, retrying through the queue.
+
+        A 429 is retried after the limiter's pause; errors accepted by
+        ``retryable`` (e.g. connection failures) after an exponential
+        back-off. The caller must release the returned permit, normally by
+        entering it as a context manager, once the response is consumed.
+
+        Args:
+            call: Starts the request
+            tokens: Estimated tokens the request consumes
+            priority: Queue priority (lower values first)
+            retries: Retries after the first attempt
+            retryable: Predicate for other errors worth retrying
+
+        Returns:
+            The held permit and the call's result
+        """
+        for attempt in itertools.count():
+            permit = await self.acquire(tokens, priority)
+            try:
+                return permit, await call()
+            except Exception as e:
+                permit.release(e)
+                rate_limited = rate_limit_retry_after(e) is not None
+                if attempt >= retries or not (rate_limited or (retryable and retryable(e))):
+                    raise
+                if not rate_limited:
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+            except BaseException:
+                permit.release()
+                raise
+        raise AssertionError("unreachable")
+
+    def _delay(self, waiter: _Waiter) -> float:
+        delay = self._paused_until - time.monotonic()
+        if self.requests is not None:
+            delay = max(delay, self.requests.time_until(1))
+        if self.tokens is not None:
+            delay = max(delay, self.tokens.time_until(waiter.tokens))
+        return delay
+
+    def _dispatch(self) -> None:
+        """Admit queued callers in priority order while budgets allow."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._queue:
+            waiter = self._queue[0]
+            if waiter.future.done():
+                heapq.heappop(self._queue)
+                continue
+            if self._in_flight >= self.concurrency.current:
+                return
+            delay = self._delay(waiter)
+            if delay > 0:
+                self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+            heapq.heappop(self._queue)
+            if self.requests is not None:
+                self.requests.consume(1)
+            if self.tokens is not None:
+                self.tokens.consume(waiter.tokens)
+            self._in_flight += 1
+            waiter.future.set_result(None)
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _adjust_tokens(self, difference: int) -> None:
+        if self.tokens is None:
+            return
+        if difference > 0:
+            self.tokens.consume(difference)
+        else:
+            self.tokens.refund(-difference)
+
+    def _on_rate_limited(self, retry_after: float) -> None:
+        self._stats.rate_limited += 1
+        self.concurrency.on_overload()
+        pause = retry_after or self.default_retry_after
+        self._paused_until = max(self._paused_until, time.monotonic() + pause)
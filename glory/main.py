@@ -7,7 +7,6 @@ and configures the dependencies.
 """
 
 import os
-import base64
 from fastapi import FastAPI, Request, Form, Depends
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -17,8 +16,14 @@ from typing import List, Dict, Any
 
 # Import the framework
 import framework_hexagonal as fh
+from framework_hexagonal.core.ports import MODEL_INPUT_VARIANT
 from framework_hexagonal.adapters.outbound.playwright_screenshot import PlaywrightScreenshotterAdapter
+from framework_hexagonal.adapters.outbound.screenshot_cache import CachedScreenshotterAdapter
 from framework_hexagonal.adapters.outbound.openai_text import OpenAITextAdapter
+from framework_hexagonal.adapters.outbound.text_ai_cache import CachedTextAIAdapter, SQLiteTextCache
+from framework_hexagonal.adapters.outbound.pillow_image import PillowImageProcessorAdapter
+from framework_hexagonal.adapters.outbound.local_artifact_store import LocalArtifactStoreAdapter
+from framework_hexagonal.utils.rate_limit import RateLimiter
 
 # Create FastAPI app
 app = FastAPI(
@@ -32,27 +37,64 @@ BASE_DIR = Path(__file__).resolve().parent
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
 
-# Create necessary directories
-os.makedirs(str(BASE_DIR / "static" / "screenshots"), exist_ok=True)
-
 # Register adapters in the container
 @app.on_event("startup")
 async def startup_event():
     """Register adapters on startup."""
-    # Register Playwright screenshotter adapter
+    # Register Playwright screenshotter adapter behind a screenshot cache;
+    # the browser is launched and supervised from startup. Screenshotter and
+    # TextAI coalesce identical concurrent calls, so simultaneous analyses
+    # of the same URL share one capture and one LLM call
     fh.container.register(
         fh.Screenshotter,
-        PlaywrightScreenshotterAdapter(),
+        CachedScreenshotterAdapter(PlaywrightScreenshotterAdapter()),
+        coalesce=True,
     )
+    await fh.container.get(fh.Screenshotter).start()
     
-    # Register OpenAI text adapter
+    # Register OpenAI text adapter behind a response cache, so re-analyzing
+    # an unchanged page replays the earlier analysis
     fh.container.register(
         fh.TextAI,
-        OpenAITextAdapter(
-            api_key=os.environ.get("OPENAI_API_KEY"),
-            default_model="gpt-4o",
+        CachedTextAIAdapter(
+            OpenAITextAdapter(
+                api_key=os.environ.get("OPENAI_API_KEY"),
+                default_model="gpt-4o",
+                rate_limiter=RateLimiter(
+                    requests_per_minute=float(os.environ.get("OPENAI_RPM", 500)),
+                    tokens_per_minute=float(os.environ.get("OPENAI_TPM", 30000)),
+                ),
+            ),
+            backend=SQLiteTextCache(BASE_DIR / "cache" / "text_ai.sqlite3"),
+        ),
+        coalesce=("chat", "analyze"),
+    )
+    
+    # Register Pillow image processor (runs in a process pool)
+    fh.container.register(
+        fh.ImageProcessor,
+        PillowImageProcessorAdapter(),
+    )
+    
+    # Register local artifact store for screenshots served under /static/screenshots;
+    # screenshots are kept for a week and the store is capped at 1 GB
+    fh.container.register(
+        fh.ArtifactStore,
+        LocalArtifactStoreAdapter(
+            BASE_DIR / "static" / "screenshots",
+            base_url="/static/screenshots",
+            max_age=7 * 24 * 3600,
+            max_bytes=1024 * 1024 * 1024,
         ),
     )
+    await fh.container.get(fh.ArtifactStore).start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release adapter resources on shutdown."""
+    await fh.container.get(fh.Screenshotter).close()
+    await fh.container.get(fh.ImageProcessor).aclose()
+    await fh.container.get(fh.ArtifactStore).close()
 
 # Dependencies to get adapters
 def get_screenshotter():
@@ -63,6 +105,14 @@ def get_text_ai():
     """Get TextAI adapter from container."""
     return fh.container.get(fh.TextAI)
 
+def get_image_processor():
+    """Get ImageProcessor adapter from container."""
+    return fh.container.get(fh.ImageProcessor)
+
+def get_artifact_store():
+    """Get ArtifactStore adapter from container."""
+    return fh.container.get(fh.ArtifactStore)
+
 # Routes
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
@@ -90,29 +140,27 @@ async def analyze_website(
     request: Request,
     website_url: str = Form(...),
     screenshotter: fh.Screenshotter = Depends(get_screenshotter),
-    text_ai: fh.TextAI = Depends(get_text_ai)
+    text_ai: fh.TextAI = Depends(get_text_ai),
+    image_processor: fh.ImageProcessor = Depends(get_image_processor),
+    artifact_store: fh.ArtifactStore = Depends(get_artifact_store),
 ):
     """Take a screenshot of the website and perform CRO analysis."""
-    # Generate a unique filename for the screenshot
-    import uuid
-    filename = f"screenshot_{uuid.uuid4()}.png"
-    filepath = str(BASE_DIR / "static" / "screenshots" / filename)
-    screenshot_path = f"/static/screenshots/{filename}"
-    
     try:
-        # Take a full page screenshot
+        # Take a full page screenshot (tall pages are captured in tiles and stitched)
         screenshot_bytes = await screenshotter.capture(
             url=website_url, 
             full_page=True,
             timeout=30.0
         )
         
-        # Save the screenshot
-        with open(filepath, "wb") as f:
-            f.write(screenshot_bytes)
+        # Save the screenshot (named by content hash, written off the event loop)
+        artifact = await artifact_store.put(screenshot_bytes, extension="png")
         
-        # Encode the screenshot as base64
-        base64_image = base64.b64encode(screenshot_bytes).decode('utf-8')
+        # Downscaled JPEG for the vision prompt; the PNG above stays as the archival copy
+        variants = await image_processor.process_variants(
+            screenshot_bytes, {"model_input": MODEL_INPUT_VARIANT}
+        )
+        model_input = variants["model_input"]
         
         # Define CRO analysis prompt
         cro_prompt = """
@@ -140,15 +188,15 @@ async def analyze_website(
                 {
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:image/png;base64,{base64_image}"
+                        "url": model_input.to_data_url()
                     }
                 }
             ]}
         ]
         
-        # Get analysis from OpenAI
+        # Get analysis from OpenAI; identical screenshots reuse the cached analysis
         analysis = ""
-        async for chunk in text_ai.chat(messages=messages):
+        async for chunk in text_ai.chat(messages=messages, cache=True):
             analysis += chunk
         
         # Render the results page with the analysis
@@ -157,87 +205,19 @@ async def analyze_website(
             {
                 "request": request,
                 "website_url": website_url,
-                "screenshot_path": screenshot_path,
+                "screenshot_path": artifact.url,
                 "full_page": True,
                 "analysis": analysis
             }
         )
     except Exception as e:
-        # If full page screenshot fails, try with viewport only
-        try:
-            screenshot_bytes = await screenshotter.capture(
-                url=website_url, 
-                full_page=False,
-                timeout=30.0
-            )
-            
-            # Save the screenshot
-            with open(filepath, "wb") as f:
-                f.write(screenshot_bytes)
-            
-            # Encode the screenshot as base64
-            base64_image = base64.b64encode(screenshot_bytes).decode('utf-8')
-            
-            # Define CRO analysis prompt
-            cro_prompt = """
-            Here is a screenshot of a web page. Please provide a detailed Conversion Rate Optimization (CRO) analysis.
-            Focus especially on:
-
-            Call-to-action (CTA) placement and clarity
-            Headline effectiveness
-            Layout and visual hierarchy
-            Use of whitespace and readability
-            Trust-building elements (social proof, testimonials, etc.)
-            Mobile responsiveness (if possible to evaluate from image)
-            Anything else that could improve user conversion or reduce friction
-
-            Suggest concrete, prioritized improvements that would likely increase conversions, and explain why they work.
-
-            Assume the goal of the page is to get users to sign up / request a demo / buy a product (you can specify depending on your page).
-
-            NOTE: This is only a partial screenshot showing the visible viewport.
-            """
-            
-            # Create messages including the base64-encoded image
-            messages = [
-                {"role": "system", "content": "You are a CRO expert analyzing a website screenshot."},
-                {"role": "user", "content": [
-                    {"type": "text", "text": cro_prompt},
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:image/png;base64,{base64_image}"
-                        }
-                    }
-                ]}
-            ]
-            
-            # Get analysis from OpenAI
-            analysis = ""
-            async for chunk in text_ai.chat(messages=messages):
-                analysis += chunk
-            
-            # Render the results page with the analysis and a note about viewport
-            return templates.TemplateResponse(
-                "tools/cro_results.html",
-                {
-                    "request": request,
-                    "website_url": website_url,
-                    "screenshot_path": screenshot_path,
-                    "full_page": False,
-                    "error_note": "Only viewport captured (page too large for full screenshot)",
-                    "analysis": analysis
-                }
-            )
-        except Exception as e2:
-            # Both attempts failed
-            return templates.TemplateResponse(
-                "tools/cro_optimizer.html",
-                {
-                    "request": request,
-                    "error": f"Screenshot failed: {str(e2)}"
-                }
-            )
+        return templates.TemplateResponse(
+            "tools/cro_optimizer.html",
+            {
+                "request": request,
+                "error": f"Screenshot failed: {str(e)}"
+            }
+        )
 
 # Main entry point
 if __name__ == "__main__":